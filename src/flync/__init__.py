@@ -1,4 +1,15 @@
-from . import model
+from typing import TYPE_CHECKING
+
+from flync.core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from . import model
+
+_LAZY = {
+    "model": ".model",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
 
 __all__ = [
     "model",
@@ -1,2 +1,3 @@
 from .external import External, NamingStrategy, OutputStrategy  # noqa: F401
 from .implied import Implied, ImpliedStrategy  # noqa: F401
+from .symbols import Definition, Reference  # noqa: F401
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Definition(object):
+    """
+    Indicates this field holds the name other fields refer to the model by.
+    """
+
+    kind: str
+
+
+@dataclass(frozen=True)
+class Reference(object):
+    """
+    Indicates this field refers to other models by the name of a Definition.
+
+    The field holds a name, or a list of names, of the given kind.
+    """
+
+    kind: str
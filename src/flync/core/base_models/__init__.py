@@ -1,6 +1,7 @@
 from .base_model import FLYNCBaseModel
 from .dict_instances import DictInstances, NamedDictInstances
 from .list_instances import ListInstances, NamedListInstances
+from .registry_context import RegistryContext, get_registry_context
 from .resettable_model import BaseRegistry
 from .unique_name import UniqueName
 
@@ -12,4 +13,6 @@ __all__ = [
     "ListInstances",
     "NamedListInstances",
     "BaseRegistry",
+    "RegistryContext",
+    "get_registry_context",
 ]
@@ -8,7 +8,7 @@ from pydantic import BaseModel, ConfigDict
 
 class FLYNCBaseModel(BaseModel):
     _logger: Optional[logging.Logger] = pydantic.PrivateAttr(default=None)
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     @property
     def logger(self):
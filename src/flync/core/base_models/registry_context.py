@@ -0,0 +1,74 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+class ContextRegistry:
+    """A class-level registry whose content lives in a RegistryContext.
+
+    Accessing the registry on its class (or an instance) returns the
+    container of the currently active :class:`RegistryContext`.
+    """
+
+    def __init__(self, factory: Callable[[], Any], name: str):
+        self.factory = factory
+        self.name = name
+
+    def __get__(self, instance, owner=None) -> Any:
+        return get_registry_context().get(self)
+
+    def __repr__(self) -> str:
+        return f"ContextRegistry({self.name})"
+
+
+class RegistryContext:
+    """Holds the content of all class-level registries.
+
+    Every workspace owns a context, so several workspaces can be validated
+    in the same process, also concurrently from different threads or
+    asyncio tasks, without seeing each other's names and instances.
+    """
+
+    def __init__(self):
+        self._registries: Dict[ContextRegistry, Any] = {}
+
+    def get(self, registry: ContextRegistry) -> Any:
+        """Return the container of a registry, creating it on first use."""
+        container = self._registries.get(registry)
+        if container is None:
+            container = self._registries.setdefault(
+                registry, registry.factory()
+            )
+        return container
+
+    def items(self) -> Iterator[tuple[ContextRegistry, Any]]:
+        """Iterate over the registries used in this context."""
+        return iter(list(self._registries.items()))
+
+    def clear(self):
+        """Empty all registries of this context."""
+        self._registries.clear()
+
+    @contextmanager
+    def activate(self) -> Iterator["RegistryContext"]:
+        """Make this the active context within a ``with`` block."""
+        token = _ACTIVE_CONTEXT.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE_CONTEXT.reset(token)
+
+
+_DEFAULT_CONTEXT = RegistryContext()
+_ACTIVE_CONTEXT: ContextVar[Optional[RegistryContext]] = ContextVar(
+    "flync_registry_context", default=None
+)
+
+
+def get_registry_context() -> RegistryContext:
+    """Return the active registry context.
+
+    Outside of any :meth:`RegistryContext.activate` block this is a
+    process-wide default context.
+    """
+    return _ACTIVE_CONTEXT.get() or _DEFAULT_CONTEXT
@@ -1,8 +1,24 @@
 from abc import ABC, abstractmethod
 
+from .registry_context import ContextRegistry
+
+# class attributes holding registries; their content is kept per context
+REGISTRY_ATTRIBUTES = ("NAMES", "INSTANCES", "INSTANCES_BY_NAME", "ADDRESSES")
+
 
 class BaseRegistry(ABC):
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in REGISTRY_ATTRIBUTES:
+            value = cls.__dict__.get(name)
+            if isinstance(value, (dict, list, set)):
+                setattr(
+                    cls,
+                    name,
+                    ContextRegistry(type(value), f"{cls.__qualname__}.{name}"),
+                )
+
     @classmethod
     @abstractmethod
     def reset(cls):
@@ -0,0 +1,67 @@
+"""
+Lazy exports of packages (PEP 562).
+
+A package maps every name it exports to the module defining it and
+delegates the attribute lookup to :func:`lazy_exports`. A submodule is only
+imported when one of its names is first accessed, e.g. ``import flync``
+does not import any model and ``from flync.model.flync_4_tsn import Stream``
+does not import the SOME/IP models. The same names are imported in an
+``if TYPE_CHECKING:`` block, so type checkers and IDEs see them.
+
+Example::
+
+    from typing import TYPE_CHECKING
+
+    from flync.core.utils.lazy_imports import lazy_exports
+
+    if TYPE_CHECKING:
+        from . import ecu
+        from .ecu import ECU
+
+    _LAZY = {"ecu": ".ecu", "ECU": ".ecu"}
+
+    __getattr__, __dir__ = lazy_exports(__name__, _LAZY)
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Create the ``__getattr__`` and ``__dir__`` of a lazy package.
+
+    Args:
+        package (str): The name of the package, i.e. ``__name__``.
+
+        exports (Dict[str, str]): The module (relative to the package) \
+        defining each exported name. A name mapped to a module of the \
+        same name, e.g. ``{"ecu": ".ecu"}``, exports the module itself.
+
+    Returns:
+        Tuple[Callable, Callable]: The module level ``__getattr__`` and \
+        ``__dir__`` functions.
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name = exports[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            ) from None
+        module = importlib.import_module(module_name, package)
+        if module_name.rsplit(".", 1)[-1] == name:
+            value = module
+        else:
+            value = getattr(module, name)
+        # cache the value so later lookups do not reach __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
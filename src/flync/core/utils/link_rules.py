@@ -0,0 +1,315 @@
+"""
+Link rules: validators that connect a model to objects validated elsewhere.
+
+Some checks can only run once every object they refer to exists, e.g. a
+connection links the two ports it joins. Such validators are declared with
+:func:`link_rule`, naming the shared state they read and write. By default
+they run like any other ``after`` validator. Inside a
+:func:`defer_link_rules` block they are only queued instead, so the queue
+can be run as a separate phase once all objects are built: the rules are
+ordered by their declared reads and writes, and rules that do not touch the
+same state run in parallel.
+"""
+
+import functools
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from pydantic import model_validator
+from pydantic_core import ErrorDetails, PydanticCustomError
+
+
+@dataclass(frozen=True)
+class LinkRule:
+    """A validator declared with :func:`link_rule`.
+
+    Attributes:
+        name (str): The qualified name of the validator, e.g. \
+        ``ExternalConnection.validate_external_connection``.
+
+        func (Callable): The validator, called with the model.
+
+        reads (FrozenSet[str]): The shared state the rule reads.
+
+        writes (FrozenSet[str]): The shared state the rule writes.
+    """
+
+    name: str
+    func: Callable[[Any], Any]
+    reads: FrozenSet[str]
+    writes: FrozenSet[str]
+
+    def must_precede(self, other: "LinkRule") -> bool:
+        """Whether the rule writes state that another rule reads."""
+        return other is not self and bool(self.writes & other.reads)
+
+    def conflicts_with(self, other: "LinkRule") -> bool:
+        """Whether the rules must not run at the same time."""
+        return other is not self and bool(
+            self.writes & (other.reads | other.writes)
+            or other.writes & self.reads
+        )
+
+
+@dataclass(frozen=True)
+class LinkFailure:
+    """A link rule that failed for a model.
+
+    Attributes:
+        rule (LinkRule): The rule.
+
+        instance (Any): The model it was run for.
+
+        error (PydanticCustomError): The raised error. Exceptions other \
+        than validation errors are reported with the ``fatal`` type.
+    """
+
+    rule: LinkRule
+    instance: Any
+    error: PydanticCustomError
+
+    @property
+    def fatal(self) -> bool:
+        """Whether the rule raised an unexpected exception."""
+        return self.error.type == "fatal"
+
+    def error_details(self, loc: Tuple[int | str, ...] = ()) -> ErrorDetails:
+        """Return the error in the format of pydantic validation errors.
+
+        Args:
+            loc (Tuple[int | str, ...]): The path of the model within the \
+            validated input, as pydantic reports it for an inline rule.
+
+        Returns:
+            ErrorDetails: The error.
+        """
+        return ErrorDetails(
+            type=self.error.type,
+            loc=loc,
+            msg=self.error.message(),
+            input=None,
+            ctx=self.error.context or {},
+        )
+
+
+# all declared rules by name, in declaration order
+LINK_RULES: Dict[str, LinkRule] = {}
+
+
+class LinkQueue:
+    """Link rules queued for the models they were deferred for.
+
+    A rule is queued once per model, even if the model is validated again.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Tuple[str, int], Tuple[LinkRule, Any]] = {}
+
+    def add(self, rule: LinkRule, instance: Any):
+        """Queue a rule for a model."""
+        self._tasks.setdefault((rule.name, id(instance)), (rule, instance))
+
+    def drain(self) -> List[Tuple[LinkRule, Any]]:
+        """Return all queued rules in queueing order and empty the queue."""
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        return tasks
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+
+_PENDING: ContextVar[Optional[LinkQueue]] = ContextVar(
+    "flync_pending_link_rules", default=None
+)
+
+
+@contextmanager
+def defer_link_rules(
+    queue: Optional[LinkQueue],
+) -> Iterator[Optional[LinkQueue]]:
+    """Queue link rules instead of running them within a ``with`` block.
+
+    Args:
+        queue (LinkQueue | None): The queue. ``None`` runs the rules \
+        right away.
+    """
+    token = _PENDING.set(queue)
+    try:
+        yield queue
+    finally:
+        _PENDING.reset(token)
+
+
+def link_rule(reads: Iterable[str] = (), writes: Iterable[str] = ()):
+    """Declare an ``after`` model validator as a link rule.
+
+    Used instead of ``@model_validator(mode="after")``.
+
+    Args:
+        reads (Iterable[str]): Names of the shared state the rule reads, \
+        e.g. ``"ecu_port_links"``.
+
+        writes (Iterable[str]): Names of the shared state the rule writes.
+    """
+
+    def decorator(func: Callable[[Any], Any]):
+        rule = LinkRule(
+            name=func.__qualname__,
+            func=func,
+            reads=frozenset(reads),
+            writes=frozenset(writes),
+        )
+        LINK_RULES[rule.name] = rule
+
+        @functools.wraps(func)
+        def wrapper(self):
+            queue = _PENDING.get()
+            if queue is None:
+                return func(self)
+            queue.add(rule, self)
+            return self
+
+        wrapper.link_rule = rule
+        return model_validator(mode="after")(wrapper)
+
+    return decorator
+
+
+def get_link_rules(model_type: type) -> List[LinkRule]:
+    """Return the link rules declared by a model class and its bases.
+
+    Args:
+        model_type (type): The pydantic model class.
+
+    Returns:
+        List[LinkRule]: The rules, in the order pydantic runs them.
+    """
+    return [
+        decorator.func.link_rule
+        for decorator in (
+            model_type.__pydantic_decorators__.model_validators.values()
+        )
+        if hasattr(decorator.func, "link_rule")
+    ]
+
+
+def schedule_link_rules(rules: Iterable[LinkRule]) -> List[List[LinkRule]]:
+    """Order link rules into levels that can run one after the other.
+
+    A rule writing state that another rule reads is placed in an earlier
+    level. Other conflicting rules keep their declaration order. The rules
+    of a level do not conflict, so they may run in parallel.
+
+    Args:
+        rules (Iterable[LinkRule]): The rules.
+
+    Raises:
+        ValueError: If the rules depend on each other in a cycle.
+
+    Returns:
+        List[List[LinkRule]]: The levels, each in declaration order.
+    """
+    order = list(LINK_RULES.values())
+    rules = sorted(
+        dict.fromkeys(rules),
+        key=lambda r: order.index(r) if r in order else len(order),
+    )
+    before: Dict[LinkRule, List[LinkRule]] = {r: [] for r in rules}
+    for i, rule in enumerate(rules):
+        for other in rules[:i]:
+            if not other.conflicts_with(rule):
+                continue
+            if rule.must_precede(other) and not other.must_precede(rule):
+                before[other].append(rule)
+            else:
+                before[rule].append(other)
+    levels: List[List[LinkRule]] = []
+    placed: Dict[LinkRule, int] = {}
+    while len(placed) < len(rules):
+        level = [
+            r
+            for r in rules
+            if r not in placed and all(p in placed for p in before[r])
+        ]
+        if not level:
+            names = ", ".join(r.name for r in rules if r not in placed)
+            raise ValueError(f"Link rules depend on each other: {names}")
+        for rule in level:
+            placed[rule] = len(levels)
+        levels.append(level)
+    return levels
+
+
+def _run_rule(rule: LinkRule, instances: List[Any]) -> List[LinkFailure]:
+    failures = []
+    for instance in instances:
+        try:
+            rule.func(instance)
+        except PydanticCustomError as e:
+            failures.append(LinkFailure(rule, instance, e))
+        except (ValueError, AssertionError) as e:
+            error = PydanticCustomError("value_error", "{error}", {"error": e})
+            failures.append(LinkFailure(rule, instance, error))
+        except Exception as e:
+            # reported like validate_with_policy reports it for an inline rule
+            error = PydanticCustomError(
+                "fatal",
+                "unhandled exception caught: {ex}",
+                {"ex": e.with_traceback(None)},
+            )
+            failures.append(LinkFailure(rule, instance, error))
+    return failures
+
+
+def run_link_rules(
+    tasks: Iterable[Tuple[LinkRule, Any]],
+    executor: Optional[Executor] = None,
+) -> List[LinkFailure]:
+    """Run queued link rules in dependency order.
+
+    The models of a rule are processed in queueing order. With an
+    executor, the rules of a level run concurrently, each in a copy of the
+    current context so they see the same registries.
+
+    Args:
+        tasks (Iterable[Tuple[LinkRule, Any]]): The rules and the models \
+        to run them for, e.g. from :meth:`LinkQueue.drain`.
+
+        executor (Executor, optional): A thread pool running independent \
+        rules concurrently. Not shut down.
+
+    Returns:
+        List[LinkFailure]: The failed rules, in a deterministic order.
+    """
+    instances: Dict[LinkRule, List[Any]] = {}
+    for rule, instance in tasks:
+        instances.setdefault(rule, []).append(instance)
+    failures: List[LinkFailure] = []
+    for level in schedule_link_rules(instances):
+        if executor is None or len(level) == 1:
+            for rule in level:
+                failures.extend(_run_rule(rule, instances[rule]))
+            continue
+        futures = [
+            executor.submit(
+                copy_context().run, _run_rule, rule, instances[rule]
+            )
+            for rule in level
+        ]
+        for future in futures:
+            failures.extend(future.result())
+    return failures
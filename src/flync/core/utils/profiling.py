@@ -0,0 +1,255 @@
+"""
+Opt-in profiling of model validators and workspace load phases.
+
+While a :class:`ValidationProfiler` is active, a profile hook counts the
+calls and measures the wall time of every ``model_validator`` and
+``field_validator`` of the FLYNC models, and the workspace reports its load
+phases to it. Nothing is installed while no profiler is active, so
+validation runs at full speed.
+
+Example::
+
+    with ValidationProfiler() as profiler:
+        FLYNCWorkspace.load_workspace("vehicle", path)
+    profiler.write_chrome_trace("trace.json")
+"""
+
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import CodeType
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from flync.core.base_models.base_model import FLYNCBaseModel
+
+_ACTIVE: Optional["ValidationProfiler"] = None
+
+
+def get_active_profiler() -> Optional["ValidationProfiler"]:
+    """Return the active profiler, or None if profiling is disabled."""
+    return _ACTIVE
+
+
+@dataclass
+class TimingStats:
+    """Calls and cumulative wall time of a validator or load phase.
+
+    Attributes:
+        calls (int): The number of calls.
+
+        total (float): The cumulative wall time in seconds.
+    """
+
+    calls: int = 0
+    total: float = 0.0
+
+
+def validator_functions(
+    root: type[BaseModel] = FLYNCBaseModel,
+) -> Dict[CodeType, str]:
+    """Collect the validators of a model class and all its subclasses.
+
+    Args:
+        root (type[BaseModel]): The base class.
+
+    Returns:
+        Dict[CodeType, str]: The qualified name of every validator, by \
+        the code object of its function.
+    """
+    codes: Dict[CodeType, str] = {}
+    seen = set()
+    stack = [root]
+    while stack:
+        cls = stack.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        stack.extend(cls.__subclasses__())
+        decorators = cls.__dict__.get("__pydantic_decorators__")
+        if decorators is None:
+            continue
+        for group in (
+            decorators.model_validators,
+            decorators.field_validators,
+        ):
+            for decorator in group.values():
+                func = getattr(decorator.func, "__func__", decorator.func)
+                func = inspect.unwrap(func)
+                code = getattr(func, "__code__", None)
+                if code is not None:
+                    codes.setdefault(code, func.__qualname__)
+    return codes
+
+
+class ValidationProfiler:
+    """Records validator calls and load phases while active.
+
+    Used as a context manager. Only one profiler can be active at a time.
+    The hook is installed for the entering thread and for threads started
+    while the profiler is active (all threads on Python 3.12+).
+
+    Attributes:
+        validators (Dict[str, TimingStats]): Calls and time per validator, \
+        by its qualified name, e.g. ``ECU.post_validation``.
+
+        phases (Dict[str, TimingStats]): Calls and time per load phase, \
+        e.g. ``parse``.
+
+        events (List[Tuple]): The recorded calls and phases as \
+        ``(name, category, start, end, thread id, args)``, if tracing.
+    """
+
+    def __init__(self, trace: bool = True):
+        """Initialize the profiler.
+
+        Args:
+            trace (bool): Keep every call for :meth:`to_chrome_trace`. \
+            Without it only the totals are kept.
+        """
+        self.trace = trace
+        self.validators: Dict[str, TimingStats] = {}
+        self.phases: Dict[str, TimingStats] = {}
+        self.events: List[
+            Tuple[str, str, float, float, int, Dict[str, Any]]
+        ] = []
+        self._codes: Dict[CodeType, str] = {}
+        self._starts: Dict[Any, float] = {}
+        self._lock = threading.Lock()
+        self._origin = 0.0
+
+    def __enter__(self) -> "ValidationProfiler":
+        global _ACTIVE
+        if _ACTIVE is not None:
+            raise RuntimeError("Another validation profiler is active.")
+        self._codes = validator_functions()
+        self._origin = time.perf_counter()
+        _ACTIVE = self
+        set_all = getattr(threading, "setprofile_all_threads", None)
+        if set_all is not None:
+            set_all(self._hook)
+        else:
+            threading.setprofile(self._hook)
+            sys.setprofile(self._hook)
+        return self
+
+    def __exit__(self, *exc_info):
+        global _ACTIVE
+        unset_all = getattr(threading, "setprofile_all_threads", None)
+        if unset_all is not None:
+            unset_all(None)
+        else:
+            threading.setprofile(None)
+            sys.setprofile(None)
+        _ACTIVE = None
+        self._starts.clear()
+
+    def _hook(self, frame, event, arg):
+        if event == "call":
+            if frame.f_code in self._codes:
+                self._starts[frame] = time.perf_counter()
+        elif event == "return":
+            start = self._starts.pop(frame, None)
+            if start is not None:
+                self._record(
+                    self.validators,
+                    self._codes[frame.f_code],
+                    "validator",
+                    start,
+                    time.perf_counter(),
+                    {},
+                )
+
+    def _record(
+        self,
+        stats: Dict[str, TimingStats],
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        args: Dict[str, Any],
+    ):
+        with self._lock:
+            entry = stats.get(name)
+            if entry is None:
+                entry = stats[name] = TimingStats()
+            entry.calls += 1
+            entry.total += end - start
+            if self.trace:
+                self.events.append(
+                    (name, category, start, end, threading.get_ident(), args)
+                )
+
+    def add_phase(self, phase: str, start: float, end: float, **args):
+        """Record a load phase.
+
+        Args:
+            phase (str): The phase, e.g. ``validate``.
+
+            start (float): Its start, a ``time.perf_counter`` value.
+
+            end (float): Its end, a ``time.perf_counter`` value.
+
+            **args: Details shown with the phase in a trace, e.g. the \
+            validated object.
+        """
+        self._record(self.phases, phase, "phase", start, end, args)
+
+    def report(
+        self, limit: Optional[int] = None
+    ) -> List[Tuple[str, int, float]]:
+        """Return the validators that took the most time.
+
+        Args:
+            limit (int, optional): Return at most this many validators.
+
+        Returns:
+            List[Tuple[str, int, float]]: The name, calls and cumulative \
+            seconds of the validators, slowest first.
+        """
+        rows = sorted(
+            (
+                (name, stats.calls, stats.total)
+                for name, stats in self.validators.items()
+            ),
+            key=lambda row: (-row[2], row[0]),
+        )
+        return rows[:limit]
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Build a Chrome trace of the recorded events.
+
+        The trace can be opened in ``chrome://tracing`` or Perfetto.
+
+        Returns:
+            Dict[str, Any]: The trace in the Trace Event Format.
+        """
+        pid = os.getpid()
+        with self._lock:
+            events = list(self.events)
+        return {
+            "traceEvents": [
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": (start - self._origin) * 1e6,
+                    "dur": (end - start) * 1e6,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {k: str(v) for k, v in args.items()},
+                }
+                for name, category, start, end, tid, args in events
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def write_chrome_trace(self, path: Path | str):
+        """Write the Chrome trace of the recorded events to a JSON file."""
+        Path(path).write_text(json.dumps(self.to_chrome_trace()))
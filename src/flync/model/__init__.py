@@ -1,14 +1,33 @@
-from ..core.base_models.base_model import FLYNCBaseModel
-from . import (
-    flync_4_ecu,
-    flync_4_general_configuration,
-    flync_4_metadata,
-    flync_4_security,
-    flync_4_someip,
-    flync_4_topology,
-    flync_4_tsn,
-)
-from .flync_model import FLYNCModel
+from typing import TYPE_CHECKING
+
+from flync.core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from ..core.base_models.base_model import FLYNCBaseModel
+    from . import (
+        flync_4_ecu,
+        flync_4_general_configuration,
+        flync_4_metadata,
+        flync_4_security,
+        flync_4_someip,
+        flync_4_topology,
+        flync_4_tsn,
+    )
+    from .flync_model import FLYNCModel
+
+_LAZY = {
+    "FLYNCBaseModel": "..core.base_models.base_model",
+    "flync_4_ecu": ".flync_4_ecu",
+    "flync_4_general_configuration": ".flync_4_general_configuration",
+    "flync_4_metadata": ".flync_4_metadata",
+    "flync_4_security": ".flync_4_security",
+    "flync_4_someip": ".flync_4_someip",
+    "flync_4_topology": ".flync_4_topology",
+    "flync_4_tsn": ".flync_4_tsn",
+    "FLYNCModel": ".flync_model",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
 
 __all__ = [
     "flync_4_ecu",
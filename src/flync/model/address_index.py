@@ -0,0 +1,267 @@
+"""
+System-wide index of the IP addresses assigned to controller interfaces.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from ipaddress import (
+    IPv4Address,
+    IPv4Network,
+    IPv6Address,
+    IPv6Network,
+    ip_address,
+    ip_network,
+)
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from flync.core.datatypes.ipaddress import IPv4AddressEntry, IPv6AddressEntry
+
+if TYPE_CHECKING:
+    from flync.model.flync_4_ecu import (
+        ECU,
+        Controller,
+        ControllerInterface,
+        VirtualControllerInterface,
+    )
+
+IPAddress = Union[IPv4Address, IPv6Address]
+IPNetwork = Union[IPv4Network, IPv6Network]
+
+
+@dataclass(frozen=True, eq=False)
+class AddressOwner:
+    """An address together with the elements it is assigned to.
+
+    Parameters
+    ----------
+    controller : :class:`~flync.model.flync_4_ecu.Controller`
+        The controller owning the address.
+
+    interface : :class:`~flync.model.flync_4_ecu.ControllerInterface`
+        The physical interface owning the address.
+
+    virtual_interface : \
+    :class:`~flync.model.flync_4_ecu.VirtualControllerInterface`
+        The virtual interface (VLAN) the address is configured on.
+
+    entry : :class:`~flync.core.datatypes.ipaddress.IPv4AddressEntry` or \
+    :class:`~flync.core.datatypes.ipaddress.IPv6AddressEntry`
+        The address entry.
+
+    network : :class:`IPv4Network` or :class:`IPv6Network`
+        The subnet of the address. A host network if the netmask is not a
+        valid prefix.
+    """
+
+    controller: Controller
+    interface: ControllerInterface
+    virtual_interface: VirtualControllerInterface
+    entry: Union[IPv4AddressEntry, IPv6AddressEntry]
+    network: IPNetwork
+
+    @property
+    def ecu(self) -> Optional[ECU]:
+        """The ECU owning the address."""
+        return self.controller.ecu
+
+    @property
+    def address(self) -> IPAddress:
+        """The IP address."""
+        return self.entry.address
+
+    @property
+    def vlanid(self) -> int:
+        """The VLAN the address is configured on."""
+        return self.virtual_interface.vlanid
+
+
+def _get_network(entry: Union[IPv4AddressEntry, IPv6AddressEntry]):
+    if isinstance(entry, IPv6AddressEntry):
+        prefix = f"{entry.ipv6prefix}"
+    else:
+        prefix = f"{entry.ipv4netmask}"
+    try:
+        return ip_network(f"{entry.address}/{prefix}", strict=False)
+    except ValueError:
+        # not a prefix netmask, only the host itself is known
+        return ip_network(entry.address)
+
+
+def iter_address_owners(controller: Controller) -> Iterator[AddressOwner]:
+    """Yield the owners of all addresses of a controller."""
+    for interface in controller.interfaces:
+        for vi in interface.virtual_interfaces:
+            for entry in vi.addresses:
+                yield AddressOwner(
+                    controller=controller,
+                    interface=interface,
+                    virtual_interface=vi,
+                    entry=entry,
+                    network=_get_network(entry),
+                )
+
+
+def _is_shared_subnet(network: IPNetwork) -> bool:
+    """Whether a subnet may be configured on several VLANs."""
+    return network.is_link_local or network.prefixlen == network.max_prefixlen
+
+
+class _PrefixNode:
+    """A node of a binary prefix trie."""
+
+    __slots__ = ("children", "owners")
+
+    def __init__(self):
+        self.children: List[Optional[_PrefixNode]] = [None, None]
+        self.owners: List[AddressOwner] = []
+
+
+def _prefix_bits(network: IPNetwork) -> Iterator[int]:
+    value = int(network.network_address)
+    for shift in range(network.max_prefixlen - 1, -1, -1)[: network.prefixlen]:
+        yield (value >> shift) & 1
+
+
+class AddressIndex:
+    """Index of all interface addresses of a system.
+
+    Addresses are kept in a hash map for exact lookups, and their subnets
+    in one prefix trie per IP version for overlap queries. Building the
+    index is linear in the number of addresses.
+
+    Attributes
+    ----------
+    duplicates : list of tuple of :class:`AddressOwner`
+        Pairs of the first owner and a further owner of the same address.
+    """
+
+    def __init__(self):
+        self._owners: Dict[IPAddress, AddressOwner] = {}
+        self._tries: Dict[int, _PrefixNode] = {
+            4: _PrefixNode(),
+            6: _PrefixNode(),
+        }
+        self.duplicates: List[Tuple[AddressOwner, AddressOwner]] = []
+
+    @classmethod
+    def from_ecus(cls, ecus: Iterable[ECU]) -> AddressIndex:
+        """Index the addresses of all controller interfaces of some ECUs."""
+        index = cls()
+        for ecu in ecus:
+            for controller in ecu.controllers:
+                for owner in iter_address_owners(controller):
+                    index.add(owner)
+        return index
+
+    def add(self, owner: AddressOwner) -> Optional[AddressOwner]:
+        """Add an address to the index.
+
+        Parameters
+        ----------
+        owner : :class:`AddressOwner`
+            The address and its owner.
+
+        Returns
+        -------
+        AddressOwner or None
+            The previous owner if the address was already indexed.
+        """
+        previous = self._owners.setdefault(owner.address, owner)
+        if previous is not owner:
+            self.duplicates.append((previous, owner))
+        node = self._tries[owner.network.version]
+        for bit in _prefix_bits(owner.network):
+            if node.children[bit] is None:
+                node.children[bit] = _PrefixNode()
+            node = node.children[bit]
+        node.owners.append(owner)
+        return previous if previous is not owner else None
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def owner_of(self, address: IPAddress | str) -> Optional[AddressOwner]:
+        """Return the owner of an address, e.g. ``"10.0.3.7"``."""
+        return self._owners.get(ip_address(address))
+
+    def overlapping(self, network: IPNetwork | str) -> List[AddressOwner]:
+        """Return the owners of all subnets overlapping a network.
+
+        Parameters
+        ----------
+        network : :class:`IPv4Network`, :class:`IPv6Network` or str
+            The network, e.g. ``"10.0.0.0/16"``.
+
+        Returns
+        -------
+        list of :class:`AddressOwner`
+            The owners whose subnet contains or is contained in the network.
+        """
+        network = ip_network(network, strict=False)
+        node: Optional[_PrefixNode] = self._tries[network.version]
+        output: List[AddressOwner] = []
+        for bit in _prefix_bits(network):
+            output.extend(node.owners)
+            node = node.children[bit]
+            if node is None:
+                return output
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            output.extend(current.owners)
+            stack.extend(c for c in current.children if c is not None)
+        return output
+
+    def subnet_conflicts(self) -> List[Tuple[AddressOwner, AddressOwner]]:
+        """Return overlapping subnets that are configured on different VLANs.
+
+        Such overlaps are often a mistake, but not invalid. Link-local
+        subnets (e.g. ``fe80::/64`` on every VLAN) and host prefixes are
+        not reported. Each pair of conflicting subnet and VLAN combinations
+        is reported once, with the first owners found.
+
+        Returns
+        -------
+        list of tuple of :class:`AddressOwner`
+            Pairs of owners whose subnets overlap while their VLANs differ.
+        """
+        conflicts: List[Tuple[AddressOwner, AddressOwner]] = []
+        seen = set()
+        for root in self._tries.values():
+            # the owners of the enclosing subnets travel down with the node
+            stack: List[Tuple[_PrefixNode, List[AddressOwner]]] = [(root, [])]
+            while stack:
+                node, enclosing = stack.pop()
+                firsts: Dict[int, AddressOwner] = {}
+                for owner in node.owners:
+                    if not _is_shared_subnet(owner.network):
+                        firsts.setdefault(owner.vlanid, owner)
+                candidates = enclosing + list(firsts.values())
+                for owner in firsts.values():
+                    for other in candidates:
+                        if other is owner or other.vlanid == owner.vlanid:
+                            continue
+                        key = frozenset(
+                            {
+                                (other.network, other.vlanid),
+                                (owner.network, owner.vlanid),
+                            }
+                        )
+                        if key not in seen:
+                            seen.add(key)
+                            conflicts.append((other, owner))
+                below = enclosing + list(firsts.values())
+                stack.extend(
+                    (child, below) for child in node.children if child
+                )
+        return conflicts
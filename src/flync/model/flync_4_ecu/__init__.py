@@ -1,30 +1,68 @@
-from .controller import (
-    Controller,
-    ControllerInterface,
-    VirtualControllerInterface,
-)
-from .ecu import ECU
-from .internal_topology import InternalTopology
-from .phy import BASET, BASET1, BASET1S, MII, RGMII, RMII, SGMII, XFI
-from .port import ECUPort
-from .socket_container import SocketContainer
-from .sockets import (
-    IPv4AddressEndpoint,
-    IPv6AddressEndpoint,
-    Socket,
-    SocketTCP,
-    SocketUDP,
-    TCPOption,
-    UDPOption,
-)
-from .switch import (
-    MulticastGroup,
-    Switch,
-    SwitchPort,
-    TCAMRule,
-    TrafficClass,
-    VLANEntry,
-)
+from typing import TYPE_CHECKING
+
+from flync.core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .controller import (
+        Controller,
+        ControllerInterface,
+        VirtualControllerInterface,
+    )
+    from .ecu import ECU
+    from .internal_topology import InternalTopology
+    from .phy import BASET, BASET1, BASET1S, MII, RGMII, RMII, SGMII, XFI
+    from .port import ECUPort
+    from .socket_container import SocketContainer
+    from .sockets import (
+        IPv4AddressEndpoint,
+        IPv6AddressEndpoint,
+        Socket,
+        SocketTCP,
+        SocketUDP,
+        TCPOption,
+        UDPOption,
+    )
+    from .switch import (
+        MulticastGroup,
+        Switch,
+        SwitchPort,
+        TCAMRule,
+        TrafficClass,
+        VLANEntry,
+    )
+
+_LAZY = {
+    "Controller": ".controller",
+    "ControllerInterface": ".controller",
+    "VirtualControllerInterface": ".controller",
+    "ECU": ".ecu",
+    "InternalTopology": ".internal_topology",
+    "BASET": ".phy",
+    "BASET1": ".phy",
+    "BASET1S": ".phy",
+    "MII": ".phy",
+    "RGMII": ".phy",
+    "RMII": ".phy",
+    "SGMII": ".phy",
+    "XFI": ".phy",
+    "ECUPort": ".port",
+    "SocketContainer": ".socket_container",
+    "IPv4AddressEndpoint": ".sockets",
+    "IPv6AddressEndpoint": ".sockets",
+    "Socket": ".sockets",
+    "SocketTCP": ".sockets",
+    "SocketUDP": ".sockets",
+    "TCPOption": ".sockets",
+    "UDPOption": ".sockets",
+    "MulticastGroup": ".switch",
+    "Switch": ".switch",
+    "SwitchPort": ".switch",
+    "TCAMRule": ".switch",
+    "TrafficClass": ".switch",
+    "VLANEntry": ".switch",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
 
 __all__ = [
     "Controller",
@@ -1,4 +1,12 @@
-from typing import Annotated, ClassVar, Dict, List, Literal, Optional
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    ClassVar,
+    Dict,
+    List,
+    Literal,
+    Optional,
+)
 
 from pydantic import (
     AfterValidator,
@@ -12,12 +20,18 @@ from pydantic.networks import IPvAnyAddress
 from pydantic_extra_types.mac_address import MacAddress
 
 import flync.core.utils.common_validators as common_validators
+from flync.core.annotations import Definition
 from flync.core.base_models import (
     FLYNCBaseModel,
     NamedDictInstances,
     NamedListInstances,
 )
 from flync.core.utils.exceptions import err_fatal, err_minor
+from flync.model.address_index import (
+    AddressOwner,
+    IPAddress,
+    iter_address_owners,
+)
 from flync.model.flync_4_ecu.phy import MII, RGMII, RMII, SGMII, XFI
 from flync.model.flync_4_ecu.sockets import (
     IPv4AddressEndpoint,
@@ -32,6 +46,9 @@ from flync.model.flync_4_tsn import (
     TrafficClass,
 )
 
+if TYPE_CHECKING:
+    from flync.model.flync_4_ecu.ecu import ECU
+
 
 class VirtualControllerInterface(FLYNCBaseModel):
     """
@@ -55,7 +72,7 @@ class VirtualControllerInterface(FLYNCBaseModel):
         Allowed multicast addresses.
     """
 
-    name: str = Field()
+    name: Annotated[str, Definition("virtual_interface")] = Field()
     vlanid: int = Field(..., ge=0, le=4095)
     addresses: List[IPv6AddressEndpoint | IPv4AddressEndpoint] = Field()
     multicast: Annotated[
@@ -119,12 +136,14 @@ class ControllerInterface(NamedDictInstances):
         The switch port, controller interface or ecu port connected
         to the controller interface. This attribute
         is managed internally and is not part of the public API.
+    _controller:
+        The controller of which the interface is a part of.
     _type:
         The type of the object generated. Set to controller_interface.
     """
 
     INSTANCES: ClassVar[Dict[str, "ControllerInterface"]] = {}
-    name: str = Field()
+    name: Annotated[str, Definition("controller_interface")] = Field()
     mac_address: MacAddress = Field()
     mii_config: Optional[MII | RMII | SGMII | RGMII | XFI] = Field(
         default=None, discriminator="type"
@@ -146,6 +165,7 @@ class ControllerInterface(NamedDictInstances):
         BeforeValidator(common_validators.none_to_empty_list),
     ] = Field(default_factory=list)
     _connected_component = PrivateAttr(default=None)
+    _controller: Optional["Controller"] = PrivateAttr(default=None)
     _type: Literal["controller_interface"] = PrivateAttr(
         default="controller_interface"
     )
@@ -154,6 +174,10 @@ class ControllerInterface(NamedDictInstances):
     def type(self):
         return self._type
 
+    @property
+    def controller(self) -> Optional["Controller"]:
+        return self._controller
+
     @property
     def connected_component(self):
         return self._connected_component
@@ -223,11 +247,8 @@ class ControllerInterface(NamedDictInstances):
         Helper function
         Returns the controller that the interface is a part of
         """
-
-        for ctrl in Controller.INSTANCES:
-            for interface in ctrl.interfaces:
-                if interface.name == self.name:
-                    return ctrl
+        if self._controller is not None:
+            return self._controller
         raise err_fatal(
             "Fatal Error: " "The interface is not a part of any controller"
         )
@@ -238,10 +259,8 @@ class ControllerInterface(NamedDictInstances):
         of the controller that the interface is a part of
 
         """
-        for controller in Controller.INSTANCES:
-            for interface in controller.interfaces:
-                if interface.name == self.name:
-                    return controller.interfaces
+        if self._controller is not None:
+            return self._controller.interfaces
 
     def get_connected_components(self):
         """
@@ -272,16 +291,58 @@ class Controller(NamedListInstances["Controller"]):
 
     Private Attributes
     ------------------
+    _ecu:
+        The ECU of which the controller is a part of.
     _type:
         The type of the object generated. Set to Controller.
+
+    Class Attributes
+    ----------------
+    ADDRESSES:
+        The owner of every IP address of the validated controllers, see
+        :class:`~flync.model.address_index.AddressOwner`. If an address
+        is assigned twice, the controller validated last owns it.
     """
 
     INSTANCES: ClassVar[List["Controller"]] = []
+    ADDRESSES: ClassVar[Dict[IPAddress, AddressOwner]] = {}
     meta: EmbeddedMetadata = Field()
     name: str = Field()
     interfaces: List[ControllerInterface] = Field()
+    _ecu: Optional["ECU"] = PrivateAttr(default=None)
     _type: Literal["controller"] = PrivateAttr(default="controller")
 
+    @property
+    def ecu(self) -> Optional["ECU"]:
+        return self._ecu
+
+    @model_validator(mode="after")
+    def post_validation(self):
+        """
+        allows the interfaces to access ._controller
+        """
+        [setattr(i, "_controller", self) for i in self.interfaces]  # noqa
+        self.register_addresses()
+        return self
+
+    def register_addresses(self):
+        """Helper function. Adds the IPs of the controller to ADDRESSES."""
+        for owner in iter_address_owners(self):
+            Controller.ADDRESSES[owner.address] = owner
+
+    def unregister_addresses(self):
+        """Helper function. Removes the IPs of the controller from
+        ADDRESSES."""
+        addresses = Controller.ADDRESSES
+        for address, owner in list(addresses.items()):
+            if owner.controller is self:
+                del addresses[address]
+
+    @classmethod
+    def reset(cls):
+        Controller.ADDRESSES.clear()
+        return super().reset()
+
     def get_all_ips(self):
         """Helper function.
         Return all the IPs in the Controller
@@ -10,7 +10,8 @@ from flync.core.annotations import (
     OutputStrategy,
 )
 from flync.core.base_models import UniqueName
-from flync.model.flync_4_ecu.controller import Controller, ControllerInterface
+from flync.core.utils.exceptions import err_minor
+from flync.model.flync_4_ecu.controller import Controller
 from flync.model.flync_4_ecu.internal_topology import InternalTopology
 from flync.model.flync_4_ecu.port import ECUPort
 from flync.model.flync_4_ecu.socket_container import SocketContainer
@@ -18,11 +19,6 @@ from flync.model.flync_4_ecu.switch import Switch, SwitchPort
 from flync.model.flync_4_metadata import ECUMetadata
 
 
-def RESET_unique_name_cache():
-    ControllerInterface.NAMES = set()
-    SwitchPort.NAMES = set()
-
-
 class ECU(UniqueName):
     """
     Represents an Electronic Control Unit (ECU) in the network.
@@ -115,11 +111,29 @@ class ECU(UniqueName):
         """
         allows the children attributes to access ._ecu
         """
-        RESET_unique_name_cache()
         [setattr(p, "_ecu", self) for p in self.ports]  # noqa
+        [setattr(c, "_ecu", self) for c in self.controllers]  # noqa
+        [setattr(s, "_ecu", self) for s in self.switches or []]  # noqa
         [setattr(c, "_ecu", self) for c in self.topology.connections]  # noqa
         return self
 
+    @model_validator(mode="after")
+    def validate_socket_addresses(self):
+        """
+        Validate that the sockets of the ECU use IPs of its own
+        controllers.
+        """
+        controllers = {id(c) for c in self.controllers}
+        for container in self.sockets or []:
+            for socket in container.sockets:
+                owner = Controller.ADDRESSES.get(socket.endpoint_address)
+                if owner is None or id(owner.controller) not in controllers:
+                    raise err_minor(
+                        f"The IP {socket.endpoint_address} for socket "
+                        f"{socket.name} does not exist in ecu {self.name}"
+                    )
+        return self
+
     def get_all_controllers(self):
         """Return a list of all controllers of the ECU."""
         return self.controllers
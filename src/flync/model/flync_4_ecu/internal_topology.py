@@ -1,10 +1,12 @@
-from typing import TYPE_CHECKING, List, Literal, Optional
+from typing import TYPE_CHECKING, Annotated, List, Literal, Optional
 
 from pydantic import Field, PrivateAttr, RootModel, model_validator
 
 import flync.core.utils.common_validators as common_validators
+from flync.core.annotations import Reference
 from flync.core.base_models.base_model import FLYNCBaseModel
 from flync.core.utils.exceptions import err_major
+from flync.core.utils.link_rules import link_rule
 from flync.model.flync_4_ecu.controller import ControllerInterface
 from flync.model.flync_4_ecu.port import ECUPort
 from flync.model.flync_4_ecu.switch import SwitchPort
@@ -13,6 +15,20 @@ if TYPE_CHECKING:
     from flync.model.flync_4_ecu.ecu import ECU
 
 
+def unlink_components(component, other):
+    """
+    Helper function. Removes ``other`` from the connected
+    components of ``component``.
+    """
+    if component is None:
+        return
+    links = getattr(component, "_connected_components", None)
+    if links is not None:
+        links[:] = [c for c in links if c is not other]
+    elif getattr(component, "_connected_component", None) is other:
+        component._connected_component = None
+
+
 class InternalConnection(FLYNCBaseModel):
     """
     Represents a base internal connection between two
@@ -47,6 +63,13 @@ class InternalConnection(FLYNCBaseModel):
     def ecu(self) -> Optional["ECU"]:
         return self._ecu
 
+    def disconnect(self):
+        """
+        Helper function. Removes the links this connection added
+        between its components. Used when the connection is
+        replaced by a re-validated one.
+        """
+
 
 class ECUPortToXConnection(InternalConnection):
     """
@@ -65,7 +88,9 @@ class ECUPortToXConnection(InternalConnection):
         Managed privately.
     """
 
-    ecu_port_name: str = Field(alias="ecu_port")
+    ecu_port_name: Annotated[str, Reference("ecu_port")] = Field(
+        alias="ecu_port"
+    )
     _ecu_port: Optional["ECUPort"] = PrivateAttr(default=None)
 
     @property
@@ -104,7 +129,9 @@ class SwitchPortToXConnection(InternalConnection):
         Managed privately.
     """
 
-    switch_port_name: str = Field(alias="switch_port")
+    switch_port_name: Annotated[str, Reference("switch_port")] = Field(
+        alias="switch_port"
+    )
     _switch_port: "SwitchPort" = PrivateAttr()
 
     @property
@@ -148,7 +175,9 @@ class ECUPortToSwitchPort(ECUPortToXConnection):
 
     type: Literal["ecu_port_to_switch_port"] = Field("ecu_port_to_switch_port")
 
-    switch_port_name: str = Field(alias="switch_port")
+    switch_port_name: Annotated[str, Reference("switch_port")] = Field(
+        alias="switch_port"
+    )
 
     _switch_port: Optional["SwitchPort"] = PrivateAttr(default=None)
 
@@ -156,7 +185,7 @@ class ECUPortToSwitchPort(ECUPortToXConnection):
     def switch_port(self) -> Optional["SwitchPort"]:
         return self._switch_port
 
-    @model_validator(mode="after")
+    @link_rule(writes=("ecu_port_links", "switch_port_links"))
     def validate_connection_compatibility(self):
         """
         Check if the switch port referenced by the connection exists and
@@ -190,6 +219,10 @@ class ECUPortToSwitchPort(ECUPortToXConnection):
         self.switch_port.copy_mdi_config_to_switch(self.ecu_port.mdi_config)
         return self
 
+    def disconnect(self):
+        unlink_components(self.ecu_port, self.switch_port)
+        unlink_components(self.switch_port, self.ecu_port)
+
 
 class ECUPortToControllerInterface(ECUPortToXConnection):
     """
@@ -216,13 +249,15 @@ class ECUPortToControllerInterface(ECUPortToXConnection):
     )
 
     _iface: Optional["ControllerInterface"] = PrivateAttr(default=None)
-    iface_name: str = Field(alias="controller_interface")
+    iface_name: Annotated[str, Reference("controller_interface")] = Field(
+        alias="controller_interface"
+    )
 
     @property
     def iface(self) -> Optional["ControllerInterface"]:
         return self._iface
 
-    @model_validator(mode="after")
+    @link_rule(writes=("ecu_port_links", "interface_links"))
     def validate_connection_compatibility(self):
         """
         Check if the controller interface referenced by the connection exists
@@ -251,6 +286,10 @@ class ECUPortToControllerInterface(ECUPortToXConnection):
             )
         return self
 
+    def disconnect(self):
+        unlink_components(self.ecu_port, self.iface)
+        unlink_components(self.iface, self.ecu_port)
+
 
 class SwitchPortToControllerInterface(SwitchPortToXConnection):
     """
@@ -277,13 +316,15 @@ class SwitchPortToControllerInterface(SwitchPortToXConnection):
     )
 
     _iface: Optional["ControllerInterface"] = PrivateAttr(default=None)
-    iface_name: str = Field(alias="controller_interface")
+    iface_name: Annotated[str, Reference("controller_interface")] = Field(
+        alias="controller_interface"
+    )
 
     @property
     def iface(self) -> Optional["ControllerInterface"]:
         return self._iface
 
-    @model_validator(mode="after")
+    @link_rule(writes=("switch_port_links", "interface_links"))
     def validate_connection_compatibility(self):
         """
         Check if the controller interface referenced by the
@@ -321,6 +362,10 @@ class SwitchPortToControllerInterface(SwitchPortToXConnection):
 
         return self
 
+    def disconnect(self):
+        unlink_components(self.switch_port, self.iface)
+        unlink_components(self.iface, self.switch_port)
+
 
 class SwitchPortToSwitchPort(SwitchPortToXConnection):
     """
@@ -346,13 +391,15 @@ class SwitchPortToSwitchPort(SwitchPortToXConnection):
     )
 
     _switch2_port: Optional["SwitchPort"] = PrivateAttr(default=None)
-    switch2_port_name: str = Field(alias="switch2_port")
+    switch2_port_name: Annotated[str, Reference("switch_port")] = Field(
+        alias="switch2_port"
+    )
 
     @property
     def switch2_port(self) -> Optional["SwitchPort"]:
         return self._switch2_port
 
-    @model_validator(mode="after")
+    @link_rule(writes=("switch_port_links",))
     def validate_connection_compatibility(self):
         """
         Check if the switch2 port referenced by the connection exists and
@@ -387,6 +434,10 @@ class SwitchPortToSwitchPort(SwitchPortToXConnection):
 
         return self
 
+    def disconnect(self):
+        unlink_components(self.switch_port, self.switch2_port)
+        unlink_components(self.switch2_port, self.switch_port)
+
 
 class ControllerInterfaceToControllerInterface(InternalConnection):
     """
@@ -422,10 +473,14 @@ class ControllerInterfaceToControllerInterface(InternalConnection):
     type: Literal["controller_interface_to_controller_interface"] = Field(
         "controller_interface_to_controller_interface"
     )
-    iface_name: str = Field(alias="controller_interface1")
+    iface_name: Annotated[str, Reference("controller_interface")] = Field(
+        alias="controller_interface1"
+    )
     _iface: Optional["ControllerInterface"] = PrivateAttr(default=None)
 
-    iface2_name: str = Field(alias="controller_interface2")
+    iface2_name: Annotated[str, Reference("controller_interface")] = Field(
+        alias="controller_interface2"
+    )
     _iface2: Optional["ControllerInterface"] = PrivateAttr(default=None)
 
     @property
@@ -481,6 +536,10 @@ class ControllerInterfaceToControllerInterface(InternalConnection):
 
         return self
 
+    def disconnect(self):
+        unlink_components(self.iface, self.iface2)
+        unlink_components(self.iface2, self.iface)
+
 
 class InternalConnectionUnion(RootModel):
     """
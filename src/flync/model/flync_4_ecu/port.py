@@ -1,12 +1,21 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar, Dict, List, Literal, Optional
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    ClassVar,
+    Dict,
+    List,
+    Literal,
+    Optional,
+)
 
 from pydantic import Field, PrivateAttr, model_validator
 
 if TYPE_CHECKING:
     from flync.model.flync_4_ecu.ecu import ECU
 
+from flync.core.annotations import Definition
 from flync.core.base_models import NamedDictInstances
 from flync.core.utils.exceptions import err_major
 from flync.model.flync_4_ecu.phy import (
@@ -59,7 +68,7 @@ class ECUPort(NamedDictInstances):
     """
 
     INSTANCES: ClassVar[Dict[str, "ECUPort"]] = {}
-    name: str = Field()
+    name: Annotated[str, Definition("ecu_port")] = Field()
     mdi_config: BASET1 | BASET1S | BASET = Field(
         default_factory=BASET1,
         discriminator="mode",
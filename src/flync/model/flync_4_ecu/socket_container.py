@@ -1,10 +1,11 @@
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
-import pydantic
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
+from flync.core.annotations import Reference
 from flync.core.base_models import FLYNCBaseModel
 from flync.core.utils.exceptions import err_minor
+from flync.core.utils.link_rules import link_rule
 
 from .controller import Controller
 from .sockets import SocketTCP, SocketUDP
@@ -23,14 +24,21 @@ class SocketContainer(FLYNCBaseModel):
     :class:`~flync.model.flync_4_ecu.sockets.SocketTCP` or \
     :class:`~flync.model.flync_4_ecu.sockets.SocketUDP`
         Assigned TCP and UDP socket endpoints.
+
+    Private Attributes
+    ------------------
+    _ip_endpoints :
+        The IP address endpoints the sockets were added to.
+        Managed internally.
     """
 
-    vlan_name: str
+    vlan_name: Annotated[str, Reference("virtual_interface")]
     sockets: Optional[List[SocketTCP | SocketUDP]] = Field(
         default_factory=list
     )
+    _ip_endpoints: List = PrivateAttr(default_factory=list)
 
-    @pydantic.model_validator(mode="after")
+    @link_rule(reads=("addresses",), writes=("ip_sockets",))
     def add_socket_to_ip(self):
         """
         Associate the given socket definitions with the match
@@ -43,27 +51,36 @@ class SocketContainer(FLYNCBaseModel):
                 from the one supplied.
         """
 
-        controllers = Controller.INSTANCES
+        if self._ip_endpoints:
+            # already added, the validator also runs on existing instances
+            return self
         for socket in self.sockets:
-            exists_ok = False
-            for controller in controllers:
-                for interface in controller.interfaces:
-                    for v_int in interface.virtual_interfaces:
-                        for ip_addr in v_int.addresses:
-                            if ip_addr.address == socket.endpoint_address:
-                                if v_int.name != self.vlan_name:
-                                    raise err_minor(
-                                        f"The endpoint address for the "
-                                        f"socket is not a part of the "
-                                        f"virtual_interace "
-                                        f"{self.vlan_name}"
-                                    )
-                                ip_addr.sockets.append(socket)
-                                exists_ok = True
-                                break
-            if not exists_ok:
+            owner = Controller.ADDRESSES.get(socket.endpoint_address)
+            if owner is None:
                 raise err_minor(
                     f"The IP {socket.endpoint_address} for socket "
                     f"{socket.name} does not exist in ecu"
                 )
+            if owner.virtual_interface.name != self.vlan_name:
+                raise err_minor(
+                    f"The endpoint address for the "
+                    f"socket is not a part of the "
+                    f"virtual_interace "
+                    f"{self.vlan_name}"
+                )
+            owner.entry.sockets.append(socket)
+            self._ip_endpoints.append(owner.entry)
         return self
+
+    def disconnect(self):
+        """
+        Helper function. Removes the sockets of the container from
+        the IP address endpoints they were added to.
+        """
+        for ip_addr in self._ip_endpoints:
+            ip_addr.sockets[:] = [
+                s
+                for s in ip_addr.sockets
+                if not any(s is own for own in self.sockets)
+            ]
+        self._ip_endpoints = []
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 from typing import (
+    TYPE_CHECKING,
     Annotated,
     ClassVar,
     Dict,
+    FrozenSet,
     List,
     Literal,
     Optional,
     Self,
+    Tuple,
     Type,
 )
 
@@ -23,6 +26,7 @@ from pydantic.networks import IPvAnyAddress
 from pydantic_extra_types.mac_address import MacAddress
 
 import flync.core.utils.common_validators as common_validators
+from flync.core.annotations import Definition, Reference
 from flync.core.base_models import NamedDictInstances, NamedListInstances
 from flync.core.base_models.base_model import FLYNCBaseModel
 from flync.core.utils.exceptions import err_minor
@@ -46,6 +50,9 @@ from flync.model.flync_4_tsn import (
     TrafficClass,
 )
 
+if TYPE_CHECKING:
+    from flync.model.flync_4_ecu.ecu import ECU
+
 
 class SwitchPort(NamedDictInstances):
     """
@@ -100,10 +107,13 @@ class SwitchPort(NamedDictInstances):
         to the switch port. This attribute
         is managed internally and is not part of the public API.
 
+    _switch:
+        The switch of which the port is a part of.
+
     """
 
     INSTANCES: ClassVar[Dict[str, "SwitchPort"]] = {}
-    name: str = Field()
+    name: Annotated[str, Definition("switch_port")] = Field()
     silicon_port_no: int = Field(ge=0)
     default_vlan_id: int = Field(..., ge=0, le=4095)
     mii_config: Optional[MII | RMII | SGMII | RGMII | XFI] = Field(
@@ -119,6 +129,7 @@ class SwitchPort(NamedDictInstances):
     macsec_config: Optional[MACsecConfig] = Field(default=None)
     _mdi_config: BASET1 | BASET1S | BASET | None = PrivateAttr(default=None)
     _connected_component = PrivateAttr(default=None)
+    _switch: Optional[Switch] = PrivateAttr(default=None)
     _type: Literal["switch_port"] = PrivateAttr(default="switch_port")
 
     @property
@@ -133,6 +144,10 @@ class SwitchPort(NamedDictInstances):
     def connected_component(self):
         return self._connected_component
 
+    @property
+    def switch(self) -> Optional[Switch]:
+        return self._switch
+
     @model_validator(mode="after")
     def validate_traffic_classes(self):
         if self.mii_config and self.traffic_classes:
@@ -152,24 +167,21 @@ class SwitchPort(NamedDictInstances):
         """
         Helper function. Returns the switch that the port is a part of
         """
-
-        for switch in Switch.INSTANCES:
-            for port in switch.ports:
-                if port.name == self.name:
-                    return switch
+        if self._switch is not None:
+            return self._switch
         raise err_minor("The switch port is not a part of any switch")
 
-    def get_multicast_connected_ports(self, address):
+    def get_multicast_connected_ports(self, address, vlan=None):
         """
         Helper function. Returns the switch ports that are part of
         the multicast address as thaat port
+
+        Looks the group up in the multicast forwarding table of the
+        switch, in the given VLAN or else in the first VLAN where the
+        port is a member of the group.
         """
-        for vlan in self.get_switch().vlans:
-            for addr in vlan.multicast:
-                if addr.address == address:
-                    if self.name in addr.ports:
-                        return addr.ports
-        return []
+        groups = self.get_switch()._multicast_groups
+        return list(groups.get((vlan, address, self.name), ()))
 
 
 class MulticastGroup(FLYNCBaseModel):
@@ -194,7 +206,7 @@ class MulticastGroup(FLYNCBaseModel):
         IPvAnyAddress | MacAddress,
         AfterValidator(common_validators.validate_any_multicast_address),
     ] = Field()
-    ports: List[str] = Field()
+    ports: Annotated[List[str], Reference("switch_port")] = Field()
 
 
 class VLANEntry(FLYNCBaseModel):
@@ -222,7 +234,7 @@ class VLANEntry(FLYNCBaseModel):
     name: str = Field()
     id: int = Field(..., ge=0, le=4095)
     default_priority: int = Field(..., ge=0, le=7)
-    ports: List[str] = Field()
+    ports: Annotated[List[str], Reference("switch_port")] = Field()
     multicast: Annotated[
         Optional[List[MulticastGroup]],
         BeforeValidator(common_validators.none_to_empty_list),
@@ -243,7 +255,7 @@ class Drop(FLYNCBaseModel):
     """
 
     type: Literal["drop"] = Field(default="drop")
-    ports: List[str] = Field()
+    ports: Annotated[List[str], Reference("switch_port")] = Field()
 
 
 class Mirror(FLYNCBaseModel):
@@ -260,7 +272,7 @@ class Mirror(FLYNCBaseModel):
     """
 
     type: Literal["mirror"] = Field(default="mirror")
-    ports: List[str] = Field()
+    ports: Annotated[List[str], Reference("switch_port")] = Field()
 
 
 class ForceEgress(FLYNCBaseModel):
@@ -278,7 +290,7 @@ class ForceEgress(FLYNCBaseModel):
     """
 
     type: Literal["force_egress"] = Field(default="force_egress")
-    ports: List[str] = Field()
+    ports: Annotated[List[str], Reference("switch_port")] = Field()
 
 
 class VLANOverwrite(FLYNCBaseModel):
@@ -304,7 +316,7 @@ class VLANOverwrite(FLYNCBaseModel):
     type: Literal["vlan_overwrite"] = Field(default="vlan_overwrite")
     overwrite_vlan_id: Optional[int] = Field(default=None)
     overwrite_vlan_pcp: Optional[int] = Field(default=None)
-    ports: List[str] = Field()
+    ports: Annotated[List[str], Reference("switch_port")] = Field()
 
 
 class RemoveVLAN(FLYNCBaseModel):
@@ -321,7 +333,7 @@ class RemoveVLAN(FLYNCBaseModel):
     """
 
     type: Literal["remove_vlan"] = Field(default="remove_vlan")
-    ports: List[str] = Field()
+    ports: Annotated[List[str], Reference("switch_port")] = Field()
 
 
 class TCAMRule(FLYNCBaseModel):
@@ -354,7 +366,7 @@ class TCAMRule(FLYNCBaseModel):
     name: str = Field()
     id: StrictInt = Field()
     match_filter: FrameFilter = Field()
-    match_ports: List[str] = Field()
+    match_ports: Annotated[List[str], Reference("switch_port")] = Field()
     action: List[
         (Drop | Mirror | VLANOverwrite | ForceEgress | RemoveVLAN)
     ] = Field()
@@ -440,6 +452,21 @@ class Switch(NamedListInstances):
         packet-matching conditions and associated actions applied to
         ingress or egress traffic.
 
+    Private Attributes
+    ------------------
+    _ecu:
+        The ECU of which the switch is a part of.
+
+    _multicast_table:
+        The names of the member ports of every multicast group, keyed by
+        VLAN ID and multicast address. Built when the switch is validated.
+
+    _multicast_groups:
+        The member ports of the multicast groups in configuration order,
+        keyed by VLAN ID, multicast address and member port name. The
+        groups are also keyed with a VLAN ID of None by the first VLAN in
+        which the port is a member of the group.
+
     """
 
     INSTANCES: ClassVar[List[Type["Switch"]]] = []
@@ -452,6 +479,61 @@ class Switch(NamedListInstances):
     vlans: List[VLANEntry] = Field()
     host_controller: Optional[ControllerInterface] = Field(default=None)
     meta: EmbeddedMetadata = Field()
+    _ecu: Optional[ECU] = PrivateAttr(default=None)
+    _multicast_table: Dict[
+        Tuple[int, IPvAnyAddress | MacAddress], FrozenSet[str]
+    ] = PrivateAttr(default_factory=dict)
+    _multicast_groups: Dict[
+        Tuple[Optional[int], IPvAnyAddress | MacAddress, str], Tuple[str, ...]
+    ] = PrivateAttr(default_factory=dict)
+
+    @property
+    def ecu(self) -> Optional[ECU]:
+        return self._ecu
+
+    @property
+    def multicast_table(
+        self,
+    ) -> Dict[Tuple[int, IPvAnyAddress | MacAddress], FrozenSet[str]]:
+        """The multicast forwarding table of the switch.
+
+        Maps every (VLAN ID, multicast address) pair to the names of the
+        member ports of the group.
+        """
+        return self._multicast_table
+
+    @model_validator(mode="after")
+    def build_multicast_table(self):
+        """
+        Index the member ports of the multicast groups of every VLAN.
+        Groups of the same address in a VLAN are merged.
+        """
+        table: Dict[
+            Tuple[int, IPvAnyAddress | MacAddress], Tuple[str, ...]
+        ] = {}
+        for vlan in self.vlans:
+            for group in vlan.multicast:
+                key = (vlan.id, group.address)
+                table[key] = tuple(
+                    dict.fromkeys([*table.get(key, ()), *group.ports])
+                )
+        self._multicast_table = {
+            key: frozenset(ports) for key, ports in table.items()
+        }
+        self._multicast_groups = {}
+        for (vlan_id, address), ports in table.items():
+            for port in ports:
+                self._multicast_groups[(vlan_id, address, port)] = ports
+                self._multicast_groups.setdefault((None, address, port), ports)
+        return self
+
+    @model_validator(mode="after")
+    def post_validation(self):
+        """
+        allows the ports to access ._switch
+        """
+        [setattr(p, "_switch", self) for p in self.ports]  # noqa
+        return self
 
     @model_validator(mode="after")
     def validate_unique_port_number(self):
@@ -476,25 +558,31 @@ class Switch(NamedListInstances):
         """
         Check if internal priority value of traffic classes
         is defined in ingress streams
+
+        All missing values of all traffic classes are reported in a
+        single error.
         """
+        stream_ipvs = {
+            stream.ipv
+            for port in self.ports
+            for stream in port.ingress_streams or []
+        }
+        missing = {}
         for port in self.ports:
-            if port.traffic_classes:
-                for tr in port.traffic_classes:
-
-                    if tr.internal_priority_values:
-                        for iv in tr.internal_priority_values:
-                            found_stream = False
-                            for port_find in self.ports:
-                                if port_find.ingress_streams:
-                                    for str in port_find.ingress_streams:
-                                        if str.ipv == iv:
-                                            found_stream = True
-                            if not found_stream:
-                                raise err_minor(
-                                    f"Not able to find any streams with "
-                                    f"internal priority values {iv}. "
-                                    f"Traffic class {tr.name}"
-                                )
+            for tr in port.traffic_classes or []:
+                for iv in tr.internal_priority_values or []:
+                    if iv not in stream_ipvs:
+                        missing.setdefault(iv, []).append(tr.name)
+        if missing:
+            raise err_minor(
+                f"Not able to find any streams with internal priority "
+                f"values {', '.join(str(iv) for iv in sorted(missing))}. "
+                + "; ".join(
+                    f"Traffic class {', '.join(dict.fromkeys(names))} "
+                    f"(internal priority value {iv})"
+                    for iv, names in sorted(missing.items())
+                )
+            )
         return self
 
     @model_validator(mode="after")
@@ -508,25 +596,22 @@ class Switch(NamedListInstances):
         Returns:
             _type_: Self
         """
+        has_ats = any(
+            stream.ats
+            for port in self.ports
+            for stream in port.ingress_streams or []
+        )
+        if has_ats:
+            return self
         for port in self.ports:
-            if port.traffic_classes:
-                for tr in port.traffic_classes:
-                    if (
-                        tr.selection_mechanisms
-                        and tr.selection_mechanisms.type == "ats"
-                    ):
-                        found_ats = False
-                        for port_find in self.ports:
-                            if port_find.ingress_streams:
-                                for str in port_find.ingress_streams:
-                                    if str.ats:
-                                        found_ats = True
-                        if not found_ats:
-                            raise err_minor(
-                                f"No ATS Instance found for traffic class "
-                                f"{tr.name}"
-                            )
-
+            for tr in port.traffic_classes or []:
+                if (
+                    tr.selection_mechanisms
+                    and tr.selection_mechanisms.type == "ats"
+                ):
+                    raise err_minor(
+                        f"No ATS Instance found for traffic class {tr.name}"
+                    )
         return self
 
     @model_validator(mode="after")
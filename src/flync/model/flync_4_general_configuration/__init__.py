@@ -1,4 +1,15 @@
-from .flync_general import FLYNCGeneralConfig
+from typing import TYPE_CHECKING
+
+from flync.core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .flync_general import FLYNCGeneralConfig
+
+_LAZY = {
+    "FLYNCGeneralConfig": ".flync_general",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
 
 __all__ = [
     "FLYNCGeneralConfig",
@@ -1,14 +1,33 @@
-from .metadata import (
-    BaseMetadata,
-    BaseVersion,
-    ECUMetadata,
-    EmbeddedMetadata,
-    HardwareBaseMetadata,
-    SocketsPerVLANMetadata,
-    SoftwareBaseMetadata,
-    SOMEIPServiceMetadata,
-    SystemMetadata,
-)
+from typing import TYPE_CHECKING
+
+from flync.core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .metadata import (
+        BaseMetadata,
+        BaseVersion,
+        ECUMetadata,
+        EmbeddedMetadata,
+        HardwareBaseMetadata,
+        SocketsPerVLANMetadata,
+        SoftwareBaseMetadata,
+        SOMEIPServiceMetadata,
+        SystemMetadata,
+    )
+
+_LAZY = {
+    "BaseMetadata": ".metadata",
+    "BaseVersion": ".metadata",
+    "ECUMetadata": ".metadata",
+    "EmbeddedMetadata": ".metadata",
+    "HardwareBaseMetadata": ".metadata",
+    "SocketsPerVLANMetadata": ".metadata",
+    "SoftwareBaseMetadata": ".metadata",
+    "SOMEIPServiceMetadata": ".metadata",
+    "SystemMetadata": ".metadata",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
 
 __all__ = [
     "BaseMetadata",
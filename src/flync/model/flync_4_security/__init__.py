@@ -1,9 +1,24 @@
-from .firewall import Firewall, FirewallRule
-from .macsec import (
-    IntegrityWithConfidentiality,
-    IntegrityWithoutConfidentiality,
-    MACsecConfig,
-)
+from typing import TYPE_CHECKING
+
+from flync.core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .firewall import Firewall, FirewallRule
+    from .macsec import (
+        IntegrityWithConfidentiality,
+        IntegrityWithoutConfidentiality,
+        MACsecConfig,
+    )
+
+_LAZY = {
+    "Firewall": ".firewall",
+    "FirewallRule": ".firewall",
+    "IntegrityWithConfidentiality": ".macsec",
+    "IntegrityWithoutConfidentiality": ".macsec",
+    "MACsecConfig": ".macsec",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
 
 __all__ = [
     "Firewall",
@@ -1,57 +1,107 @@
 """Top-level package for flync-4-someip."""
 
-from flync.model.flync_4_someip.deployment import (
-    BaseUDPDeployment,
-    Layer4Endpoint,
-    MulticastEndpoint,
-    MulticastSDEndpoint,
-    SOMEIPSDDeployment,
-    SOMEIPServiceConsumer,
-    SOMEIPServiceDeployment,
-    SOMEIPServiceProvider,
-    TCPDeployment,
-    UDPDeployment,
-)
-from flync.model.flync_4_someip.service_interface import (
-    SOMEIPTP,
-    Parameters,
-    SDConfig,
-    SDTimings,
-    SOMEIPConfig,
-    SOMEIPEvent,
-    SOMEIPEventgroup,
-    SOMEIPField,
-    SOMEIPFireAndForgetMethod,
-    SOMEIPMethod,
-    SOMEIPRequestResponseMethod,
-    SOMEIPServiceInterface,
-)
-from flync.model.flync_4_someip.someip_datatypes import (
-    AllTypes,
-    ArrayType,
-    Bitfield,
-    Boolean,
-    DynamicLengthString,
-    Enum,
-    FixedLengthString,
-    Float32,
-    Float64,
-    Floats,
-    Ints,
-    SInt8,
-    SInt16,
-    SInt32,
-    SInt64,
-    Struct,
-    UInt8,
-    UInt16,
-    UInt32,
-    UInt64,
-    Union,
-)
+from typing import TYPE_CHECKING
 
-SOMEIPMethod.model_rebuild()
-SOMEIPConfig.model_rebuild()
+from flync.core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from flync.model.flync_4_someip.deployment import (
+        BaseUDPDeployment,
+        Layer4Endpoint,
+        MulticastEndpoint,
+        MulticastSDEndpoint,
+        SOMEIPSDDeployment,
+        SOMEIPServiceConsumer,
+        SOMEIPServiceDeployment,
+        SOMEIPServiceProvider,
+        TCPDeployment,
+        UDPDeployment,
+    )
+    from flync.model.flync_4_someip.service_interface import (
+        SOMEIPTP,
+        Parameters,
+        SDConfig,
+        SDTimings,
+        SOMEIPConfig,
+        SOMEIPEvent,
+        SOMEIPEventgroup,
+        SOMEIPField,
+        SOMEIPFireAndForgetMethod,
+        SOMEIPMethod,
+        SOMEIPRequestResponseMethod,
+        SOMEIPServiceInterface,
+    )
+    from flync.model.flync_4_someip.someip_datatypes import (
+        AllTypes,
+        ArrayType,
+        Bitfield,
+        Boolean,
+        DynamicLengthString,
+        Enum,
+        FixedLengthString,
+        Float32,
+        Float64,
+        Floats,
+        Ints,
+        SInt8,
+        SInt16,
+        SInt32,
+        SInt64,
+        Struct,
+        UInt8,
+        UInt16,
+        UInt32,
+        UInt64,
+        Union,
+    )
+
+_LAZY = {
+    "BaseUDPDeployment": ".deployment",
+    "Layer4Endpoint": ".deployment",
+    "MulticastEndpoint": ".deployment",
+    "MulticastSDEndpoint": ".deployment",
+    "SOMEIPSDDeployment": ".deployment",
+    "SOMEIPServiceConsumer": ".deployment",
+    "SOMEIPServiceDeployment": ".deployment",
+    "SOMEIPServiceProvider": ".deployment",
+    "TCPDeployment": ".deployment",
+    "UDPDeployment": ".deployment",
+    "SOMEIPTP": ".service_interface",
+    "Parameters": ".service_interface",
+    "SDConfig": ".service_interface",
+    "SDTimings": ".service_interface",
+    "SOMEIPConfig": ".service_interface",
+    "SOMEIPEvent": ".service_interface",
+    "SOMEIPEventgroup": ".service_interface",
+    "SOMEIPField": ".service_interface",
+    "SOMEIPFireAndForgetMethod": ".service_interface",
+    "SOMEIPMethod": ".service_interface",
+    "SOMEIPRequestResponseMethod": ".service_interface",
+    "SOMEIPServiceInterface": ".service_interface",
+    "AllTypes": ".someip_datatypes",
+    "ArrayType": ".someip_datatypes",
+    "Bitfield": ".someip_datatypes",
+    "Boolean": ".someip_datatypes",
+    "DynamicLengthString": ".someip_datatypes",
+    "Enum": ".someip_datatypes",
+    "FixedLengthString": ".someip_datatypes",
+    "Float32": ".someip_datatypes",
+    "Float64": ".someip_datatypes",
+    "Floats": ".someip_datatypes",
+    "Ints": ".someip_datatypes",
+    "SInt8": ".someip_datatypes",
+    "SInt16": ".someip_datatypes",
+    "SInt32": ".someip_datatypes",
+    "SInt64": ".someip_datatypes",
+    "Struct": ".someip_datatypes",
+    "UInt8": ".someip_datatypes",
+    "UInt16": ".someip_datatypes",
+    "UInt32": ".someip_datatypes",
+    "UInt64": ".someip_datatypes",
+    "Union": ".someip_datatypes",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
 
 __all__ = [
     "AllTypes",
@@ -8,6 +8,7 @@ from typing import Annotated, List, Literal, Optional
 
 from pydantic import Field, IPvAnyAddress, field_serializer, field_validator
 
+from flync.core.annotations import Reference
 from flync.core.base_models import FLYNCBaseModel
 from flync.core.utils.base_utils import is_ip_multicast
 from flync.model.flync_4_someip.service_interface import (
@@ -156,7 +157,9 @@ class SOMEIPServiceDeployment(abc.ABC, FLYNCBaseModel):
     find_service_multicast: Optional[MulticastEndpoint] = Field(
         description="a multicast endpoint", default=None
     )
-    someip_sd_timings_profile: str = Field(
+    someip_sd_timings_profile: Annotated[
+        str, Reference("sd_timings_profile")
+    ] = Field(
         description="The SOME/IP timings profile ussed for the deployment."
     )
 
@@ -28,8 +28,13 @@ from pydantic import (
 )
 
 import flync.core.utils.common_validators as common_validators
+from flync.core.annotations import Definition
 from flync.core.annotations.external import External, OutputStrategy
-from flync.core.base_models import DictInstances, FLYNCBaseModel
+from flync.core.base_models import (
+    BaseRegistry,
+    DictInstances,
+    FLYNCBaseModel,
+)
 from flync.core.utils.exceptions import err_major, err_minor
 from flync.model.flync_4_metadata import SOMEIPServiceMetadata
 from flync.model.flync_4_someip.someip_datatypes import AllTypes
@@ -124,7 +129,7 @@ class Parameters(FLYNCBaseModel):
         return v
 
 
-class SOMEIPEvent(FLYNCBaseModel):
+class SOMEIPEvent(FLYNCBaseModel, BaseRegistry):
     """
     Defines a SOME/IP event definition.
 
@@ -168,6 +173,10 @@ class SOMEIPEvent(FLYNCBaseModel):
         super().__init__(*args, **kwargs)
         self.INSTANCES_BY_NAME[self.name] = self
 
+    @classmethod
+    def reset(cls):
+        cls.INSTANCES_BY_NAME.clear()
+
 
 def validate_unique_id(
     events: list[SOMEIPEvent | SOMEIPField],
@@ -634,7 +643,7 @@ class SDTimings(DictInstances):
     """
 
     INSTANCES: ClassVar[Dict[Any, "SDTimings"]] = {}
-    profile_id: str = Field(
+    profile_id: Annotated[str, Definition("sd_timings_profile")] = Field(
         description="A unique ID for the SOME/IP-SD timings profile"
     )
 
@@ -1,5 +1,26 @@
-from .multicast_paths import MulticastConfig, MulticastPath
-from .system_topology import ExternalConnection, FLYNCTopology, SystemTopology
+from typing import TYPE_CHECKING
+
+from flync.core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .multicast_paths import MulticastConfig, MulticastPath
+    from .network_graph import NetworkGraph
+    from .system_topology import (
+        ExternalConnection,
+        FLYNCTopology,
+        SystemTopology,
+    )
+
+_LAZY = {
+    "MulticastConfig": ".multicast_paths",
+    "MulticastPath": ".multicast_paths",
+    "NetworkGraph": ".network_graph",
+    "ExternalConnection": ".system_topology",
+    "FLYNCTopology": ".system_topology",
+    "SystemTopology": ".system_topology",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
 
 __all__ = [
     "MulticastPath",
@@ -7,4 +28,5 @@ __all__ = [
     "ExternalConnection",
     "SystemTopology",
     "FLYNCTopology",
+    "NetworkGraph",
 ]
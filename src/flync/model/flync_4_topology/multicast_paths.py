@@ -1,16 +1,23 @@
 import logging
-from typing import List
+from collections import deque
+from typing import Annotated, List, Tuple
 
-from pydantic import Field, PrivateAttr, model_validator
+from pydantic import Field, PrivateAttr
 from pydantic.networks import IPvAnyAddress
 from pydantic_extra_types.mac_address import MacAddress
 
-import flync.core.utils.base_utils as utils
+from flync.core.annotations import Reference
 from flync.core.base_models.base_model import FLYNCBaseModel
 from flync.core.utils.exceptions import err_minor
+from flync.core.utils.link_rules import link_rule
 from flync.model.flync_4_ecu import ControllerInterface, SwitchPort
 
 
+def _component_key(comp) -> Tuple[str, str]:
+    """Key identifying a component of the topology in a multicast path."""
+    return comp.type, comp.name
+
+
 class MulticastPath(FLYNCBaseModel):
     """
     Represents a single multicast path in detail.
@@ -37,18 +44,22 @@ class MulticastPath(FLYNCBaseModel):
 
     Private Attributes
     ------------------
-    _connected_component_list : object
-        Internal reference to the connected component for this
-        multicast path.
+    _connected_component_list : list
+        The components the multicast traffic reaches from the source
+        interface, in breadth first order.
     """
 
     vlan: int = Field(..., ge=0, le=4095)  # Optional for untagged, or 0
     address: IPvAnyAddress | MacAddress = Field()
-    src_interface: str = Field()
-    dst_interface: List[str] = Field()
+    src_interface: Annotated[str, Reference("controller_interface")] = Field()
+    dst_interface: Annotated[List[str], Reference("controller_interface")] = (
+        Field()
+    )
     _connected_component_list = PrivateAttr(default=None)
 
-    @model_validator(mode="after")
+    @link_rule(
+        reads=("ecu_port_links", "switch_port_links", "interface_links")
+    )
     def validate_path(self):
         """
         Validate the multicast path in the mzlticast
@@ -142,45 +153,30 @@ class MulticastPath(FLYNCBaseModel):
         """
         Helper function: Compute a path from src interface to
         destination interface
+
+        Breadth first search from the source interface. Components are
+        appended to ``connected_components`` in the order they are
+        reached; visited components are tracked in a set keyed by
+        their type and name.
         """
+        visited = {_component_key(src_interface)}
+        # the source only forwards to the component it is connected to
+        queue = deque()
         direct_conn = src_interface.get_connected_components()
-
-        new_connected_components = [direct_conn]
-        connected_components.append(src_interface)
-        while len(new_connected_components) != 0:
-
-            new_list = []
-            for comp in new_connected_components:
-                if comp._type == "switch_port":
-                    self.get_switch_port_connected_component(
-                        comp,
-                        connected_components,
-                        new_connected_components,
-                        new_list,
-                        address,
-                    )
-
-                if comp._type == "controller_interface":
-                    self.get_controller_interface_connected_component(
-                        comp,
-                        connected_components,
-                        new_connected_components,
-                        new_list,
-                    )
-
-                if comp._type == "ecu_port":
-                    self.get_ecu_port_connected_component(
-                        comp,
-                        connected_components,
-                        new_connected_components,
-                        new_list,
-                    )
-
-            connected_components.extend(new_connected_components)
-            new_connected_components = new_list
+        if direct_conn is not None:
+            visited.add(_component_key(direct_conn))
+            queue.append(direct_conn)
+        while queue:
+            comp = queue.popleft()
+            connected_components.append(comp)
+            for neighbour in self.get_adjacent_components(comp, address):
+                key = _component_key(neighbour)
+                if key not in visited:
+                    visited.add(key)
+                    queue.append(neighbour)
         for interface in dst_interfaces:
             dst_interface = all_interfaces[interface]
-            if dst_interface not in connected_components:
+            if _component_key(dst_interface) not in visited:
                 raise err_minor(
                     f"Error validating multicast path. "
                     f"No path exists from {src_interface.name} to "
@@ -188,82 +184,37 @@ class MulticastPath(FLYNCBaseModel):
                     f"Configure the multicast in switches and "
                     f"controllers correctly."
                 )
-        connected_components.pop(0)
-
-    def get_switch_port_connected_component(
-        self,
-        comp,
-        connected_components,
-        new_connected_components,
-        new_list,
-        address,
-    ):
-        """Helper function to help validate multicast paths.
 
-        Adds all the components connected to a switch
-        port to the list of components that were
-        not already there in the paths
-        """
-        conn = comp.connected_component
-        if not utils.check_obj_in_list(
-            conn, connected_components
-        ) and not utils.check_obj_in_list(conn, new_connected_components):
-            new_list.append(conn)
-        mcast_ports = comp.get_multicast_connected_ports(address)
-        for sport in mcast_ports:
-            sport_obj = SwitchPort.INSTANCES[sport]
-            if (
-                sport_obj not in connected_components
-                and sport_obj not in new_connected_components
-                and sport_obj.name != comp.name
-            ):
-                new_list.append(sport_obj)
-
-    def get_ecu_port_connected_component(
-        self, comp, connected_components, new_connected_components, new_list
-    ):
+    def get_adjacent_components(self, comp, address):
         """Helper function to help validate multicast paths.
 
-        Adds all the components connected to a ECU
-        Port to the list of components that were
-        not already there in the paths
+        Returns the components the multicast traffic is forwarded to
+        from a component, i.e. the components connected to it, the
+        switch ports of the multicast group for switch ports and the
+        other interfaces of the controller for controller interfaces.
         """
-        conn = comp.connected_components
-        for conn1 in conn:
-            if not utils.check_obj_in_list(
-                conn1, connected_components
-            ) and not utils.check_obj_in_list(conn1, new_connected_components):
-                new_list.append(conn1)
-
-    def get_controller_interface_connected_component(
-        self, comp, connected_components, new_connected_components, new_list
-    ):
-        """Helper function to help validate multicast paths.
-
-        Adds all the components connected to a controller
-        interface to the list of components that were
-        not already there in the paths
-        """
-        conn = comp.connected_component
-        if not utils.check_obj_in_list(
-            conn, connected_components
-        ) and not utils.check_obj_in_list(conn, new_connected_components):
-            new_list.append(conn)
-        connected_interfaces = comp.get_other_interfaces()
-        for iface in connected_interfaces:
-            if (
-                iface not in connected_components
-                and iface.name != comp.name
-                and conn not in new_connected_components
-            ):
-                new_list.append(iface)
+        if comp.type == "ecu_port":
+            return list(comp.connected_components)
+        adjacent = []
+        if comp.connected_component is not None:
+            adjacent.append(comp.connected_component)
+        if comp.type == "switch_port":
+            adjacent.extend(
+                SwitchPort.INSTANCES[sport]
+                for sport in comp.get_multicast_connected_ports(
+                    address, self.vlan
+                )
+            )
+        else:
+            adjacent.extend(comp.get_other_interfaces() or [])
+        return adjacent
 
     def get_components(self):
         """
         Helper function: to return all the
         components in a multicast path
         """
-        return self._connected_component
+        return self._connected_component_list
 
     def get_switch_ports(self):
         """
@@ -271,7 +222,7 @@ class MulticastPath(FLYNCBaseModel):
         switch ports in a multicast path
         """
         switch_ports_list = []
-        for comp in self._connected_component:
+        for comp in self._connected_component_list:
             if comp._type == "switch_port":
                 switch_ports_list.append(comp)
         return switch_ports_list
@@ -282,7 +233,7 @@ class MulticastPath(FLYNCBaseModel):
         controller interfaces in a multicast path
         """
         controller_interfaces = []
-        for comp in self._connected_component:
+        for comp in self._connected_component_list:
             if comp._type == "controller_interface":
                 controller_interfaces.append(comp)
         return controller_interfaces
@@ -293,7 +244,7 @@ class MulticastPath(FLYNCBaseModel):
         ecu ports in a multicast path
         """
         ecu_port_list = []
-        for comp in self._connected_component:
+        for comp in self._connected_component_list:
             if comp._type == "ecu_port":
                 ecu_port_list.append(comp)
         return ecu_port_list
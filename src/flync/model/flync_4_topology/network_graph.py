@@ -0,0 +1,353 @@
+"""
+Compiled connectivity graph of all ECU ports, switch ports and controller
+interfaces of a system.
+"""
+
+from array import array
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from flync.model.flync_4_ecu import ECU
+
+NODE_KINDS = ("ecu_port", "switch_port", "controller_interface")
+
+# the connection types, followed by the links inside a switch and a
+# controller, which connect all of its ports or interfaces to each other
+EDGE_KINDS = (
+    "ecu_port_to_ecu_port",
+    "ecu_port_to_switch_port",
+    "ecu_port_to_controller_interface",
+    "switch_port_to_controller_interface",
+    "switch_to_switch_same_ecu",
+    "controller_interface_to_controller_interface",
+    "switch",
+    "controller",
+)
+
+# the attributes holding the two components of every connection type
+CONNECTION_ENDPOINTS = {
+    "ecu_port_to_ecu_port": ("ecu1_port", "ecu2_port"),
+    "ecu_port_to_switch_port": ("ecu_port", "switch_port"),
+    "ecu_port_to_controller_interface": ("ecu_port", "iface"),
+    "switch_port_to_controller_interface": ("switch_port", "iface"),
+    "switch_to_switch_same_ecu": ("switch_port", "switch2_port"),
+    "controller_interface_to_controller_interface": ("iface", "iface2"),
+}
+
+
+class NetworkGraph:
+    """Undirected graph of the components connected in a system.
+
+    The nodes are numbered from ``0`` and the connections are stored in
+    compressed sparse row form: the connected nodes of node ``n`` are
+    ``targets[offsets[n]:offsets[n + 1]]`` and the kinds of the
+    corresponding edges ``edge_kinds[offsets[n]:offsets[n + 1]]``. Every
+    edge is stored once per direction.
+
+    The ports of a switch and the interfaces of a controller are all
+    linked to each other. Instead of storing these edges, such nodes
+    form a group, whose members are
+    ``members[member_offsets[g]:member_offsets[g + 1]]``. The neighbours
+    of a node are the other members of its group, followed by its
+    connected nodes. Traversals visit the members of a group once and
+    are ``O(V + E)``, where ``E`` counts the connections only.
+
+    Attributes
+    ----------
+    components : list
+        The model of every node.
+
+    kinds : array of int
+        The index of the kind of every node in :data:`NODE_KINDS`.
+
+    offsets : array of int
+        Start of the adjacency of every node, followed by the total
+        number of stored edges.
+
+    targets : array of int
+        The neighbour nodes.
+
+    edge_kinds : array of int
+        The index of the kind of every stored edge in :data:`EDGE_KINDS`.
+
+    groups : array of int
+        The group of every node, or ``-1``.
+
+    group_kinds : array of int
+        The index of the kind of the links inside every group in
+        :data:`EDGE_KINDS`.
+
+    member_offsets : array of int
+        Start of the members of every group, followed by the total
+        number of members.
+
+    members : array of int
+        The nodes of the groups.
+    """
+
+    def __init__(
+        self,
+        components: List[Any],
+        edges: Iterable[Tuple[int, int, int]],
+        groups: Iterable[Tuple[List[int], int]] = (),
+    ):
+        self.components = components
+        self.kinds = array("B", (NODE_KINDS.index(c.type) for c in components))
+        self._ids: Dict[Tuple[str, str], int] = {
+            (c.type, c.name): node for node, c in enumerate(components)
+        }
+        edges = list(edges)
+        degree = [0] * (len(components) + 1)
+        for u, v, _ in edges:
+            degree[u + 1] += 1
+            degree[v + 1] += 1
+        for node in range(len(components)):
+            degree[node + 1] += degree[node]
+        self.offsets = array("l", degree)
+        self.targets = array("l", [0]) * degree[-1]
+        self.edge_kinds = array("B", [0]) * degree[-1]
+        fill = list(degree[:-1])
+        for u, v, kind in edges:
+            for a, b in ((u, v), (v, u)):
+                self.targets[fill[a]] = b
+                self.edge_kinds[fill[a]] = kind
+                fill[a] += 1
+        self.groups = array("l", [-1]) * len(components)
+        self.group_kinds = array("B")
+        self.member_offsets = array("l", [0])
+        self.members = array("l")
+        for group, (nodes, kind) in enumerate(groups):
+            for node in nodes:
+                self.groups[node] = group
+            self.group_kinds.append(kind)
+            self.members.extend(nodes)
+            self.member_offsets.append(len(self.members))
+        self._labels: Optional[array] = None
+
+    @classmethod
+    def from_ecus(
+        cls, ecus: Iterable["ECU"], connections: Iterable[Any] = ()
+    ) -> "NetworkGraph":
+        """Build the graph of some ECUs.
+
+        Parameters
+        ----------
+        ecus : iterable of :class:`~flync.model.flync_4_ecu.ECU`
+            The ECUs, whose ports, switch ports and controller interfaces
+            become the nodes, and whose internal topology connections
+            become edges.
+
+        connections : iterable of \
+        :class:`~flync.model.flync_4_topology.system_topology.ExternalConnection`
+            The connections between the ECUs.
+
+        Returns
+        -------
+        NetworkGraph
+            The graph.
+        """
+        components: List[Any] = []
+        internal_links: List[Tuple[List[Any], str]] = []
+        all_connections: List[Any] = []
+        for ecu in ecus:
+            components.extend(ecu.ports)
+            for switch in ecu.switches or []:
+                components.extend(switch.ports)
+                internal_links.append((switch.ports, "switch"))
+            for controller in ecu.controllers:
+                components.extend(controller.interfaces)
+                internal_links.append((controller.interfaces, "controller"))
+            all_connections.extend(c.root for c in ecu.topology.connections)
+        all_connections.extend(connections)
+
+        ids = {(c.type, c.name): node for node, c in enumerate(components)}
+
+        def node_of(component) -> Optional[int]:
+            if component is None:
+                return None
+            return ids.get((component.type, component.name))
+
+        groups = [
+            ([node_of(m) for m in members], EDGE_KINDS.index(kind))
+            for members, kind in internal_links
+        ]
+        edges: List[Tuple[int, int, int]] = []
+        for connection in all_connections:
+            endpoints = CONNECTION_ENDPOINTS.get(connection.type)
+            if endpoints is None:
+                continue
+            u, v = (node_of(getattr(connection, a)) for a in endpoints)
+            if u is not None and v is not None:
+                edges.append((u, v, EDGE_KINDS.index(connection.type)))
+        return cls(components, edges, groups)
+
+    def __len__(self) -> int:
+        return len(self.components)
+
+    @property
+    def edge_count(self) -> int:
+        """The number of (undirected) edges, including the group links."""
+        offsets = self.member_offsets
+        links = 0
+        for group in range(len(self.group_kinds)):
+            size = offsets[group + 1] - offsets[group]
+            links += size * (size - 1) // 2
+        return len(self.targets) // 2 + links
+
+    def node_id(self, component) -> int:
+        """Return the node of a component.
+
+        Raises
+        ------
+        KeyError
+            If the component is not part of the graph.
+        """
+        return self._ids[(component.type, component.name)]
+
+    def kind(self, node: int) -> str:
+        """Return the kind of a node, one of :data:`NODE_KINDS`."""
+        return NODE_KINDS[self.kinds[node]]
+
+    def neighbours(
+        self, node: int, edge_kinds: Optional[Iterable[str]] = None
+    ) -> Iterator[int]:
+        """Iterate over the neighbours of a node.
+
+        Parameters
+        ----------
+        node : int
+            The node.
+
+        edge_kinds : iterable of str, optional
+            Only follow edges of these kinds. All edges by default.
+        """
+        allowed = self._edge_filter(edge_kinds)
+        for member in self._members(node, allowed):
+            if member != node:
+                yield member
+        for i in range(self.offsets[node], self.offsets[node + 1]):
+            if allowed is None or self.edge_kinds[i] in allowed:
+                yield self.targets[i]
+
+    def reachable(
+        self, source: int, edge_kinds: Optional[Iterable[str]] = None
+    ) -> Set[int]:
+        """Return all nodes reachable from a node, including itself."""
+        return set(self._bfs(source, self._edge_filter(edge_kinds)))
+
+    def is_reachable(
+        self,
+        source: int,
+        target: int,
+        edge_kinds: Optional[Iterable[str]] = None,
+    ) -> bool:
+        """Return whether there is a path between two nodes."""
+        if edge_kinds is None:
+            labels = self._component_labels()
+            return labels[source] == labels[target]
+        return target in self.reachable(source, edge_kinds)
+
+    def shortest_path(
+        self,
+        source: int,
+        target: int,
+        edge_kinds: Optional[Iterable[str]] = None,
+    ) -> Optional[List[int]]:
+        """Return a path with the fewest hops between two nodes.
+
+        Returns
+        -------
+        list of int or None
+            The nodes of the path from ``source`` to ``target``, both
+            included, or None if the nodes are not connected.
+        """
+        allowed = self._edge_filter(edge_kinds)
+        parents = {source: source}
+        for node in self._bfs(source, allowed, parents):
+            if node == target:
+                path = [node]
+                while node != source:
+                    node = parents[node]
+                    path.append(node)
+                return path[::-1]
+        return None
+
+    def connected_components(
+        self, edge_kinds: Optional[Iterable[str]] = None
+    ) -> List[List[int]]:
+        """Return the connected components, ordered by their lowest node."""
+        allowed = self._edge_filter(edge_kinds)
+        seen = bytearray(len(self))
+        output = []
+        for start in range(len(self)):
+            if not seen[start]:
+                nodes = list(self._bfs(start, allowed))
+                for node in nodes:
+                    seen[node] = 1
+                output.append(sorted(nodes))
+        return output
+
+    def _component_labels(self) -> array:
+        if self._labels is None:
+            labels = array("l", [-1]) * len(self)
+            for label, nodes in enumerate(self.connected_components()):
+                for node in nodes:
+                    labels[node] = label
+            self._labels = labels
+        return self._labels
+
+    def _edge_filter(
+        self, edge_kinds: Optional[Iterable[str]]
+    ) -> Optional[Set[int]]:
+        if edge_kinds is None:
+            return None
+        return {EDGE_KINDS.index(kind) for kind in edge_kinds}
+
+    def _members(self, node: int, allowed: Optional[Set[int]]) -> array:
+        group = self.groups[node]
+        if group < 0 or (
+            allowed is not None and self.group_kinds[group] not in allowed
+        ):
+            return self.members[:0]
+        offsets = self.member_offsets
+        start, end = offsets[group], offsets[group + 1]
+        return self.members[start:end]
+
+    def _bfs(
+        self,
+        source: int,
+        allowed: Optional[Set[int]],
+        parents: Optional[Dict[int, int]] = None,
+    ) -> Iterator[int]:
+        offsets, targets, kinds = self.offsets, self.targets, self.edge_kinds
+        visited = {source}
+        expanded: Set[int] = set()
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            yield node
+            # the first member reached of a group reaches all the others
+            neighbours: List[int] = []
+            if self.groups[node] not in expanded:
+                expanded.add(self.groups[node])
+                neighbours.extend(self._members(node, allowed))
+            for i in range(offsets[node], offsets[node + 1]):
+                if allowed is None or kinds[i] in allowed:
+                    neighbours.append(targets[i])
+            for neighbour in neighbours:
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    if parents is not None:
+                        parents[neighbour] = node
+                    queue.append(neighbour)
@@ -1,11 +1,14 @@
 from typing import Annotated, List, Literal, Optional
 
-from pydantic import Field, PrivateAttr, model_validator
+from pydantic import Field, PrivateAttr
 
 import flync.core.utils.common_validators as common_validators
+from flync.core.annotations import Reference
 from flync.core.annotations.external import External, OutputStrategy
 from flync.core.base_models.base_model import FLYNCBaseModel
 from flync.core.utils.exceptions import err_major
+from flync.core.utils.link_rules import link_rule
+from flync.model.flync_4_ecu.internal_topology import unlink_components
 from flync.model.flync_4_ecu.port import ECUPort
 from flync.model.flync_4_topology.multicast_paths import MulticastConfig
 
@@ -46,8 +49,12 @@ class ExternalConnection(FLYNCBaseModel):
         default="ecu_port_to_ecu_port"
     )
     id: str = Field()
-    ecu1_port_name: str = Field(alias="ecu1_port")
-    ecu2_port_name: str = Field(alias="ecu2_port")
+    ecu1_port_name: Annotated[str, Reference("ecu_port")] = Field(
+        alias="ecu1_port"
+    )
+    ecu2_port_name: Annotated[str, Reference("ecu_port")] = Field(
+        alias="ecu2_port"
+    )
 
     _ecu1_port: Optional[ECUPort] = PrivateAttr(default=None)
     _ecu2_port: Optional[ECUPort] = PrivateAttr(default=None)
@@ -60,7 +67,10 @@ class ExternalConnection(FLYNCBaseModel):
     def ecu2_port(self) -> Optional[ECUPort]:
         return self._ecu2_port
 
-    @model_validator(mode="after")
+    @link_rule(
+        reads=("ecu_port_links", "switch_port_links", "interface_links"),
+        writes=("ecu_port_links",),
+    )
     def validate_external_connection(self):
         """
         Verify that the two ECU ports connected by this object are compatible.
@@ -155,6 +165,15 @@ class ExternalConnection(FLYNCBaseModel):
         common_validators.validate_gptp(comp1, comp2, self.id)
         return self
 
+    def disconnect(self):
+        """
+        Helper function. Removes the links this connection added
+        between the two ECU ports. Used when the connection is
+        replaced by a re-validated one.
+        """
+        unlink_components(self.ecu1_port, self.ecu2_port)
+        unlink_components(self.ecu2_port, self.ecu1_port)
+
 
 class SystemTopology(FLYNCBaseModel):
     """
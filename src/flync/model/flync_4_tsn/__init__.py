@@ -1,24 +1,51 @@
-from .qos import (
-    ATSInstance,
-    ATSShaper,
-    CBSShaper,
-    ChildClass,
-    DoubleRateThreeColorMarker,
-    FrameFilter,
-    HTBFilter,
-    HTBInstance,
-    SingleRateThreeColorMarker,
-    SingleRateTwoColorMarker,
-    Stream,
-    TrafficClass,
-)
-from .timesync import (
-    PTPConfig,
-    PTPPdelayConfig,
-    PTPPort,
-    PTPTimeReceiverConfig,
-    PTPTimeTransmitterConfig,
-)
+from typing import TYPE_CHECKING
+
+from flync.core.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .qos import (
+        ATSInstance,
+        ATSShaper,
+        CBSShaper,
+        ChildClass,
+        DoubleRateThreeColorMarker,
+        FrameFilter,
+        HTBFilter,
+        HTBInstance,
+        SingleRateThreeColorMarker,
+        SingleRateTwoColorMarker,
+        Stream,
+        TrafficClass,
+    )
+    from .timesync import (
+        PTPConfig,
+        PTPPdelayConfig,
+        PTPPort,
+        PTPTimeReceiverConfig,
+        PTPTimeTransmitterConfig,
+    )
+
+_LAZY = {
+    "ATSInstance": ".qos",
+    "ATSShaper": ".qos",
+    "CBSShaper": ".qos",
+    "ChildClass": ".qos",
+    "DoubleRateThreeColorMarker": ".qos",
+    "FrameFilter": ".qos",
+    "HTBFilter": ".qos",
+    "HTBInstance": ".qos",
+    "SingleRateThreeColorMarker": ".qos",
+    "SingleRateTwoColorMarker": ".qos",
+    "Stream": ".qos",
+    "TrafficClass": ".qos",
+    "PTPConfig": ".timesync",
+    "PTPPdelayConfig": ".timesync",
+    "PTPPort": ".timesync",
+    "PTPTimeReceiverConfig": ".timesync",
+    "PTPTimeTransmitterConfig": ".timesync",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
 
 __all__ = [
     "ATSInstance",
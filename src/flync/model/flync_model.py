@@ -1,10 +1,16 @@
-from typing import Annotated, Dict, List, Optional, Tuple
+from typing import Annotated, Any, Dict, List, Optional, Tuple
 
-from pydantic import Field, model_validator
+from pydantic import Field, PrivateAttr, model_validator
 
 from flync.core.annotations import External, NamingStrategy, OutputStrategy
 from flync.core.base_models.base_model import FLYNCBaseModel
 from flync.core.utils.exceptions import err_major
+from flync.model.address_index import (
+    AddressIndex,
+    AddressOwner,
+    IPAddress,
+    IPNetwork,
+)
 from flync.model.flync_4_ecu import (
     ECU,
     ECUPort,
@@ -13,7 +19,7 @@ from flync.model.flync_4_ecu import (
 )
 from flync.model.flync_4_general_configuration import FLYNCGeneralConfig
 from flync.model.flync_4_metadata import SystemMetadata
-from flync.model.flync_4_topology import FLYNCTopology
+from flync.model.flync_4_topology import FLYNCTopology, NetworkGraph
 
 
 class FLYNCModel(FLYNCBaseModel):
@@ -40,6 +46,24 @@ class FLYNCModel(FLYNCBaseModel):
         :class:`~flync.model.flync_4_general_configuration.FLYNCGeneralConfig`
         , optional
         Optional general configuration settings applicable system-wide.
+
+    Private Attributes
+    ------------------
+    _indexes : dict, optional
+        Name indexes of the ECUs, ports, controllers, interfaces, switches
+        and switch ports, built on the first lookup. They are not updated
+        when the model changes: call :meth:`invalidate_indexes` after
+        assigning or changing the ECUs or the topology.
+
+    _address_index : :class:`~flync.model.address_index.AddressIndex`, \
+    optional
+        Index of all interface addresses, invalidated like ``_indexes``.
+
+    _network_graph : \
+    :class:`~flync.model.flync_4_topology.network_graph.NetworkGraph`, \
+    optional
+        Connectivity graph of all ports and interfaces, invalidated like
+        ``_indexes``.
     """
 
     general: Annotated[
@@ -77,86 +101,198 @@ class FLYNCModel(FLYNCBaseModel):
         VirtualControllerInterface,
         VLANEntry,
     )
+    _indexes: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _address_index: Optional[AddressIndex] = PrivateAttr(default=None)
+    _network_graph: Optional[NetworkGraph] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def validate_component_owners(self):
+        """
+        Validate that every port, controller, interface and switch is
+        part of exactly one owner, and links back to it.
+        """
+        owners: Dict[int, Any] = {}
+
+        def check(child, owner, linked_owner):
+            other = owners.setdefault(id(child), owner)
+            if other is not owner:
+                raise err_major(
+                    f"{child.name} is part of both {other.name} "
+                    f"and {owner.name}"
+                )
+            if linked_owner is not owner:
+                raise err_major(
+                    f"{child.name} is not linked to its owner {owner.name}"
+                )
+
+        for ecu in self.ecus:
+            for port in ecu.ports:
+                check(port, ecu, port.ecu)
+            for controller in ecu.controllers:
+                check(controller, ecu, controller.ecu)
+                for iface in controller.interfaces:
+                    check(iface, controller, iface.controller)
+            for switch in ecu.switches or []:
+                check(switch, ecu, switch.ecu)
+                for port in switch.ports:
+                    check(port, switch, port.switch)
+        return self
 
     @model_validator(mode="after")
     def validate_unique_ips(self):
         """
         Validate all IPs are unique system wide
         """
-        all_ips = []
-        for ecu in self.ecus:
-            new_ips = ecu.get_all_ips()
-            for ip in new_ips:
-                if ip not in all_ips:
-                    all_ips.append(ip)
-                else:
-                    raise err_major(
-                        f"The IP {ip} is repeated in ECU {ecu.name}"
-                    )
+        index = self.get_address_index()
+        if index.duplicates:
+            _, owner = index.duplicates[0]
+            raise err_major(
+                f"The IP {owner.address} is repeated in ECU {owner.ecu.name}"
+            )
         return self
 
+    def invalidate_indexes(self):
+        """Drop the indexes, e.g. after replacing an ECU."""
+        self._indexes = None
+        self._address_index = None
+        self._network_graph = None
+
+    def get_address_index(self) -> AddressIndex:
+        """Return the index of all interface addresses of the system."""
+        if self._address_index is None:
+            self._address_index = AddressIndex.from_ecus(self.ecus)
+        return self._address_index
+
+    def get_address_owner(
+        self, address: IPAddress | str
+    ) -> Optional[AddressOwner]:
+        """Return which interface and virtual interface own an address."""
+        return self.get_address_index().owner_of(address)
+
+    def get_overlapping_subnets(
+        self, network: IPNetwork | str
+    ) -> List[AddressOwner]:
+        """Return the owners of all subnets overlapping a network."""
+        return self.get_address_index().overlapping(network)
+
+    def get_subnet_conflicts(
+        self,
+    ) -> List[Tuple[AddressOwner, AddressOwner]]:
+        """Return the overlapping subnets configured on different VLANs."""
+        return self.get_address_index().subnet_conflicts()
+
+    def get_network_graph(self) -> NetworkGraph:
+        """Return the connectivity graph of all ports and interfaces."""
+        if self._network_graph is None:
+            self._network_graph = NetworkGraph.from_ecus(
+                self.ecus, self.topology.system_topology.connections
+            )
+        return self._network_graph
+
+    def _get_indexes(self) -> Dict[str, Any]:
+        """Return the name indexes, building them on the first call."""
+        if self._indexes is None:
+            self._indexes = self._build_indexes()
+        return self._indexes
+
+    def _build_indexes(self) -> Dict[str, Any]:
+        """Index all named elements in a single pass over the ECUs.
+
+        The first element of a name wins, like in a linear search.
+        """
+        indexes: Dict[str, Any] = {
+            "ecus": {},
+            "ecu_ports": {},
+            "controllers": {},
+            "interfaces": {},
+            "switches": {},
+            "switch_ports": {},
+            "all_controllers": [],
+            "all_ecu_ports": [],
+            "all_interfaces": [],
+            "ecu_interface_names": {},
+        }
+        for ecu in self.ecus:
+            indexes["ecus"].setdefault(ecu.name, ecu)
+            for port in ecu.get_all_ports():
+                indexes["ecu_ports"].setdefault(port.name, port)
+            indexes["all_ecu_ports"].extend(ecu.get_all_ports())
+            interface_names = []
+            for controller in ecu.controllers:
+                indexes["controllers"].setdefault(controller.name, controller)
+                indexes["all_controllers"].append(controller)
+                for iface in controller.interfaces:
+                    indexes["interfaces"].setdefault(iface.name, iface)
+                    indexes["all_interfaces"].append(iface)
+                    interface_names.append(iface.name)
+            indexes["ecu_interface_names"].setdefault(
+                ecu.name, interface_names
+            )
+            for switch in ecu.switches or []:
+                indexes["switches"].setdefault(switch.name, switch)
+                for port in switch.ports:
+                    indexes["switch_ports"].setdefault(port.name, port)
+        return indexes
+
     def get_all_ecus(self):
         """Return a list of all ECU names."""
-        return [ecu.name for ecu in self.ecus]
+        return list(self._get_indexes()["ecus"])
 
     def get_ecu_by_name(self, ecu_name: str):
         """Retrieve an ECU by name."""
-        for ecu in self.ecus:
-            if ecu.name == ecu_name:
-                return ecu
-        return None
+        return self._get_indexes()["ecus"].get(ecu_name)
 
     def get_all_controllers(self):
         """Return a list of all controllers in all ECUs."""
-        controllers = []
-        for ecu in self.ecus:
-            controllers.extend(ecu.controllers)
-        return controllers
+        return list(self._get_indexes()["all_controllers"])
+
+    def get_controller_by_name(self, name: str):
+        """Retrieve a controller by name."""
+        return self._get_indexes()["controllers"].get(name)
 
     def get_all_ecu_ports(self) -> List["ECUPort"]:
         """Return a list of all ECU ports"""
-        ecu_ports = []
-        for ecu in self.ecus:
-            ecu_ports.extend(ecu.get_all_ports())
-        return ecu_ports
+        return list(self._get_indexes()["all_ecu_ports"])
 
     def get_all_ecu_ports_by_name(self) -> Dict[str, "ECUPort"]:
-        return {e.name: e for e in self.get_all_ecu_ports()}
+        """Return all ECU ports by name, the last port of a name wins."""
+        return {
+            port.name: port for port in self._get_indexes()["all_ecu_ports"]
+        }
+
+    def get_ecu_port_by_name(self, name: str) -> Optional["ECUPort"]:
+        """Retrieve an ECU port by name."""
+        return self._get_indexes()["ecu_ports"].get(name)
 
     def get_interface_by_name(self, name):
-        return next(
-            (
-                interface
-                for interface in self.get_all_interfaces()
-                if interface.name == name
-            ),
-            None,
-        )
+        """Retrieve a controller interface by name."""
+        return self._get_indexes()["interfaces"].get(name)
 
     def get_all_interfaces(self):
-        return [
-            iface
-            for controller in self.get_all_controllers()
-            for iface in controller.interfaces
-        ]
+        """Return all controller interfaces of all ECUs."""
+        return list(self._get_indexes()["all_interfaces"])
 
     def get_all_interfaces_names(self):
         """Return all the controller interface names"""
-        all_interfaces = []
-        for ecu in self.get_all_ecus():
-            all_interfaces.extend(self.get_interfaces_for_ecu(ecu))
-        return all_interfaces
+        return [
+            name
+            for names in self._get_indexes()["ecu_interface_names"].values()
+            for name in names
+        ]
 
     def get_interfaces_for_ecu(self, ecu_name: str):
         """Return a list of all interfaces for a given ECU."""
-        ecu = self.get_ecu_by_name(ecu_name)
-        if ecu:
-            return [
-                iface.name
-                for controller in ecu.controllers
-                for iface in controller.interfaces
-            ]
-        return []
+        return list(
+            self._get_indexes()["ecu_interface_names"].get(ecu_name, [])
+        )
+
+    def get_switch_by_name(self, name: str):
+        """Retrieve a switch by name."""
+        return self._get_indexes()["switches"].get(name)
+
+    def get_switch_port_by_name(self, name: str):
+        """Retrieve a switch port by name."""
+        return self._get_indexes()["switch_ports"].get(name)
 
     def get_system_topology_info(self):
         """Return system topology details."""
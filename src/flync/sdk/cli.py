@@ -0,0 +1,368 @@
+"""
+Command line interface of FLYNC.
+
+Provides the ``flync`` console entry point.
+"""
+
+import json
+import sys
+import time
+from contextlib import nullcontext
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, Any, Dict, List, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+# the models are only imported by the commands using them, so that e.g.
+# ``flync --help`` starts quickly
+if TYPE_CHECKING:
+    from flync.core.utils.profiling import ValidationProfiler
+    from flync.sdk.workspace.diagnostic import Diagnostic
+    from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+app = typer.Typer(
+    help="Tools for FLYNC workspaces.", pretty_exceptions_enable=False
+)
+
+
+class OutputFormat(str, Enum):
+    """The formats the validation result can be printed in."""
+
+    TEXT = "text"
+    JSON = "json"
+    JSONL = "jsonl"
+    SARIF = "sarif"
+
+
+@app.callback()
+def main():
+    """Tools for FLYNC workspaces."""
+
+
+def diagnostic_to_dict(diagnostic: "Diagnostic") -> Dict[str, Any]:
+    """Convert a diagnostic into JSON serializable data.
+
+    Args:
+        diagnostic (Diagnostic): The diagnostic.
+
+    Returns:
+        Dict[str, Any]: The type, message, location, URI, line, column \
+        and object id.
+    """
+    error = diagnostic.error
+    return {
+        "type": error.get("type", ""),
+        "message": error.get("msg", ""),
+        "loc": [str(p) for p in error.get("loc", ())],
+        "uri": diagnostic.uri,
+        "line": diagnostic.line,
+        "column": diagnostic.column,
+        "object_id": diagnostic.object_id,
+    }
+
+
+def to_sarif(workspace: "FLYNCWorkspace") -> Dict[str, Any]:
+    """Build a SARIF 2.1.0 log of the workspace diagnostics.
+
+    Args:
+        workspace (FLYNCWorkspace): The validated workspace.
+
+    Returns:
+        Dict[str, Any]: The SARIF log.
+    """
+    from flync.sdk.workspace.cache import get_flync_version
+
+    results = []
+    rule_ids: List[str] = []
+    for diagnostic in workspace.diagnostics:
+        data = diagnostic_to_dict(diagnostic)
+        if data["type"] not in rule_ids:
+            rule_ids.append(data["type"])
+        result: Dict[str, Any] = {
+            "ruleId": data["type"],
+            "level": "error",
+            "message": {"text": data["message"]},
+            "locations": [
+                {
+                    "physicalLocation": {
+                        "artifactLocation": {"uri": data["uri"]}
+                    }
+                }
+            ],
+        }
+        if data["line"] is not None:
+            result["locations"][0]["physicalLocation"]["region"] = {
+                "startLine": data["line"],
+                "startColumn": data["column"],
+            }
+        if data["loc"]:
+            result["locations"][0]["logicalLocations"] = [
+                {"fullyQualifiedName": ".".join(data["loc"])}
+            ]
+        results.append(result)
+    return {
+        "$schema": SARIF_SCHEMA,
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {
+                    "driver": {
+                        "name": "flync",
+                        "version": get_flync_version(),
+                        "rules": [{"id": rule_id} for rule_id in rule_ids],
+                    }
+                },
+                "results": results,
+            }
+        ],
+    }
+
+
+def print_profile(timings: Dict[str, float], total: float, console: Console):
+    """Print the time spent in every load phase.
+
+    Args:
+        timings (Dict[str, float]): Seconds spent per phase.
+
+        total (float): The total run time in seconds.
+
+        console (Console): The console to print to.
+
+    Returns: None
+    """
+    table = Table(title="FLYNC load profile")
+    table.add_column("Phase", style="cyan")
+    table.add_column("Time (s)", justify="right")
+    for phase in ("discover", "parse", "validate", "link", "cross-validate"):
+        table.add_row(phase, f"{timings.get(phase, 0.0):.3f}")
+    table.add_row("total", f"{total:.3f}", style="bold")
+    console.print(table)
+
+
+def print_validators(
+    profiler: "ValidationProfiler", console: Console, limit: int = 20
+):
+    """Print the validators that took the most time.
+
+    Args:
+        profiler (ValidationProfiler): The profiler of the load.
+
+        console (Console): The console to print to.
+
+        limit (int): The number of validators to print.
+
+    Returns: None
+    """
+    table = Table(title="Slowest validators")
+    table.add_column("Validator", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Time (s)", justify="right")
+    for name, calls, seconds in profiler.report(limit):
+        table.add_row(name, str(calls), f"{seconds:.3f}")
+    console.print(table)
+
+
+@app.command()
+def validate(
+    path: Annotated[
+        Path,
+        typer.Argument(
+            exists=True,
+            file_okay=False,
+            resolve_path=True,
+            help="Folder of the FLYNC workspace.",
+        ),
+    ],
+    name: Annotated[
+        Optional[str],
+        typer.Option(
+            "--name", "-n", help="Name of the workspace (folder name)."
+        ),
+    ] = None,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs", "-j", min=1, help="Number of threads parsing documents."
+        ),
+    ] = 1,
+    cache_dir: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--cache-dir",
+            file_okay=False,
+            help="Directory of the on-disk cache of unchanged documents. "
+            "Validated models are only restored from entries signed with "
+            "the FLYNC_CACHE_KEY secret (or the user's key file).",
+        ),
+    ] = None,
+    output_format: Annotated[
+        OutputFormat,
+        typer.Option("--format", "-f", help="Format of the result."),
+    ] = OutputFormat.TEXT,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile", help="Print the time spent in every load phase."
+        ),
+    ] = False,
+    defer_links: Annotated[
+        bool,
+        typer.Option(
+            "--defer-links",
+            help="Check the links between objects in a separate phase.",
+        ),
+    ] = False,
+    trace: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--trace",
+            dir_okay=False,
+            help="Write a Chrome trace (chrome://tracing, Perfetto) of the "
+            "load phases and validator calls to this file.",
+        ),
+    ] = None,
+):
+    """Validate a FLYNC workspace.
+
+    Exits with 0 if the workspace is valid and with 1 otherwise.
+    """
+    from flync.core.utils.profiling import ValidationProfiler
+    from flync.sdk.helpers.batch_validation import (
+        WorkspaceReport,
+        render_reports,
+    )
+    from flync.sdk.workspace.cache import WorkspaceCache
+    from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+
+    start = time.perf_counter()
+    workspace = FLYNCWorkspace(name or path.name, path)
+    if cache_dir is not None:
+        workspace.cache = WorkspaceCache(cache_dir)
+    exception: Optional[str] = None
+    profiler = ValidationProfiler() if trace is not None else None
+    try:
+        with profiler or nullcontext():
+            workspace.load(jobs=jobs, defer_links=defer_links)
+    except Exception as e:
+        exception = f"{type(e).__name__}: {e}"
+    total = time.perf_counter() - start
+    if profiler is not None:
+        profiler.write_chrome_trace(trace)
+    valid = workspace.flync_model is not None and not workspace.load_errors
+
+    if output_format == OutputFormat.TEXT:
+        render_reports(
+            [
+                WorkspaceReport(
+                    name=workspace.name,
+                    path=path,
+                    errors=list(workspace.load_errors),
+                    diagnostics=workspace.diagnostics,
+                    exception=exception,
+                    duration=total,
+                )
+            ]
+        )
+    elif output_format == OutputFormat.JSON:
+        result = {
+            "workspace": workspace.name,
+            "path": str(path),
+            "valid": valid,
+            "diagnostics": [
+                diagnostic_to_dict(d) for d in workspace.diagnostics
+            ],
+            "exception": exception,
+            "timings": workspace.timings,
+        }
+        typer.echo(json.dumps(result, indent=2))
+    elif output_format == OutputFormat.JSONL:
+        for diagnostic in workspace.diagnostics:
+            typer.echo(json.dumps(diagnostic_to_dict(diagnostic)))
+        if exception is not None:
+            typer.echo(json.dumps({"type": "exception", "message": exception}))
+    else:
+        typer.echo(json.dumps(to_sarif(workspace), indent=2))
+
+    if profile:
+        console = Console(file=sys.stderr)
+        print_profile(workspace.timings, total, console)
+        if profiler is not None:
+            print_validators(profiler, console)
+    raise typer.Exit(0 if valid and exception is None else 1)
+
+
+@app.command()
+def generate(
+    path: Annotated[
+        Path,
+        typer.Argument(
+            file_okay=False,
+            resolve_path=True,
+            help="Folder to write the workspace to.",
+        ),
+    ],
+    ecus: Annotated[
+        int, typer.Option("--ecus", min=1, help="Number of ECUs.")
+    ] = 10,
+    switches: Annotated[
+        int,
+        typer.Option("--switches", min=1, help="Number of switches per ECU."),
+    ] = 1,
+    ports: Annotated[
+        int,
+        typer.Option("--ports", min=3, help="Number of ports per switch."),
+    ] = 6,
+    fanout: Annotated[
+        int,
+        typer.Option(
+            "--fanout", min=1, help="Number of child ECUs of every ECU."
+        ),
+    ] = 3,
+    vlans: Annotated[
+        int, typer.Option("--vlans", min=1, help="Number of VLANs.")
+    ] = 4,
+):
+    """Generate a synthetic FLYNC workspace, e.g. for benchmarks."""
+    from flync.sdk.helpers.generate_workspace import (
+        WorkspaceSize,
+        generate_workspace,
+    )
+
+    try:
+        size = WorkspaceSize(
+            ecus=ecus,
+            switches_per_ecu=switches,
+            ports_per_switch=ports,
+            fanout=fanout,
+            vlans=vlans,
+        )
+    except ValueError as e:
+        raise typer.BadParameter(str(e))
+    generate_workspace(path, size)
+    typer.echo(f"Generated a workspace with {ecus} ECUs in {path}")
+
+
+@app.command()
+def lsp(
+    debounce: Annotated[
+        float,
+        typer.Option(
+            "--debounce",
+            min=0.0,
+            help="Seconds without edits before they are validated.",
+        ),
+    ] = 0.3,
+):
+    """Run the FLYNC language server on stdin and stdout."""
+    from flync.sdk.lsp.server import main as serve
+
+    raise typer.Exit(serve(debounce))
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,189 @@
+"""
+In-process validation of many FLYNC workspaces.
+
+All workspaces are validated by the same interpreter, so the model
+classes are imported and their schemas built only once. Every workspace
+registers its names and instances in its own registry context, which
+keeps the validations apart even when they run concurrently.
+"""
+
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from pydantic import ValidationError
+from pydantic_core import ErrorDetails
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+from flync.sdk.workspace.diagnostic import Diagnostic
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+
+
+@dataclass
+class WorkspaceReport:
+    """The outcome of validating one workspace.
+
+    Attributes:
+        name (str): The name of the workspace.
+
+        path (Path): The path of the workspace.
+
+        errors (List[ErrorDetails]): The validation errors.
+
+        diagnostics (List[Diagnostic]): The validation errors with the \
+        document and position they were found at.
+
+        exception (str | None): The message of an unexpected exception \
+        that aborted the validation.
+
+        duration (float): The validation time in seconds.
+    """
+
+    name: str
+    path: Path
+    errors: List[ErrorDetails] = field(default_factory=list)
+    diagnostics: List[Diagnostic] = field(default_factory=list)
+    exception: Optional[str] = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the workspace is valid."""
+        return (
+            not self.errors and not self.diagnostics and self.exception is None
+        )
+
+
+def validate_workspace(
+    path: Path | str, name: Optional[str] = None
+) -> WorkspaceReport:
+    """Validate a single workspace.
+
+    Defined at module level so it can be shipped to a process pool.
+
+    Args:
+        path (Path | str): The path of the workspace.
+
+        name (str, optional): The name of the workspace. Defaults to the \
+        folder name.
+
+    Returns:
+        WorkspaceReport: The outcome of the validation.
+    """
+    path = Path(path).resolve()
+    report = WorkspaceReport(name=name or path.name, path=path)
+    start = time.perf_counter()
+    try:
+        loaded_ws = FLYNCWorkspace(report.name, path)
+        loaded_ws.load()
+        report.errors = list(loaded_ws.load_errors)
+        report.diagnostics = loaded_ws.diagnostics
+    except ValidationError as e:
+        report.errors = e.errors()
+    except Exception as e:
+        report.exception = f"{type(e).__name__}: {e}"
+    report.duration = time.perf_counter() - start
+    return report
+
+
+def validate_workspaces(
+    paths: Iterable[Path | str],
+    jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[WorkspaceReport]:
+    """Validate several workspaces in this process.
+
+    Args:
+        paths (Iterable[Path | str]): The paths of the workspaces.
+
+        jobs (int, optional): Number of worker threads. ``None`` or ``1`` \
+        validates sequentially.
+
+        executor (Executor, optional): An executor (e.g. a \
+        ``ProcessPoolExecutor``) running the validations. Takes \
+        precedence over ``jobs`` and is not shut down.
+
+    Returns:
+        List[WorkspaceReport]: One report per workspace, in input order.
+    """
+    paths = list(paths)
+    if executor is not None:
+        return list(executor.map(validate_workspace, paths))
+    if jobs is None or jobs <= 1:
+        return [validate_workspace(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(validate_workspace, paths))
+
+
+def render_reports(
+    reports: Iterable[WorkspaceReport], console: Optional[Console] = None
+):
+    """Print a combined summary and the errors of all workspaces.
+
+    Args:
+        reports (Iterable[WorkspaceReport]): The validation outcomes.
+
+        console (Console, optional): The console to print to.
+
+    Returns: None
+    """
+    console = console or Console()
+    reports = list(reports)
+    summary = Table(title="FLYNC validation", show_lines=False)
+    summary.add_column("Workspace", style="cyan")
+    summary.add_column("Result")
+    summary.add_column("Errors", justify="right")
+    summary.add_column("Time (s)", justify="right")
+    for report in reports:
+        summary.add_row(
+            report.name,
+            (
+                "[bold green]valid[/bold green]"
+                if report.ok
+                else "[bold red]invalid[/bold red]"
+            ),
+            str(
+                len(report.diagnostics or report.errors)
+                + (report.exception is not None)
+            ),
+            f"{report.duration:.2f}",
+        )
+    console.print(summary)
+
+    for report in reports:
+        if report.ok:
+            continue
+        table = Table(title=report.name, show_lines=True)
+        table.add_column("Num.", justify="right")
+        table.add_column("Error Type", style="red")
+        table.add_column("Message", style="yellow")
+        table.add_column("Location", style="cyan")
+        table.add_column("Source", style="cyan")
+        table.add_column("Context", style="green")
+        # errors raised before any document was read have no source
+        findings = [(d.error, escape(d.source)) for d in report.diagnostics]
+        if not findings:
+            findings = [(err, "") for err in report.errors]
+        rows = [
+            [
+                err.get("type", ""),
+                escape(err.get("msg", "")),
+                ".".join(str(p) for p in err.get("loc", [])),
+                source,
+                escape(
+                    ", ".join(
+                        f"{k}={v}" for k, v in err.get("ctx", {}).items()
+                    )
+                ),
+            ]
+            for err, source in findings
+        ]
+        if report.exception is not None:
+            rows.append(["exception", escape(report.exception), "", "", ""])
+        for idx, row in enumerate(rows, 1):
+            table.add_row(str(idx), *row)
+        console.print(table)
@@ -0,0 +1,491 @@
+"""
+Generator of synthetic FLYNC workspaces of any size.
+
+The generated vehicle is a tree of ECUs: every ECU reaches its parent
+through an uplink ECU port and its children through downlink ports, which
+are connected to the first switch of the ECU. All other switch ports are
+connected to controller interfaces. Every ECU offers SOME/IP services on
+sockets of its first controller, and multicast groups are forwarded
+through all switches, so the workspace exercises the connection, address,
+socket and multicast path validation at scale.
+"""
+
+from dataclasses import dataclass
+from ipaddress import IPv4Address
+from pathlib import Path
+from typing import Any, Dict, List
+
+import yaml
+
+META = {
+    "author": "Generator",
+    "compatible_flync_version": {
+        "version_schema": "semver",
+        "version": "0.9.0",
+    },
+}
+EMBEDDED_META = {**META, "target_system": "flync_os"}
+
+SYSTEM_METADATA = {
+    "release": {"version_schema": "semver", "version": "1.0.0"},
+    "author": "Generator",
+    "compatible_flync_version": META["compatible_flync_version"],
+    "oem": "OEM_synthetic",
+    "platform": "Synthetic",
+}
+
+TCP_PROFILES = {
+    "tcp_profiles": [
+        {
+            "tcp_profile_id": 1,
+            "nagle": False,
+            "keepalive_enabled": True,
+            "keepidle": 10,
+            "keepcount": 10,
+            "keepintvl": 2,
+            "user_timeout": 28,
+            "congestion_avoidance": "reno",
+            "tcp_maxseg": False,
+            "tcp_syncnt": 6,
+        }
+    ]
+}
+
+SD_CONFIG = {
+    "ip_address": "224.224.224.255",
+    "sd_timings": [
+        {
+            "profile_id": "server_default",
+            "initial_delay_min": 0.05,
+            "initial_delay_max": 0.1,
+            "repetitions_base_delay": 0.3,
+            "repetitions_max": 3,
+            "request_response_delay_min": 0.05,
+            "request_response_delay_max": 0.1,
+            "offer_cyclic_delay": 1,
+            "offer_ttl": 3,
+        },
+        {
+            "profile_id": "client_default",
+            "initial_delay_min": 0.05,
+            "initial_delay_max": 0.1,
+            "repetitions_base_delay": 0.3,
+            "repetitions_max": 3,
+            "request_response_delay_min": 0.05,
+            "request_response_delay_max": 0.1,
+            "find_ttl": 3,
+            "subscribe_ttl": 3,
+        },
+    ],
+}
+
+MDI_CONFIG = {
+    "mode": "base_t1",
+    "speed": 100,
+    "duplex": "full",
+    "autonegotiation": False,
+}
+MII_CONFIG = {"type": "rmii", "speed": 100}
+FIRST_VLAN = 10
+SD_PORT = 30490
+FIRST_SERVICE_PORT = 30500
+
+
+@dataclass(frozen=True)
+class WorkspaceSize:
+    """The dimensions of a generated workspace.
+
+    Attributes:
+        ecus (int): Number of ECUs.
+
+        switches_per_ecu (int): Number of switches of every ECU.
+
+        ports_per_switch (int): Number of ports of every switch.
+
+        fanout (int): Number of child ECUs connected to an ECU.
+
+        vlans (int): Number of VLANs, assigned to the controllers in turn.
+
+        multicast_groups (int): Number of multicast addresses forwarded \
+        in every VLAN.
+
+        tcam_rules (int): Number of TCAM rules of every switch.
+
+        services (int): Number of SOME/IP service interfaces.
+
+        services_per_ecu (int): Number of services every ECU provides and \
+        consumes.
+
+        multicast_paths (int): Number of multicast paths.
+    """
+
+    ecus: int = 10
+    switches_per_ecu: int = 1
+    ports_per_switch: int = 6
+    fanout: int = 3
+    vlans: int = 4
+    multicast_groups: int = 2
+    tcam_rules: int = 2
+    services: int = 8
+    services_per_ecu: int = 2
+    multicast_paths: int = 4
+
+    def __post_init__(self):
+        if self.ecus < 1 or self.switches_per_ecu < 1 or self.vlans < 1:
+            raise ValueError("A workspace needs ECUs, switches and VLANs.")
+        if self.fanout < 1 or self.ports_per_switch < self.fanout + 2:
+            raise ValueError(
+                "Switches need a port for the uplink, every child ECU "
+                "and at least one controller."
+            )
+        if self.services < 1 or not 0 <= self.services_per_ecu <= (
+            self.services
+        ):
+            raise ValueError("Every ECU can only use the existing services.")
+
+
+def _write(path: Path, content: Dict[str, Any]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump(content, sort_keys=False))
+
+
+def _vlan_id(index: int) -> int:
+    return FIRST_VLAN + 10 * index
+
+
+def _multicast_address(vlan: int, group: int) -> str:
+    return str(IPv4Address("239.0.0.0") + vlan * 256 + group)
+
+
+class _AddressPool:
+    """Hands out unique host addresses, one /16 subnet per VLAN."""
+
+    def __init__(self, vlans: int):
+        self._next = [1] * vlans
+
+    def take(self, vlan: int) -> str:
+        host = self._next[vlan]
+        self._next[vlan] += 1
+        if host >= 0xFFFF:
+            raise ValueError("Too many addresses in one VLAN.")
+        return str(IPv4Address(f"10.{vlan + 1}.0.0") + host)
+
+
+class _Generator:
+    def __init__(self, root: Path, size: WorkspaceSize):
+        self.root = root
+        self.size = size
+        self.addresses = _AddressPool(size.vlans)
+        self.interface_vlans: Dict[str, int] = {}
+
+    def children(self, ecu: int) -> range:
+        first = ecu * self.size.fanout + 1
+        return range(first, min(first + self.size.fanout, self.size.ecus))
+
+    def run(self):
+        _write(self.root / "system_metadata.flync.yaml", SYSTEM_METADATA)
+        general = self.root / "general"
+        _write(general / "tcp_profiles.flync.yaml", TCP_PROFILES)
+        _write(general / "someip" / "sd_config.flync.yaml", SD_CONFIG)
+        for service in range(self.size.services):
+            _write(
+                general / "someip" / "services" / f"svc{service}.flync.yaml",
+                {
+                    "meta": META,
+                    "name": f"Service {service}",
+                    "id": service + 1,
+                    "major_version": 1,
+                    "minor_version": 0,
+                },
+            )
+        for ecu in range(self.size.ecus):
+            self.write_ecu(ecu)
+        connections = [
+            {
+                "type": "ecu_port_to_ecu_port",
+                "id": f"conn_ecu{child}",
+                "ecu1_port": f"ecu{parent}_d{slot}",
+                "ecu2_port": f"ecu{child}_up",
+            }
+            for parent in range(self.size.ecus)
+            for slot, child in enumerate(self.children(parent))
+        ]
+        topology = self.root / "topology"
+        _write(
+            topology / "system_topology.flync.yaml",
+            {"connections": connections},
+        )
+        _write(
+            topology / "multicast_paths.flync.yaml",
+            {"paths": self.multicast_paths()},
+        )
+
+    def multicast_paths(self) -> List[Dict[str, Any]]:
+        if not self.size.multicast_groups:
+            return []
+        members: Dict[int, List[str]] = {}
+        for interface, vlan in self.interface_vlans.items():
+            members.setdefault(vlan, []).append(interface)
+        paths = []
+        for index in range(self.size.multicast_paths):
+            vlan = index % self.size.vlans
+            interfaces = members.get(vlan)
+            if not interfaces:
+                continue
+            # spread sources and destinations over the vehicle
+            src = interfaces[(index * 7919) % len(interfaces)]
+            step = max(len(interfaces) // 4, 1)
+            paths.append(
+                {
+                    "vlan": _vlan_id(vlan),
+                    "address": _multicast_address(
+                        vlan, index % self.size.multicast_groups
+                    ),
+                    "src_interface": src,
+                    "dst_interface": [
+                        i for i in interfaces[::step] if i != src
+                    ][:3],
+                }
+            )
+        return paths
+
+    def write_ecu(self, ecu: int):
+        size = self.size
+        folder = self.root / "ecus" / f"ecu{ecu}"
+        name = f"ecu{ecu}"
+        _write(folder / "ecu_metadata.flync.yaml", META)
+
+        ecu_ports = [
+            f"{name}_d{slot}" for slot in range(len(self.children(ecu)))
+        ]
+        roles = ["master"] * len(ecu_ports)
+        if ecu:
+            ecu_ports.insert(0, f"{name}_up")
+            roles.insert(0, "slave")
+        _write(
+            folder / "ports.flync.yaml",
+            {
+                "ports": [
+                    {"name": port, "mdi_config": {**MDI_CONFIG, "role": role}}
+                    for port, role in zip(ecu_ports, roles)
+                ]
+            },
+        )
+
+        connections = []
+        controller_vlans: List[int] = []
+        for switch in range(size.switches_per_ecu):
+            switch_name = f"{name}_sw{switch}"
+            ports = [
+                f"{switch_name}_p{p}" for p in range(size.ports_per_switch)
+            ]
+            trunk = ports[: len(ecu_ports)] if switch == 0 else []
+            for ecu_port, switch_port in zip(ecu_ports, trunk):
+                connections.append(
+                    {
+                        "type": "ecu_port_to_switch_port",
+                        "id": f"conn_{ecu_port}",
+                        "ecu_port": ecu_port,
+                        "switch_port": switch_port,
+                    }
+                )
+            port_vlans: Dict[str, int] = {}
+            for switch_port in ports:
+                if switch_port in trunk:
+                    continue
+                controller = len(controller_vlans)
+                vlan = (ecu + controller) % size.vlans
+                controller_vlans.append(vlan)
+                port_vlans[switch_port] = vlan
+                connections.append(
+                    {
+                        "type": "switch_port_to_controller_interface",
+                        "id": f"conn_{switch_port}",
+                        "switch_port": switch_port,
+                        "controller_interface": f"{name}_c{controller}_if",
+                    }
+                )
+            _write(
+                folder / "switches" / f"{switch_name}.flync.yaml",
+                self.switch(switch_name, ports, trunk, port_vlans),
+            )
+        _write(folder / "topology.flync.yaml", {"connections": connections})
+
+        first_address = None
+        for controller, vlan in enumerate(controller_vlans):
+            address = self.addresses.take(vlan)
+            if controller == 0:
+                first_address = address
+            _write(
+                folder / "controllers" / f"{name}_c{controller}.flync.yaml",
+                self.controller(ecu, controller, vlan, address),
+            )
+        if size.services_per_ecu:
+            _write(
+                folder / "sockets" / "someip.flync.yaml",
+                self.sockets(ecu, first_address),
+            )
+
+    def switch(
+        self,
+        name: str,
+        ports: List[str],
+        trunk: List[str],
+        port_vlans: Dict[str, int],
+    ) -> Dict[str, Any]:
+        size = self.size
+        vlans = []
+        for vlan in range(size.vlans):
+            members = trunk + [p for p, v in port_vlans.items() if v == vlan]
+            if not members:
+                continue
+            vlans.append(
+                {
+                    "name": f"VLAN{_vlan_id(vlan)}",
+                    "id": _vlan_id(vlan),
+                    "default_priority": 0,
+                    "ports": members,
+                    "multicast": [
+                        {
+                            "address": _multicast_address(vlan, group),
+                            "ports": members,
+                        }
+                        for group in range(size.multicast_groups)
+                    ],
+                }
+            )
+        tcam_rules = [
+            {
+                "name": f"{name}_rule{rule}",
+                "id": rule + 1,
+                "match_filter": {
+                    "vlanid": _vlan_id(rule % size.vlans),
+                    "dst_port": rule + 1,
+                },
+                "match_ports": [ports[rule % len(ports)]],
+                "action": [{"type": "drop", "ports": [ports[-1]]}],
+            }
+            for rule in range(size.tcam_rules)
+        ]
+        return {
+            "meta": EMBEDDED_META,
+            "name": name,
+            "ports": [
+                {
+                    "name": port,
+                    "silicon_port_no": number,
+                    "default_vlan_id": 1,
+                    **(
+                        {"mii_config": {**MII_CONFIG, "mode": "mac"}}
+                        if port in port_vlans
+                        else {}
+                    ),
+                }
+                for number, port in enumerate(ports)
+            ],
+            "vlans": vlans,
+            "tcam_rules": tcam_rules,
+        }
+
+    def controller(
+        self, ecu: int, controller: int, vlan: int, address: str
+    ) -> Dict[str, Any]:
+        name = f"ecu{ecu}_c{controller}"
+        self.interface_vlans[f"{name}_if"] = vlan
+        number = ecu * 256 + controller
+        mac = ":".join(f"{b:02x}" for b in b"\x02\x00" + number.to_bytes(4))
+        return {
+            "meta": EMBEDDED_META,
+            "name": name,
+            "interfaces": [
+                {
+                    "name": f"{name}_if",
+                    "mac_address": mac,
+                    "mii_config": {**MII_CONFIG, "mode": "phy"},
+                    "virtual_interfaces": [
+                        {
+                            "name": f"{name}_vif",
+                            "vlanid": _vlan_id(vlan),
+                            "addresses": [
+                                {
+                                    "address": address,
+                                    "ipv4netmask": "255.255.0.0",
+                                }
+                            ],
+                            "multicast": [
+                                _multicast_address(vlan, group)
+                                for group in range(self.size.multicast_groups)
+                            ],
+                        }
+                    ],
+                }
+            ],
+        }
+
+    def sockets(self, ecu: int, address: str) -> Dict[str, Any]:
+        size = self.size
+        sockets = [
+            {
+                "name": f"ecu{ecu}_sd",
+                "endpoint_address": address,
+                "port_no": SD_PORT,
+                "protocol": "udp",
+                "deployments": [
+                    {
+                        "deployment_type": "someip_sd",
+                        "multicast": {
+                            "ip_address": SD_CONFIG["ip_address"],
+                            "port": SD_PORT,
+                            "ip_ttl": 1,
+                        },
+                    }
+                ],
+            }
+        ]
+        for index in range(size.services_per_ecu):
+            provided = (ecu * size.services_per_ecu + index) % size.services
+            consumed = (provided + 1) % size.services
+            sockets.append(
+                {
+                    "name": f"ecu{ecu}_svc{index}",
+                    "endpoint_address": address,
+                    "port_no": FIRST_SERVICE_PORT + index,
+                    "protocol": "udp",
+                    "deployments": [
+                        {
+                            "deployment_type": "someip_provider",
+                            "service": provided + 1,
+                            "instance_id": ecu + 1,
+                            "major_version": 1,
+                            "someip_sd_timings_profile": "server_default",
+                        },
+                        {
+                            "deployment_type": "someip_consumer",
+                            "service": consumed + 1,
+                            "instance_id": ecu + 1,
+                            "major_version": 1,
+                            "someip_sd_timings_profile": "client_default",
+                        },
+                    ],
+                }
+            )
+        return {"vlan_name": f"ecu{ecu}_c0_vif", "sockets": sockets}
+
+
+def generate_workspace(
+    path: Path | str, size: WorkspaceSize = WorkspaceSize()
+) -> Path:
+    """Write a synthetic FLYNC workspace.
+
+    Args:
+        path (Path | str): The folder to write the workspace to. Created \
+        if missing, existing files are overwritten.
+
+        size (WorkspaceSize): The dimensions of the workspace.
+
+    Returns:
+        Path: The folder of the workspace.
+    """
+    root = Path(path)
+    _Generator(root, size).run()
+    return root
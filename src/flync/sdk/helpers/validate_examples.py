@@ -1,19 +1,36 @@
-import subprocess
+import argparse
+import os
+import sys
 from pathlib import Path
-from sys import executable
 
-PROJECT_BASE = Path(__file__).resolve().parents[4]
-VALIDATE_WORKSPACE_SCRIPT = Path.joinpath(
-    Path(__file__).resolve().parent, Path("validate_workspace.py")
+from flync.sdk.helpers.batch_validation import (
+    render_reports,
+    validate_workspaces,
 )
+
+PROJECT_BASE = Path(__file__).resolve().parents[4]
 EXAMPLES_DIR = PROJECT_BASE / "examples"
 
+parser = argparse.ArgumentParser(
+    description="Script to validate all FLYNC example workspaces."
+)
+parser.add_argument(
+    "examples",
+    nargs="?",
+    default=EXAMPLES_DIR,
+    type=Path,
+    help="Folder containing one FLYNC workspace per sub-folder.",
+)
+parser.add_argument(
+    "-j",
+    "--jobs",
+    type=int,
+    default=os.cpu_count(),
+    help="Number of workspaces validated concurrently.",
+)
+args = parser.parse_args()
 
-for example_dir in list(EXAMPLES_DIR.iterdir()):
-    subprocess.run(
-        [
-            executable,
-            VALIDATE_WORKSPACE_SCRIPT,
-            example_dir,
-        ]
-    )
+example_dirs = sorted(p for p in args.examples.iterdir() if p.is_dir())
+reports = validate_workspaces(example_dirs, jobs=args.jobs)
+render_reports(reports)
+sys.exit(0 if all(report.ok for report in reports) else 1)
@@ -8,6 +8,7 @@ from pydantic_core import ErrorDetails
 from rich.console import Console
 from rich.table import Table
 
+from flync.sdk.workspace.diagnostic import Diagnostic
 from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
 
 PROJECT_BASE = Path(__file__).resolve().parent.parent
@@ -29,7 +30,21 @@ def __add_pydantic_errors_to_report(
         err_type = err.get("type", "")
         msg = err.get("msg", "")
         ctx = ", ".join(f"{k}={v}" for k, v in err.get("ctx", {}).items())
-        error_list.append([err_type, msg, location, ctx])
+        error_list.append([err_type, msg, location, "", ctx])
+
+
+def __add_diagnostics_to_report(
+    diagnostics: list[Diagnostic],
+    error_list: list,
+):
+    for diagnostic in diagnostics:
+        err = diagnostic.error
+        location = ".".join(str(p) for p in err.get("loc", []))
+        err_type = err.get("type", "")
+        ctx = ", ".join(f"{k}={v}" for k, v in err.get("ctx", {}).items())
+        error_list.append(
+            [err_type, diagnostic.message, location, diagnostic.source, ctx]
+        )
 
 
 def add_errors_to_report(
@@ -48,7 +63,7 @@ def add_errors_to_report(
         err_type = type(exc).__name__
         msg = sanitize_error_message(str(exc))
         ctx = ""
-        errs.append([err_type, msg, location, ctx])
+        errs.append([err_type, msg, location, "", ctx])
 
     errors_report[config_name] = errs
     return errors_report
@@ -67,6 +82,7 @@ def render_validation_errors() -> None:
         table.add_column("Error Type", style="red")
         table.add_column("Message", style="yellow")
         table.add_column("Location", style="cyan")
+        table.add_column("Source", style="cyan")
         table.add_column("Context", style="green")
 
         for idx, error_row in enumerate(errs, 1):
@@ -78,7 +94,7 @@ def render_validation_errors() -> None:
 parser = argparse.ArgumentParser(
     description="Script to validate a FLYNC workspace."
 )
-parser.add_argument("path", help="Absolute path to FLYNC configuration.")
+parser.add_argument("path", help="Path to FLYNC configuration.")
 parser.add_argument(
     "-n",
     "--name",
@@ -87,33 +103,29 @@ parser.add_argument(
 )
 args = parser.parse_args()
 
-path = Path(args.path)
+path = Path(args.path).resolve()
 flync_name = args.name
 
-if not path.is_absolute():
-    print("Error: Path must be absolute.", file=sys.stderr)
-    sys.exit(1)
-
 if not path.exists():
     print(f"Error: Path does not exist: {path}", file=sys.stderr)
     sys.exit(1)
 
 
 console.print(f"Validating {flync_name} ...")
-loaded_ws = None
+loaded_ws = FLYNCWorkspace(flync_name, path.resolve())
 try:
-    loaded_ws = FLYNCWorkspace.load_workspace(flync_name, path.resolve())
+    loaded_ws.load()
 except Exception as e:
+    VALIDATION_ERRORS = add_errors_to_report(VALIDATION_ERRORS, flync_name, e)
+if loaded_ws.diagnostics:
+    VALIDATION_ERRORS.setdefault(flync_name, [])
+    __add_diagnostics_to_report(
+        loaded_ws.diagnostics, VALIDATION_ERRORS[flync_name]
+    )
+if VALIDATION_ERRORS:
     console.print(
         f"⚠️ [bold red] Validation of {flync_name} failed![/bold red]"
     )
-    VALIDATION_ERRORS = add_errors_to_report(VALIDATION_ERRORS, flync_name, e)
-if loaded_ws and loaded_ws.load_errors:
-    if flync_name not in VALIDATION_ERRORS:
-        VALIDATION_ERRORS[flync_name] = []
-    __add_pydantic_errors_to_report(
-        loaded_ws.load_errors, VALIDATION_ERRORS[flync_name]
-    )
 render_validation_errors()
 
 if len(VALIDATION_ERRORS) == 0:
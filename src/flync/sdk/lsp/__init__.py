@@ -0,0 +1,6 @@
+"""
+Language server for FLYNC workspaces.
+
+Speaks the Language Server Protocol over stdio (``flync lsp``) and reports
+the diagnostics of a FLYNC workspace while its documents are edited.
+"""
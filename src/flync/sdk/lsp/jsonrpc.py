@@ -0,0 +1,88 @@
+"""
+JSON-RPC 2.0 messages framed by ``Content-Length`` headers, as used by the
+Language Server Protocol.
+"""
+
+import json
+import threading
+from typing import Any, BinaryIO, Dict, Optional
+
+# error codes of the JSON-RPC and LSP specifications
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+SERVER_NOT_INITIALIZED = -32002
+
+
+def read_message(stream: BinaryIO) -> Optional[Dict[str, Any]]:
+    """Read the next message from a stream.
+
+    Args:
+        stream (BinaryIO): The stream, e.g. ``sys.stdin.buffer``.
+
+    Raises:
+        ValueError: If the header has no valid ``Content-Length`` or the \
+        body is no JSON. The stream can still be read afterwards.
+
+    Returns:
+        Dict[str, Any] | None: The decoded message, or None at the end of \
+        the stream.
+    """
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = value.strip()
+    if length is None or not length.isdigit():
+        raise ValueError("Message without valid Content-Length header.")
+    body = stream.read(int(length))
+    if len(body) < int(length):
+        return None
+    # JSON and UTF-8 decoding errors are ValueErrors as well
+    return json.loads(body.decode("utf-8"))
+
+
+class MessageWriter:
+    """Writes framed messages to a stream, safe for concurrent use."""
+
+    def __init__(self, stream: BinaryIO):
+        """Initialize the writer.
+
+        Args:
+            stream (BinaryIO): The stream, e.g. ``sys.stdout.buffer``.
+        """
+        self._stream = stream
+        self._lock = threading.Lock()
+
+    def write(self, message: Dict[str, Any]):
+        """Write a message."""
+        body = json.dumps(message, separators=(",", ":")).encode("utf-8")
+        header = f"Content-Length: {len(body)}\r\n\r\n".encode("ascii")
+        with self._lock:
+            self._stream.write(header + body)
+            self._stream.flush()
+
+    def notify(self, method: str, params: Any):
+        """Send a notification."""
+        self.write({"jsonrpc": "2.0", "method": method, "params": params})
+
+    def respond(self, request_id: Any, result: Any):
+        """Send the result of a request."""
+        self.write({"jsonrpc": "2.0", "id": request_id, "result": result})
+
+    def respond_error(self, request_id: Any, code: int, message: str):
+        """Send the error of a request."""
+        self.write(
+            {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {"code": code, "message": message},
+            }
+        )
@@ -0,0 +1,637 @@
+"""
+The FLYNC language server.
+
+Documents are synchronized incrementally. Edits are collected until the
+client has been quiet for the debounce interval, and then validated
+together on a worker thread: only the objects loaded from the edited
+documents, the objects containing them and the objects referencing them
+are validated again (see :meth:`FLYNCWorkspace.update_documents`). The
+diagnostics are positioned with the source map of the workspace.
+
+Names of ports, interfaces and other referable models are completed, and
+their definitions and references looked up, with the symbol table of the
+workspace (see :class:`~flync.sdk.workspace.symbols.SymbolTable`). These
+queries are answered from the workspace as last validated, without
+waiting for the edits still being collected.
+"""
+
+import re
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional
+from urllib.parse import unquote, urlparse
+
+from flync.sdk.workspace.cache import get_flync_version
+from flync.sdk.workspace.diagnostic import Diagnostic
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+from flync.sdk.workspace.source_map import SourcePosition
+from flync.sdk.workspace.symbols import Symbol
+
+from .jsonrpc import (
+    INTERNAL_ERROR,
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    SERVER_NOT_INITIALIZED,
+    MessageWriter,
+    read_message,
+)
+
+# seconds without edits before a burst of edits is validated
+DEFAULT_DEBOUNCE = 0.3
+
+# LSP constants
+TEXT_DOCUMENT_SYNC_INCREMENTAL = 2
+SEVERITY_ERROR = 1
+MESSAGE_TYPE_ERROR = 1
+COMPLETION_ITEM_KIND_REFERENCE = 18
+
+# requests answered from the validated workspace
+QUERIES = frozenset(
+    {
+        "textDocument/completion",
+        "textDocument/definition",
+        "textDocument/references",
+    }
+)
+
+# the characters of a name being completed
+NAME_PATTERN = re.compile(r"[\w.\-]*$")
+
+
+def uri_to_path(uri: str) -> Path:
+    """Convert a ``file`` URI into a path."""
+    return Path(unquote(urlparse(uri).path))
+
+
+def normalize_uri(uri: str) -> str:
+    """Return the URI the workspace uses for a client's document URI."""
+    if not uri.startswith("file:"):
+        return uri
+    return uri_to_path(uri).absolute().as_uri()
+
+
+def position_to_offset(text: str, line: int, character: int) -> int:
+    """Convert an LSP position into an index of a text.
+
+    Args:
+        text (str): The text.
+
+        line (int): The zero-based line.
+
+        character (int): The zero-based column in UTF-16 code units.
+
+    Returns:
+        int: The index, clamped to the end of the line or text.
+    """
+    start = 0
+    for _ in range(line):
+        newline = text.find("\n", start)
+        if newline < 0:
+            return len(text)
+        start = newline + 1
+    end = text.find("\n", start)
+    if end < 0:
+        end = len(text)
+    index, units = start, 0
+    while index < end and units < character:
+        units += 2 if ord(text[index]) > 0xFFFF else 1
+        index += 1
+    return index
+
+
+def apply_change(text: str, change: Dict[str, Any]) -> str:
+    """Apply a ``TextDocumentContentChangeEvent`` to a text.
+
+    Args:
+        text (str): The current text.
+
+        change (Dict[str, Any]): The change, either a replaced range or \
+        the full new text.
+
+    Returns:
+        str: The changed text.
+    """
+    changed_range = change.get("range")
+    if changed_range is None:
+        return change["text"]
+    start = position_to_offset(
+        text,
+        changed_range["start"]["line"],
+        changed_range["start"]["character"],
+    )
+    end = position_to_offset(
+        text,
+        changed_range["end"]["line"],
+        changed_range["end"]["character"],
+    )
+    return text[:start] + change["text"] + text[end:]
+
+
+def to_lsp_location(position: SourcePosition, text: str) -> Dict[str, Any]:
+    """Convert a position into an LSP location spanning to the line end.
+
+    Args:
+        position (SourcePosition): The position.
+
+        text (str): The text of its document.
+
+    Returns:
+        Dict[str, Any]: The LSP location.
+    """
+    line, character = position.line - 1, position.column - 1
+    lines = text.splitlines()
+    end = len(lines[line]) if line < len(lines) else character
+    return {
+        "uri": position.uri,
+        "range": {
+            "start": {"line": line, "character": character},
+            "end": {"line": line, "character": max(end, character)},
+        },
+    }
+
+
+def to_lsp_diagnostic(diagnostic: Diagnostic, text: str) -> Dict[str, Any]:
+    """Convert a diagnostic into an LSP diagnostic.
+
+    The range spans from the diagnostic's position to the end of its line.
+    Diagnostics without a position are shown at the start of the document.
+
+    Args:
+        diagnostic (Diagnostic): The diagnostic.
+
+        text (str): The text of its document.
+
+    Returns:
+        Dict[str, Any]: The LSP diagnostic.
+    """
+    line = character = end = 0
+    if diagnostic.line is not None:
+        line = diagnostic.line - 1
+        character = (diagnostic.column or 1) - 1
+        lines = text.splitlines()
+        end = len(lines[line]) if line < len(lines) else character
+    message = diagnostic.message
+    loc = diagnostic.error.get("loc", ())
+    if loc:
+        message += f" ({'.'.join(str(p) for p in loc)})"
+    return {
+        "range": {
+            "start": {"line": line, "character": character},
+            "end": {"line": line, "character": max(end, character)},
+        },
+        "severity": SEVERITY_ERROR,
+        "code": diagnostic.error.get("type", ""),
+        "source": "flync",
+        "message": message,
+    }
+
+
+class FLYNCLanguageServer:
+    """A language server for one FLYNC workspace.
+
+    The calling thread reads the client's messages, while edits are
+    validated on a worker thread. Queries of the workspace are answered on
+    a third thread, from the workspace as last validated: they wait for
+    the initial load and for a validation in progress, but not for edits
+    still being collected.
+
+    Attributes:
+        workspace (FLYNCWorkspace | None): The workspace, created when the \
+        client initializes the server.
+
+        debounce (float): Seconds without edits before they are validated.
+    """
+
+    def __init__(
+        self,
+        reader: BinaryIO,
+        writer: BinaryIO,
+        debounce: float = DEFAULT_DEBOUNCE,
+    ):
+        """Initialize the server.
+
+        Args:
+            reader (BinaryIO): The stream of client messages, e.g. \
+            ``sys.stdin.buffer``.
+
+            writer (BinaryIO): The stream to the client, e.g. \
+            ``sys.stdout.buffer``.
+
+            debounce (float): Seconds without edits before they are \
+            validated.
+        """
+        self.workspace: Optional[FLYNCWorkspace] = None
+        self.debounce = debounce
+        self._reader = reader
+        self._writer = MessageWriter(writer)
+        self._handlers: Dict[str, Callable[[Any], Any]] = {
+            "initialize": self._initialize,
+            "initialized": self._initialized,
+            "shutdown": self._shutdown,
+            "textDocument/didOpen": self._did_open,
+            "textDocument/didChange": self._did_change,
+            "textDocument/didClose": self._did_close,
+            "textDocument/didSave": lambda params: None,
+            "textDocument/completion": self._completion,
+            "textDocument/definition": self._definition,
+            "textDocument/references": self._references,
+        }
+        # texts of the documents open in the client
+        self._texts: Dict[str, str] = {}
+        # state shared with the worker, guarded by the condition
+        self._condition = threading.Condition()
+        self._pending: Dict[str, str] = {}
+        self._load_requested = False
+        self._loaded = False
+        # whether the initial load is done
+        self._ready = False
+        self._last_change = 0.0
+        self._running = False
+        self._busy = False
+        # diagnostics last published per document
+        self._published: Dict[str, List[Dict[str, Any]]] = {}
+        self._shutdown_requested = False
+        self._worker: Optional[threading.Thread] = None
+        self._queries: Optional[ThreadPoolExecutor] = None
+        # held while the workspace is validated or queried
+        self._workspace_lock = threading.Lock()
+
+    def serve(self) -> int:
+        """Handle client messages until the client exits.
+
+        Returns:
+            int: The exit code: 0 if the client shut the server down \
+            before exiting, 1 otherwise.
+        """
+        self._running = True
+        self._worker = threading.Thread(
+            target=self._work, name="flync-lsp-validation", daemon=True
+        )
+        self._worker.start()
+        self._queries = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="flync-lsp-query"
+        )
+        try:
+            while True:
+                try:
+                    message = read_message(self._reader)
+                except ValueError as e:
+                    self._writer.respond_error(None, PARSE_ERROR, str(e))
+                    continue
+                if message is None:
+                    break
+                if not isinstance(message, dict):
+                    self._writer.respond_error(
+                        None, INVALID_REQUEST, "Message is no JSON object."
+                    )
+                    continue
+                if message.get("method") == "exit":
+                    break
+                self._dispatch(message)
+        finally:
+            with self._condition:
+                self._running = False
+                self._condition.notify_all()
+            self._worker.join()
+            self._queries.shutdown()
+        return 0 if self._shutdown_requested else 1
+
+    def wait_until_idle(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all received edits are validated and published.
+
+        Args:
+            timeout (float, optional): The maximum time to wait in seconds.
+
+        Returns:
+            bool: False if the timeout expired first.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not (
+                    self._pending or self._load_requested or self._busy
+                ),
+                timeout,
+            )
+
+    # region messages
+    def _dispatch(self, message: Dict[str, Any]):
+        method = message.get("method")
+        if method is None:
+            # a response to a request of the server
+            return
+        handler = self._handlers.get(method)
+        params = message.get("params") or {}
+        if "id" not in message:
+            if handler is not None:
+                try:
+                    handler(params)
+                except Exception:
+                    self._log_exception(method)
+            return
+        request_id = message["id"]
+        if handler is None:
+            self._writer.respond_error(
+                request_id, METHOD_NOT_FOUND, f"Unknown method {method}."
+            )
+            return
+        if self.workspace is None and method not in ("initialize", "shutdown"):
+            self._writer.respond_error(
+                request_id, SERVER_NOT_INITIALIZED, "Not initialized."
+            )
+            return
+        if method in QUERIES:
+            # answered off the reader, which keeps receiving edits
+            self._queries.submit(
+                self._respond, request_id, method, handler, params
+            )
+        else:
+            self._respond(request_id, method, handler, params)
+
+    def _respond(
+        self,
+        request_id: Any,
+        method: str,
+        handler: Callable[[Any], Any],
+        params: Any,
+    ):
+        try:
+            result = handler(params)
+        except Exception as e:
+            self._log_exception(method)
+            self._writer.respond_error(
+                request_id, INTERNAL_ERROR, f"{type(e).__name__}: {e}"
+            )
+            return
+        self._writer.respond(request_id, result)
+
+    def _log_exception(self, context: str):
+        self._writer.notify(
+            "window/logMessage",
+            {
+                "type": MESSAGE_TYPE_ERROR,
+                "message": f"{context} failed:\n{traceback.format_exc()}",
+            },
+        )
+
+    def _initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        root_uri = params.get("rootUri")
+        folders = params.get("workspaceFolders") or []
+        if root_uri is None and folders:
+            root_uri = folders[0]["uri"]
+        if root_uri is not None:
+            root = uri_to_path(root_uri)
+        elif params.get("rootPath"):
+            root = Path(params["rootPath"])
+        else:
+            raise ValueError("The client did not send a workspace root.")
+        self.workspace = FLYNCWorkspace(root.name or "flync", root)
+        return {
+            "capabilities": {
+                "textDocumentSync": {
+                    "openClose": True,
+                    "change": TEXT_DOCUMENT_SYNC_INCREMENTAL,
+                    "save": {"includeText": False},
+                },
+                "completionProvider": {},
+                "definitionProvider": True,
+                "referencesProvider": True,
+            },
+            "serverInfo": {"name": "flync", "version": get_flync_version()},
+        }
+
+    def _initialized(self, params: Dict[str, Any]):
+        with self._condition:
+            self._load_requested = True
+            self._condition.notify_all()
+
+    def _shutdown(self, params: Any) -> None:
+        self._shutdown_requested = True
+        return None
+
+    def _did_open(self, params: Dict[str, Any]):
+        document = params["textDocument"]
+        uri = normalize_uri(document["uri"])
+        self._texts[uri] = document["text"]
+        self._queue(uri, document["text"])
+
+    def _did_change(self, params: Dict[str, Any]):
+        uri = normalize_uri(params["textDocument"]["uri"])
+        text = self._texts.get(uri, "")
+        for change in params["contentChanges"]:
+            text = apply_change(text, change)
+        self._texts[uri] = text
+        self._queue(uri, text)
+
+    def _did_close(self, params: Dict[str, Any]):
+        uri = normalize_uri(params["textDocument"]["uri"])
+        self._texts.pop(uri, None)
+        # unsaved edits are dropped, the file on disk applies again
+        path = uri_to_path(uri)
+        if path.is_file():
+            self._queue(uri, path.read_text(encoding="utf-8"))
+
+    def _queue(self, uri: str, text: str):
+        with self._condition:
+            self._pending[uri] = text
+            self._last_change = time.monotonic()
+            self._condition.notify_all()
+
+    # endregion
+    # region queries
+    @contextmanager
+    def _validated_workspace(self) -> Iterator[FLYNCWorkspace]:
+        """Hold the workspace once it is loaded and not being validated."""
+        with self._condition:
+            self._condition.wait_for(lambda: not self._running or self._ready)
+        with self._workspace_lock:
+            yield self.workspace
+
+    def _symbol_at(self, params: Dict[str, Any]) -> Optional[Symbol]:
+        """Return the symbol at the position of a request."""
+        position = params["position"]
+        return self.workspace.symbol_at(
+            normalize_uri(params["textDocument"]["uri"]),
+            position["line"] + 1,
+            position["character"] + 1,
+        )
+
+    def _locations(self, symbols: List[Symbol]) -> List[Dict[str, Any]]:
+        locations = []
+        for symbol in symbols:
+            position = self.workspace.symbols.locate(symbol)
+            if position is None:
+                continue
+            doc = self.workspace.documents.get(position.uri)
+            locations.append(
+                to_lsp_location(position, doc.text if doc else "")
+            )
+        return locations
+
+    def _completion(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        uri = normalize_uri(params["textDocument"]["uri"])
+        position = params["position"]
+        text = self._texts.get(uri, "")
+        offset = position_to_offset(
+            text, position["line"], position["character"]
+        )
+        line_start = text.rfind("\n", 0, offset) + 1
+        prefix = NAME_PATTERN.search(text[line_start:offset]).group()
+        with self._validated_workspace():
+            symbol = self._symbol_at(params)
+            # a name of the kind the edited field refers to
+            kind = None
+            if symbol is not None and not symbol.definition:
+                kind = symbol.kind
+            definitions = self.workspace.symbols.complete(prefix, kind)
+        return [
+            {
+                "label": definition.name,
+                "kind": COMPLETION_ITEM_KIND_REFERENCE,
+                "detail": f"{definition.kind} ({definition.object_id})",
+            }
+            for definition in definitions
+        ]
+
+    def _definition(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        with self._validated_workspace():
+            symbol = self._symbol_at(params)
+            if symbol is None:
+                return []
+            return self._locations(
+                self.workspace.symbols.definitions(symbol.kind, symbol.name)
+            )
+
+    def _references(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        include_declaration = (params.get("context") or {}).get(
+            "includeDeclaration", False
+        )
+        with self._validated_workspace():
+            symbol = self._symbol_at(params)
+            if symbol is None:
+                return []
+            symbols = self.workspace.symbols
+            found = symbols.references(symbol.kind, symbol.name)
+            if include_declaration:
+                found = symbols.definitions(symbol.kind, symbol.name) + found
+            return self._locations(found)
+
+    # endregion
+    # region validation
+    def _work(self):
+        while True:
+            with self._condition:
+                self._busy = False
+                self._ready = self._loaded
+                self._condition.notify_all()
+                # edits before the first load are validated with it
+                self._condition.wait_for(
+                    lambda: not self._running
+                    or self._load_requested
+                    or (self._loaded and self._pending)
+                )
+                if not self._running:
+                    return
+                # wait for the end of a burst of edits, but not with the
+                # initial load, which the queries are waiting for
+                while (
+                    self._running
+                    and self._pending
+                    and not self._load_requested
+                ):
+                    quiet = self._last_change + self.debounce
+                    remaining = quiet - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                load, self._load_requested = self._load_requested, False
+                pending, self._pending = self._pending, {}
+                self._loaded |= load
+                self._busy = True
+            try:
+                with self._workspace_lock:
+                    self._validate(load, pending)
+            except Exception:
+                self._log_exception("Validation")
+
+    def _validate(self, load: bool, pending: Dict[str, str]):
+        workspace = self.workspace
+        if workspace is None:
+            return
+        if load:
+            workspace.load()
+        # documents created after the load are added to their folder's object
+        created = [
+            path
+            for path in map(uri_to_path, pending)
+            if path.as_uri() not in workspace.documents
+            and self._is_workspace_file(path)
+        ]
+        if created:
+            workspace.apply_file_changes(created=created)
+        changed = {
+            uri: text
+            for uri, text in pending.items()
+            if uri in workspace.documents
+            and workspace.documents[uri].text != text
+        }
+        if changed:
+            workspace.update_documents(changed)
+        if load or created or changed:
+            self._publish()
+
+    def _is_workspace_file(self, path: Path) -> bool:
+        """Whether a file on disk is a FLYNC document of the workspace."""
+        workspace = self.workspace
+        return (
+            path.is_file()
+            and path.name.endswith(
+                workspace.configuration.flync_file_extension
+            )
+            and path.is_relative_to(workspace.workspace_root)
+        )
+
+    def _publish(self):
+        """Publish the diagnostics of every document that changed."""
+        workspace = self.workspace
+        by_uri: Dict[str, List[Dict[str, Any]]] = {}
+        for diagnostic in workspace.diagnostics:
+            doc = workspace.documents.get(diagnostic.uri)
+            text = doc.text if doc is not None else ""
+            by_uri.setdefault(diagnostic.uri, []).append(
+                to_lsp_diagnostic(diagnostic, text)
+            )
+        for uri in list(self._published) + list(by_uri):
+            diagnostics = by_uri.get(uri, [])
+            if self._published.get(uri) == diagnostics:
+                continue
+            if diagnostics:
+                self._published[uri] = diagnostics
+            else:
+                self._published.pop(uri, None)
+            self._writer.notify(
+                "textDocument/publishDiagnostics",
+                {"uri": uri, "diagnostics": diagnostics},
+            )
+
+    # endregion
+
+
+def main(debounce: float = DEFAULT_DEBOUNCE) -> int:
+    """Run the language server on stdin and stdout.
+
+    Args:
+        debounce (float): Seconds without edits before they are validated.
+
+    Returns:
+        int: The exit code.
+    """
+    server = FLYNCLanguageServer(
+        sys.stdin.buffer, sys.stdout.buffer, debounce=debounce
+    )
+    return server.serve()
@@ -0,0 +1,185 @@
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+from flync.core.base_models import (
+    DictInstances,
+    ListInstances,
+    NamedDictInstances,
+    NamedListInstances,
+    UniqueName,
+    get_registry_context,
+)
+from flync.model.address_index import AddressOwner
+from flync.model.flync_4_ecu import Controller
+from flync.model.flync_4_someip import SOMEIPEvent
+
+
+def iter_models(value: Any) -> Iterator[BaseModel]:
+    """Yield every model of a tree, children before their parents.
+
+    This is the order in which pydantic runs the ``after`` validators that
+    fill the registries.
+    """
+    if isinstance(value, BaseModel):
+        for field_name in type(value).model_fields:
+            yield from iter_models(getattr(value, field_name, None))
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from iter_models(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from iter_models(item)
+
+
+def register_models(models: Iterable[BaseModel]) -> bool:
+    """Register models that were created without validation.
+
+    Fills the global registries exactly as the validators would.
+
+    Args:
+        models (Iterable[BaseModel]): The models, children first.
+
+    Returns:
+        bool: ``False`` if a name is already registered. In that case \
+        nothing is registered.
+    """
+    models = list(models)
+    names = [m.get_key() for m in models if isinstance(m, UniqueName)]
+    if any(name in UniqueName.NAMES for name in names):
+        return False
+    for m in models:
+        if isinstance(m, UniqueName):
+            UniqueName.NAMES.add(m.get_key())
+        if isinstance(m, NamedDictInstances):
+            type(m).INSTANCES[m.get_instance_key()] = m
+        elif isinstance(m, DictInstances):
+            type(m).INSTANCES[m.get_dict_key()] = m
+        elif isinstance(m, (ListInstances, NamedListInstances)):
+            type(m).INSTANCES.append(m)
+        if isinstance(m, SOMEIPEvent):
+            SOMEIPEvent.INSTANCES_BY_NAME[m.name] = m
+        if isinstance(m, Controller):
+            m.register_addresses()
+    return True
+
+
+def unregister_models(models: Iterable[BaseModel]):
+    """Remove models from the global registries.
+
+    Entries that were meanwhile replaced by another instance are kept.
+
+    Args:
+        models (Iterable[BaseModel]): The models to remove.
+
+    Returns: None
+    """
+    for m in models:
+        if isinstance(m, UniqueName):
+            UniqueName.NAMES.discard(m.get_key())
+        if isinstance(m, NamedDictInstances):
+            if type(m).INSTANCES.get(m.get_instance_key()) is m:
+                del type(m).INSTANCES[m.get_instance_key()]
+        elif isinstance(m, DictInstances):
+            if type(m).INSTANCES.get(m.get_dict_key()) is m:
+                del type(m).INSTANCES[m.get_dict_key()]
+        elif isinstance(m, (ListInstances, NamedListInstances)):
+            instances = type(m).INSTANCES
+            for idx, instance in enumerate(instances):
+                if instance is m:
+                    del instances[idx]
+                    break
+        if isinstance(m, SOMEIPEvent):
+            if SOMEIPEvent.INSTANCES_BY_NAME.get(m.name) is m:
+                del SOMEIPEvent.INSTANCES_BY_NAME[m.name]
+        if isinstance(m, Controller):
+            m.unregister_addresses()
+
+
+def _registry_entries(container: Any) -> Iterator[Tuple[Any, Any]]:
+    """Yield an identity and the owning model of every registry entry.
+
+    Sets hold names, whose owner is not known. The models of address
+    entries are their controllers.
+    """
+    if isinstance(container, set):
+        for name in container:
+            yield name, None
+    elif isinstance(container, dict):
+        for key, value in container.items():
+            if isinstance(value, AddressOwner):
+                value = value.controller
+            yield (key, id(value)), value
+    elif isinstance(container, list):
+        for value in container:
+            yield id(value), value
+
+
+def _is_owned(entry: Any, owner: Any, live: set, names: set) -> bool:
+    if owner is None:
+        return entry in names
+    return id(owner) in live
+
+
+def stray_entries(models: Iterable[BaseModel]) -> Dict[Any, Set[Any]]:
+    """Return the entries of the active registries not owned by given models.
+
+    Args:
+        models (Iterable[BaseModel]): All models that are still alive.
+
+    Returns:
+        Dict[Any, Set[Any]]: The identities of the entries left behind by \
+        failed validations, per registry. Can be kept by \
+        :func:`retain_models`.
+    """
+    live = {id(m): m for m in models}
+    names = {m.get_key() for m in live.values() if isinstance(m, UniqueName)}
+    return {
+        registry: {
+            entry
+            for entry, owner in _registry_entries(container)
+            if not _is_owned(entry, owner, live.keys(), names)
+        }
+        for registry, container in get_registry_context().items()
+    }
+
+
+def retain_models(
+    models: Iterable[BaseModel],
+    strays: Optional[Dict[Any, Set[Any]]] = None,
+):
+    """Drop every entry of the active registries not owned by given models.
+
+    Cleans up the registrations left behind by validations that failed
+    half-way through a tree.
+
+    Args:
+        models (Iterable[BaseModel]): All models that are still alive.
+
+        strays (Dict[Any, Set[Any]], optional): Entries to keep although \
+        no model owns them, as returned by :func:`stray_entries`.
+
+    Returns: None
+    """
+    live = {id(m): m for m in models}
+    names = {m.get_key() for m in live.values() if isinstance(m, UniqueName)}
+    strays = strays or {}
+    for registry, container in get_registry_context().items():
+        kept = strays.get(registry, set())
+        dropped = [
+            entry
+            for entry, owner in _registry_entries(container)
+            if entry not in kept
+            and not _is_owned(entry, owner, live.keys(), names)
+        ]
+        if not dropped:
+            continue
+        if isinstance(container, set):
+            container.difference_update(dropped)
+        elif isinstance(container, dict):
+            for key, _ in dropped:
+                del container[key]
+        else:
+            dropped_ids = set(dropped)
+            container[:] = [v for v in container if id(v) not in dropped_ids]
@@ -0,0 +1,274 @@
+"""
+Content-addressed on-disk cache for FLYNC workspaces.
+
+Stores the parsed YAML of every document and the validated model of
+self-contained External sub-trees, keyed by a hash of the document text,
+the FLYNC version and the pydantic version.
+
+Parsed documents are stored as JSON. Validated models are pickled, and
+every pickle is signed with an HMAC so that only entries written with the
+same secret are ever unpickled. The secret is read from the
+``FLYNC_CACHE_KEY`` environment variable, or else from a key file private
+to the user (``~/.flync/cache.key``), which is created on first use. A
+cache directory shared between machines, e.g. restored in CI, therefore
+only yields model hits if all of them use the same ``FLYNC_CACHE_KEY``;
+entries signed with another key behave like misses.
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import pickle
+import secrets
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+import pydantic
+
+from flync.core.base_models import FLYNCBaseModel
+from flync.model.flync_4_ecu import Controller, Switch
+from flync.model.flync_4_someip import SOMEIPServiceInterface
+from flync.sdk.utils.registry_utils import iter_models, register_models
+
+# Sub-trees whose validation only depends on their own document. Their
+# validated models can be restored from the cache without re-validation.
+CACHEABLE_TYPES: Tuple[type[FLYNCBaseModel], ...] = (
+    Controller,
+    Switch,
+    SOMEIPServiceInterface,
+)
+
+_MISS = object()
+
+# environment variable holding the secret that signs the model entries
+CACHE_KEY_ENV = "FLYNC_CACHE_KEY"
+CACHE_KEY_FILE = Path.home() / ".flync" / "cache.key"
+_DIGEST_SIZE = hashlib.sha256().digest_size
+
+
+def get_cache_secret() -> bytes:
+    """Return the secret signing the model entries of the cache.
+
+    Returns:
+        bytes: The value of ``FLYNC_CACHE_KEY`` if it is set, else the \
+        content of the user's key file, created with a random key if it \
+        does not exist. If the key file cannot be written, a random key \
+        valid for the current process only.
+    """
+    secret = os.environ.get(CACHE_KEY_ENV)
+    if secret:
+        return secret.encode("utf-8")
+    try:
+        return CACHE_KEY_FILE.read_bytes()
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return secrets.token_bytes(32)
+    secret = secrets.token_bytes(32)
+    try:
+        CACHE_KEY_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(
+            CACHE_KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600
+        )
+    except FileExistsError:
+        # created concurrently by another process
+        return CACHE_KEY_FILE.read_bytes()
+    except OSError:
+        return secret
+    with os.fdopen(fd, "wb") as f:
+        f.write(secret)
+    return secret
+
+
+def _is_json_data(value: Any) -> bool:
+    """Whether parsed YAML survives a JSON round trip unchanged."""
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            if not all(isinstance(k, str) for k in value):
+                return False
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif value is not None and type(value) not in (str, int, float, bool):
+            return False
+    return True
+
+
+def get_flync_version() -> str:
+    """Return the installed FLYNC version, or ``"unknown"``."""
+    try:
+        return version("flync")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class WorkspaceCache:
+    """On-disk cache of parsed documents and validated sub-trees.
+
+    The cache only holds plain paths, strings and bytes, so it can be
+    passed to process pool workers.
+
+    Attributes:
+        cache_dir (Path): The directory holding the cache entries.
+
+        flync_version (str): The FLYNC version that is part of every key.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str,
+        flync_version: Optional[str] = None,
+        secret: Optional[bytes] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir (Path | str): The directory holding the cache entries. \
+            Created if it does not exist.
+
+            flync_version (str, optional): Overrides the FLYNC version used \
+            in the keys.
+
+            secret (bytes, optional): The secret signing the model entries. \
+            Defaults to :func:`get_cache_secret`.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.flync_version = flync_version or get_flync_version()
+        self._secret = secret or get_cache_secret()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def key(self, kind: str, text: str) -> str:
+        """Compute the key of a cache entry.
+
+        Args:
+            kind (str): The kind of the entry (e.g. ``"yaml"`` or the \
+            qualified name of a model class).
+
+            text (str): The document text the entry is derived from.
+
+        Returns:
+            str: The hexadecimal SHA-256 key.
+        """
+        h = hashlib.sha256()
+        for part in (self.flync_version, pydantic.VERSION, kind, text):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _entry_path(self, key: str, suffix: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{suffix}"
+
+    def _read(self, key: str, suffix: str) -> Optional[bytes]:
+        try:
+            return self._entry_path(key, suffix).read_bytes()
+        except OSError:
+            return None
+
+    def _write(self, key: str, suffix: str, content: bytes):
+        entry_path = self._entry_path(key, suffix)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so readers never see partial data
+        fd, tmp_name = tempfile.mkstemp(dir=entry_path.parent)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_name, entry_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _sign(self, payload: bytes) -> bytes:
+        return hmac.new(self._secret, payload, hashlib.sha256).digest()
+
+    def _load_signed(self, key: str) -> Any:
+        """Unpickle an entry, only if it was signed with our secret."""
+        content = self._read(key, ".pickle")
+        if content is None or len(content) < _DIGEST_SIZE:
+            return _MISS
+        digest, payload = content[:_DIGEST_SIZE], content[_DIGEST_SIZE:]
+        if not hmac.compare_digest(digest, self._sign(payload)):
+            return _MISS
+        try:
+            return pickle.loads(payload)
+        except Exception:
+            # an incompatible entry behaves like a miss
+            return _MISS
+
+    def _store_signed(self, key: str, value: Any):
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._write(key, ".pickle", self._sign(payload) + payload)
+
+    def parse(self, text: str, parser) -> Any:
+        """Return the parsed YAML of a text, parsing it only on a miss.
+
+        Args:
+            text (str): The YAML text.
+
+            parser (Callable[[str], Any]): The function parsing the text.
+
+        Returns:
+            Any: The parsed content.
+        """
+        key = self.key("yaml", text)
+        content = self._read(key, ".json")
+        if content is not None:
+            try:
+                return json.loads(content)
+            except ValueError:
+                pass
+        data = parser(text)
+        # e.g. dates or integer keys are not cached, they would change
+        if _is_json_data(data):
+            self._write(key, ".json", json.dumps(data).encode("utf-8"))
+        return data
+
+    @staticmethod
+    def is_cacheable(model_type: type) -> bool:
+        """Whether validated models of a type can be stored in the cache."""
+        return model_type in CACHEABLE_TYPES
+
+    def load_model(
+        self, model_type: type[FLYNCBaseModel], text: str
+    ) -> Optional[FLYNCBaseModel]:
+        """Restore a validated sub-tree and register it.
+
+        Args:
+            model_type (type[FLYNCBaseModel]): The type of the sub-tree.
+
+            text (str): The text of the document the sub-tree is loaded from.
+
+        Returns:
+            FLYNCBaseModel | None: The restored model, or None on a miss.
+        """
+        model = self._load_signed(self.key(model_type.__qualname__, text))
+        if not isinstance(model, model_type):
+            return None
+        # registered like a cold load would; a name clash means the tree has
+        # to be validated again so that the conflict gets reported
+        if not register_models(iter_models(model)):
+            return None
+        return model
+
+    def store_model(
+        self,
+        model_type: type[FLYNCBaseModel],
+        text: str,
+        model: FLYNCBaseModel,
+    ):
+        """Store a freshly validated sub-tree.
+
+        Args:
+            model_type (type[FLYNCBaseModel]): The type of the sub-tree.
+
+            text (str): The text of the document the sub-tree is loaded from.
+
+            model (FLYNCBaseModel): The validated model.
+
+        Returns: None
+        """
+        self._store_signed(self.key(model_type.__qualname__, text), model)
@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+from pydantic_core import ErrorDetails
+
+
+@dataclass(frozen=True)
+class Diagnostic:
+    """A validation finding reported for a workspace document.
+
+    Attributes:
+        uri (str): The URI of the document the finding belongs to.
+
+        object_id (str | None): The id of the workspace object whose \
+        validation reported the finding, or None for document level \
+        findings such as YAML syntax errors.
+
+        error (ErrorDetails): The details of the error.
+
+        line (int | None): The one-based line of the document the error \
+        refers to, or None if unknown.
+
+        column (int | None): The one-based column of the document the \
+        error refers to, or None if unknown.
+    """
+
+    uri: str
+    object_id: str | None
+    error: ErrorDetails
+    line: int | None = None
+    column: int | None = None
+
+    @property
+    def message(self) -> str:
+        """The human readable message of the finding."""
+        return self.error.get("msg", "")
+
+    @property
+    def source(self) -> str:
+        """The document path and position, e.g. ``ecu.flync.yaml:3:5``."""
+        parsed = urlparse(self.uri)
+        path = str(Path(unquote(parsed.path))) if parsed.scheme else self.uri
+        if self.line is None:
+            return path
+        return f"{path}:{self.line}:{self.column}"
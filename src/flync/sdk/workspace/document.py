@@ -1,21 +1,68 @@
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, Optional
 
+import yaml
 from ruamel.yaml import YAML
+from ruamel.yaml import YAMLError as RoundTripError
 
-yaml = YAML()
+from .source_map import NodePath, Position, index_positions
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+# ruamel's YAML objects keep parser state, one is needed per thread
+_round_trip = threading.local()
+
+
+def round_trip_load(text: str) -> Any:
+    """Parse YAML text into a round-trip tree, with the thread's parser.
+
+    Args:
+        text (str): The raw YAML content.
+
+    Returns:
+        Any: The round-trip tree.
+    """
+    yaml_parser = getattr(_round_trip, "yaml", None)
+    if yaml_parser is None:
+        yaml_parser = _round_trip.yaml = YAML()
+    return yaml_parser.load(text)
+
+
+def parse_yaml(text: str) -> Any:
+    """Parse YAML text with the fastest available safe loader.
+
+    Args:
+        text (str): The raw YAML content.
+
+    Returns:
+        Any: The parsed YAML content.
+    """
+    return yaml.load(text, Loader=SafeLoader)
 
 
 class Document:
     """Represents a YAML document with parsing capabilities.
 
+    The text is parsed once into plain Python data. The round-trip
+    abstract syntax tree, which carries line and column information, is
+    only built when it is accessed.
+
     Attributes:
         uri (str): The unique identifier for the document.
 
         text (str): The raw YAML content.
 
-        ast (Any | None): The parsed abstract syntax tree, or \
-        None if not parsed.
+        data (Any): The parsed YAML content.
+
+        ast (Any | None): The round-trip abstract syntax tree, or \
+        None if the document is empty.
+
+        positions (Dict[NodePath, Position]): The zero-based line and \
+        column of every node of the text, by its path.
     """
 
     def __init__(self, uri: Path | str, text: str):
@@ -27,14 +74,42 @@ class Document:
         """
         self.uri = uri
         self.text = text
-        self.ast: Any | None = None
+        self.data: Any = None
+        self._ast: Any | None = None
+        self._positions: Optional[Dict[NodePath, Position]] = None
+
+    @property
+    def ast(self) -> Any | None:
+        """The round-trip abstract syntax tree, built on first access."""
+        if self._ast is None and isinstance(self.text, str) and self.text:
+            self._ast = round_trip_load(self.text)
+        return self._ast
+
+    @property
+    def positions(self) -> Dict[NodePath, Position]:
+        """The position index of the text, built on first access.
+
+        Uses the round-trip tree if it was already built, but does not
+        keep a tree built for the index. Empty if the text is no valid YAML.
+        """
+        if self._positions is None:
+            root = self._ast
+            if root is None and isinstance(self.text, str) and self.text:
+                try:
+                    root = round_trip_load(self.text)
+                except RoundTripError:
+                    root = None
+            self._positions = index_positions(root)
+        return self._positions
 
     def parse(self):
-        """Parse the YAML text into an abstract syntax tree.
+        """Parse the YAML text into plain Python data.
 
         Returns: None
         """
-        self.ast = yaml.load(self.text)
+        self._ast = None
+        self._positions = None
+        self.data = parse_yaml(self.text)
 
     def update_text(self, text: str):
         """Update the document's text and re-parse it.
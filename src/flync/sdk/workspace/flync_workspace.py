@@ -4,29 +4,145 @@ Workspace module for FLYNC SDK.
 Provides classes and functions to manage workspace operations.
 """
 
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional, Union, get_args, get_origin
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import yaml
+from pydantic import BaseModel, RootModel
 from pydantic_core import ErrorDetails, ValidationError
 
-from flync.core.annotations import (
-    External,
-    Implied,
-    ImpliedStrategy,
-    NamingStrategy,
-    OutputStrategy,
-)
+from flync.core.annotations import External, OutputStrategy
+from flync.core.base_models import RegistryContext
 from flync.core.base_models.base_model import FLYNCBaseModel
 from flync.core.utils.exceptions_handling import (
     errors_to_init_errors,
     validate_with_policy,
 )
+from flync.core.utils.link_rules import (
+    LinkQueue,
+    defer_link_rules,
+    get_link_rules,
+    run_link_rules,
+)
+from flync.core.utils.profiling import get_active_profiler
 from flync.model.flync_model import FLYNCModel
 from flync.sdk.context.workspace_config import WorkspaceConfiguration
-from flync.sdk.utils.field_utils import get_metadata
+from flync.sdk.utils.registry_utils import (
+    retain_models,
+    stray_entries,
+    unregister_models,
+)
+
+from .cache import WorkspaceCache
+from .diagnostic import Diagnostic
+from .document import Document, parse_yaml
+from .load_plan import TypePlan, get_load_plan, select_union_member
+from .source_map import NodePath, Position, SourceMap, SourcePosition
+from .symbols import Symbol, SymbolTable, collect_symbols
+from .watcher import (
+    DEFAULT_INTERVAL,
+    DEFAULT_QUIET,
+    WorkspaceChange,
+    WorkspaceWatcher,
+)
+
+# id of a loaded object: its path relative to the workspace root
+ObjectId = str
+
+
+def _read_flync_file(
+    path: Path, cache: Optional[WorkspaceCache] = None
+) -> Tuple[str, Any, Tuple[float, float]]:
+    """Read a FLYNC document from disk and parse its YAML content.
+
+    Defined at module level so it can be shipped to a process pool. The
+    time spent is measured where the document is parsed, so that waiting
+    for a worker is not counted as parsing.
+
+    Args:
+        path (Path): The path of the ``.flync.yaml`` file.
+
+        cache (WorkspaceCache, optional): Cache of already parsed texts.
+
+    Returns:
+        Tuple[str, Any, Tuple[float, float]]: The raw text, the parsed \
+        YAML content and the ``time.perf_counter`` values before and \
+        after reading it.
+    """
+    start = time.perf_counter()
+    text = path.read_text(encoding="utf-8")
+    if cache is not None:
+        content = cache.parse(text, parse_yaml)
+    else:
+        content = parse_yaml(text)
+    return text, content, (start, time.perf_counter())
+
+
+def _iter_references(value: Any) -> Iterator[BaseModel]:
+    """Yield the models directly referenced by a value."""
+    if isinstance(value, BaseModel):
+        yield value
+    elif isinstance(value, (list, tuple, set)):
+        for item in value:
+            yield from _iter_references(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_references(item)
+
+
+def _replace_value(values: dict, old: Any, new: Any) -> bool:
+    """Replace an object within the values of a dict, or of its lists.
+
+    Args:
+        values (dict): The dict, e.g. the fields of a model.
 
-from .document import Document
+        old (Any): The object, compared by identity.
+
+        new (Any): The replacement.
+
+    Returns:
+        bool: Whether the object was found.
+    """
+    for key, value in values.items():
+        if value is old:
+            values[key] = new
+            return True
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                if item is old:
+                    value[index] = new
+                    return True
+        elif isinstance(value, dict):
+            for item_key, item in value.items():
+                if item is old:
+                    value[item_key] = new
+                    return True
+    return False
+
+
+@dataclass
+class _LoadUnit:
+    """A file or folder of the workspace that is validated as one model."""
+
+    path: Path
+    model_type: type[FLYNCBaseModel]
+    parent: Optional[ObjectId]
+    children: List[ObjectId] = field(default_factory=list)
 
 
 class FLYNCWorkspace:
@@ -41,17 +157,35 @@ class FLYNCWorkspace:
         documents (Dict[str, Document]): Mapping of document URIs to Document \
         objects.
 
-        objects (Dict[ObjectId, SemanticObject]): Semantic objects indexed by \
-        ObjectId.
+        objects (Dict[ObjectId, FLYNCBaseModel | None]): The validated \
+        model of every loaded file or folder, indexed by its path relative \
+        to the workspace root. None if the validation failed.
+
+        sources (Dict[ObjectId, List[str]]): URIs of the documents read \
+        while loading an object, indexed by ObjectId.
+
+        dependencies (Dict[ObjectId, Set[ObjectId]]): Objects that an object \
+        references, e.g. the ports an ECU connection links.
+
+        reverse_deps (Dict[ObjectId, Set[ObjectId]]): Objects referencing an \
+        object.
 
-        sources (Dict[ObjectId, SourceRef]): Source references indexed by \
-        ObjectId.
+        registries (RegistryContext): The names and instances registered \
+        while validating this workspace, kept apart from other workspaces.
 
-        dependencies (Dict[ObjectId, Set[ObjectId]]): Dependency graph.
+        timings (Dict[str, float]): Seconds spent in each load phase \
+        (``discover``, ``parse``, ``validate``, ``link`` and \
+        ``cross-validate``).
 
-        reverse_deps (Dict[ObjectId, Set[ObjectId]]): Reverse dependency graph.
+        source_map (SourceMap): The documents the input of every object \
+        was read from, used to report diagnostics with their file, line \
+        and column.
 
-        _diagnostics (list[Diagnostic]): Collected diagnostics.
+        symbols (SymbolTable): The names the objects define and refer \
+        to, e.g. for completion and for looking up definitions.
+
+        _diagnostics (Dict[ObjectId, list[Diagnostic]]): Diagnostics reported \
+        by the validation of each object.
     """
 
     def __init__(
@@ -79,39 +213,240 @@ class FLYNCWorkspace:
                     workspace_path,
                 )
             workspace_path = Path(workspace_path)
-        self.workspace_root = workspace_path
+        self.workspace_root = workspace_path.resolve()
         self.load_errors: list[ErrorDetails] = []
+        self.cache: Optional[WorkspaceCache] = None
+        self.registries = RegistryContext()
+        # seconds spent per load phase
+        self.timings: Dict[str, float] = {}
+        # semantic graph
+        self.objects: Dict[ObjectId, Optional[FLYNCBaseModel]] = {}
+        self.sources: Dict[ObjectId, List[str]] = {}
+        self.dependencies: Dict[ObjectId, Set[ObjectId]] = {}
+        self.reverse_deps: Dict[ObjectId, Set[ObjectId]] = {}
+        self.source_map = SourceMap(self._document_positions)
+        self.symbols = SymbolTable(self._collect_symbols, self._locate)
+        self._diagnostics: Dict[ObjectId, list[Diagnostic]] = {}
+        self._document_diagnostics: Dict[str, list[Diagnostic]] = {}
+        self._units: Dict[ObjectId, _LoadUnit] = {}
+        # models validated by a unit (sub-units excluded) and their owner
+        self._owned: Dict[ObjectId, List[BaseModel]] = {}
+        self._owners: Dict[int, ObjectId] = {}
+        # registry entries left behind by failed validations of a load
+        # with deferred link rules, see __validate_unit
+        self._strays: Dict[Any, Set[Any]] = {}
+        # the input a unit was last validated with, sub-units as models
+        self._inputs: Dict[ObjectId, Any] = {}
+        self._document_units: Dict[str, ObjectId] = {}
+        self._unit_stack: List[ObjectId] = []
+        # units to validate again, None outside of a re-validation
+        self._rebuild: Optional[Set[ObjectId]] = None
+        # documents already submitted for parsing, keyed by their path
+        self._pending_documents: Dict[Path, Future] = {}
+        # link rules deferred while loading, None if they run right away
+        self._link_queue: Optional[LinkQueue] = None
+        self._link_executor: Optional[Executor] = None
 
     # region creator
     @classmethod
     def load_workspace(
-        cls, workspace_name: str, workspace_path: Path | str
+        cls,
+        workspace_name: str,
+        workspace_path: Path | str,
+        jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        cache_dir: Optional[Path | str] = None,
+        defer_links: bool = False,
     ) -> "FLYNCWorkspace":
         """loads a workspace object from a location of the Yaml Configuration.
 
+        When ``jobs`` or ``executor`` is given, all FLYNC documents of the
+        workspace are discovered up front and parsed concurrently, while the
+        model is still assembled and validated in the usual order. The
+        resulting model and ``load_errors`` are the same as for a sequential
+        load.
+
         Args:
             workspace_name (str): The name of the workspace.
 
             workspace_path (str | Path): The path of the workspace files.
 
+            jobs (int, optional): Number of worker threads used to parse \
+            the documents. ``None`` or ``1`` loads sequentially.
+
+            executor (Executor, optional): An executor (e.g. a \
+            ``ProcessPoolExecutor``) used to parse the documents. Takes \
+            precedence over ``jobs`` and is not shut down by the workspace.
+
+            cache_dir (str | Path, optional): Directory of an on-disk cache \
+            of parsed documents and validated sub-trees. Unchanged \
+            sub-trees are restored from it without re-validation.
+
+            defer_links (bool): Run the link rules in a separate phase \
+            once all objects are validated. See :meth:`load`.
+
         Returns: FLYNCWorkspace
         """
         output = FLYNCWorkspace(
             name=workspace_name, workspace_path=workspace_path
         )
-        model = output.__load_from_path(workspace_path)
-
-        if not isinstance(model, FLYNCModel):
+        if cache_dir is not None:
+            output.cache = WorkspaceCache(cache_dir)
+        output.load(jobs=jobs, executor=executor, defer_links=defer_links)
+        if output.flync_model is None:
             raise ValidationError.from_exception_data(
                 title=f"Model ({workspace_name}) Creation Error",
                 line_errors=errors_to_init_errors(output.load_errors),
             )
-        output.flync_model = model
         return output
 
+    def load(
+        self,
+        jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        defer_links: bool = False,
+    ) -> Optional[FLYNCModel]:
+        """Load and validate the workspace root.
+
+        Unlike :meth:`load_workspace`, an invalid workspace does not raise.
+        The outcome is available from ``flync_model``, ``load_errors`` and
+        ``diagnostics``, and the time spent in every phase from
+        ``timings``.
+
+        With ``defer_links``, the link rules (validators connecting an
+        object to objects of other files, see
+        :mod:`flync.core.utils.link_rules`) are collected while the files
+        are validated and run together right before the system as a whole
+        is checked. Independent rules run concurrently when ``jobs`` is
+        greater than one. A failing rule invalidates its object the same
+        way as when the rules run during the validation of every file.
+
+        Args:
+            jobs (int, optional): Number of worker threads used to parse \
+            the documents. ``None`` or ``1`` loads sequentially.
+
+            executor (Executor, optional): An executor used to parse the \
+            documents. Takes precedence over ``jobs``.
+
+            defer_links (bool): Run the link rules in a separate phase.
+
+        Returns:
+            FLYNCModel | None: The validated model, or None if invalid.
+        """
+        if self.workspace_root is None:
+            raise ValueError("The workspace has no root to load from.")
+        own_executor = None
+        if executor is None and jobs is not None and jobs > 1:
+            executor = own_executor = ThreadPoolExecutor(max_workers=jobs)
+        if defer_links:
+            self._link_queue = LinkQueue()
+            self._link_executor = own_executor
+        try:
+            if executor is not None:
+                self._submit_documents(executor)
+            with self.registries.activate():
+                if defer_links:
+                    self._strays = stray_entries(self._owned_models())
+                model = self.__load_from_path(self.workspace_root)
+        finally:
+            self._pending_documents.clear()
+            self._link_queue = self._link_executor = None
+            if own_executor is not None:
+                own_executor.shutdown(cancel_futures=True)
+        self._set_root_model(model)
+        return self.flync_model
+
+    @contextmanager
+    def _timed(self, phase: str, **details) -> Iterator[None]:
+        """Add the time spent in a ``with`` block to a phase's timing.
+
+        The phase is also reported to an active
+        :class:`~flync.core.utils.profiling.ValidationProfiler`, together
+        with the ``details`` (e.g. the validated object).
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add_timing(phase, start, time.perf_counter(), **details)
+
+    def _add_timing(self, phase: str, start: float, end: float, **details):
+        """Add a span of ``time.perf_counter`` values to a phase's timing."""
+        self.timings[phase] = self.timings.get(phase, 0.0) + (end - start)
+        profiler = get_active_profiler()
+        if profiler is not None:
+            profiler.add_phase(phase, start, end, **details)
+
     # endregion
     # region ingestion
-    def _open_document(self, uri: Path | str, text: str):
+    def _discover_documents(self) -> list[Path]:
+        """Collect the paths of all FLYNC documents in the workspace.
+
+        Returns:
+            list[Path]: The document paths, sorted for a stable order.
+        """
+        if self.workspace_root is None or not self.workspace_root.is_dir():
+            return []
+        with self._timed("discover"):
+            return sorted(
+                self.workspace_root.rglob(
+                    f"*{self.configuration.flync_file_extension}"
+                )
+            )
+
+    def _list_folder(self, path: Path) -> List[Path]:
+        """List the entries of a folder of the workspace.
+
+        Timed as discovery, like :meth:`_discover_documents` when the
+        documents are parsed up front.
+        """
+        with self._timed("discover"):
+            return list(path.iterdir())
+
+    def _submit_documents(self, executor: Executor):
+        """Submit every document of the workspace to an executor for parsing.
+
+        Args:
+            executor (Executor): The executor running the parse jobs.
+
+        Returns: None
+        """
+        for path in self._discover_documents():
+            self._pending_documents[path] = executor.submit(
+                _read_flync_file, path, self.cache
+            )
+
+    def _load_document(self, path: Path) -> Document:
+        """Return the open document of a path, opening it if needed.
+
+        Reuses parses already submitted to an executor.
+
+        Args:
+            path (Path): The path of the document.
+
+        Returns:
+            Document: The open document.
+        """
+        uri = path.as_uri()
+        if self._unit_stack:
+            object_id = self._unit_stack[-1]
+            self._document_units[uri] = object_id
+            if uri not in self.sources[object_id]:
+                self.sources[object_id].append(uri)
+        doc = self.documents.get(uri)
+        if doc is not None:
+            return doc
+        pending = self._pending_documents.pop(path, None)
+        if pending is not None:
+            text, content, (start, end) = pending.result()
+        else:
+            text, content, (start, end) = _read_flync_file(path, self.cache)
+        self._add_timing("parse", start, end, uri=uri)
+        return self._open_document(path, text, content)
+
+    def _open_document(
+        self, uri: Path | str, text: str, data: Any = None
+    ) -> Document:
         """Open a document, parse it, and add it to the workspace.
 
         Args:
@@ -119,30 +454,847 @@ class FLYNCWorkspace:
 
             text (str): The raw text content of the document.
 
-        Returns: None
+            data (Any, optional): The already parsed content of the text. \
+            If omitted, the text is parsed.
+
+        Returns:
+            Document: The opened document.
         """
         if isinstance(uri, Path):
             uri = uri.as_uri()
         doc = Document(uri, text)
-        doc.parse()
+        if data is None:
+            doc.parse()
+        else:
+            doc.data = data
         self.documents[uri] = doc
+        return doc
 
-    def _update_document_text(self, uri: str, text: str):
+    def _update_document_text(self, uri: str, text: str) -> Set[ObjectId]:
         """Update the text of an existing document and re-apply analysis.
 
+        Only the object loaded from the document is validated again. Its
+        model replaces the old one within the objects containing it, and
+        the objects linked to it are linked again. All other objects are
+        reused as they are.
+
         Args:
             uri (str): The document's URI.
 
             text (str): The new text content for the document.
 
+        Returns:
+            Set[ObjectId]: The ids of the re-validated objects.
+        """
+        return self.update_documents({uri: text})
+
+    def update_documents(self, texts: Dict[str, str]) -> Set[ObjectId]:
+        """Update the text of several documents and re-validate them once.
+
+        Like :meth:`_update_document_text`, but the objects affected by
+        any of the documents are validated together, e.g. for a burst of
+        edits or a save of several files.
+
+        Args:
+            texts (Dict[str, str]): The new text of every changed \
+            document, by its URI.
+
+        Returns:
+            Set[ObjectId]: The ids of the re-validated objects.
+        """
+        changed = self._ingest_texts(texts)
+        if not changed:
+            return set()
+        return self._revalidate(changed)
+
+    def apply_file_changes(
+        self,
+        created: Iterable[Path] = (),
+        modified: Iterable[Path] = (),
+        deleted: Iterable[Path] = (),
+    ) -> Set[ObjectId]:
+        """Re-ingest changed files of the workspace and re-validate them.
+
+        Modified documents are read again as in :meth:`update_documents`.
+        Created and deleted files change the structure of the workspace,
+        so the objects whose folders contain them are loaded again, while
+        the objects of deleted files are dropped.
+
+        Args:
+            created (Iterable[Path]): Files added to the workspace.
+
+            modified (Iterable[Path]): Files whose content changed.
+
+            deleted (Iterable[Path]): Files removed from the workspace.
+
+        Returns:
+            Set[ObjectId]: The ids of the re-validated (or dropped) objects.
+        """
+        texts: Dict[str, str] = {}
+        structural: List[Path] = list(created)
+        for path in modified:
+            if path.as_uri() in self.documents:
+                texts[path.as_uri()] = path.read_text(encoding="utf-8")
+            else:
+                structural.append(path)
+        changed = self._ingest_texts(texts)
+        for path in deleted:
+            uri = path.as_uri()
+            self.documents.pop(uri, None)
+            self._document_diagnostics.pop(uri, None)
+            object_id = self._document_units.pop(uri, None)
+            changed.add(object_id or self._enclosing_unit(path))
+        changed.update(self._enclosing_unit(path) for path in structural)
+        changed.discard(None)
+        if not changed:
+            return set()
+        affected = self._revalidate(changed)
+        for object_id in affected:
+            unit = self._units.get(object_id)
+            if unit is not None and not unit.path.exists():
+                self._forget_unit(object_id)
+        return affected
+
+    def watch(
+        self,
+        callback: Optional[Callable[[WorkspaceChange], None]] = None,
+        interval: float = DEFAULT_INTERVAL,
+        quiet: float = DEFAULT_QUIET,
+    ) -> WorkspaceWatcher:
+        """Watch the workspace files and apply their changes as they happen.
+
+        The files are polled on a background thread. A burst of changes is
+        applied with :meth:`apply_file_changes` once the files have been
+        quiet, and then pushed to the subscribers of the returned watcher::
+
+            with workspace.watch(lambda change: print(change.diagnostics)):
+                ...
+
+            async for change in workspace.watch():
+                ...
+
+        Args:
+            callback (Callable[[WorkspaceChange], None], optional): \
+            Called with every applied change.
+
+            interval (float): Seconds between two polls.
+
+            quiet (float): Seconds without changes before they are \
+            applied.
+
+        Returns:
+            WorkspaceWatcher: The running watcher, stopped with \
+            :meth:`~WorkspaceWatcher.stop` or at the end of a ``with`` \
+            block.
+        """
+        if not self.objects:
+            self.load()
+        watcher = WorkspaceWatcher(self, interval, quiet)
+        if callback is not None:
+            watcher.subscribe(callback)
+        return watcher.start()
+
+    def _enclosing_unit(self, path: Path) -> Optional[ObjectId]:
+        """Return the unit of the closest folder containing a path."""
+        for candidate in (path, *path.parents):
+            object_id = self._object_id(candidate)
+            if object_id in self._units:
+                return object_id
+            if candidate == self.workspace_root:
+                break
+        return None
+
+    def _forget_unit(self, object_id: ObjectId):
+        """Drop a unit whose file or folder no longer exists."""
+        del self._units[object_id]
+        self.objects.pop(object_id, None)
+        self.sources.pop(object_id, None)
+        self._inputs.pop(object_id, None)
+        self._diagnostics.pop(object_id, None)
+        self._owned.pop(object_id, None)
+        self.source_map.clear(object_id)
+        self.symbols.invalidate(object_id)
+        for dependency in self.dependencies.pop(object_id, set()):
+            self.reverse_deps.get(dependency, set()).discard(object_id)
+        self.reverse_deps.pop(object_id, None)
+
+    def _ingest_texts(self, texts: Dict[str, str]) -> Set[ObjectId]:
+        """Update the text of documents without validating them.
+
+        Args:
+            texts (Dict[str, str]): The new text of every changed \
+            document, by its URI.
+
+        Returns:
+            Set[ObjectId]: The units that read the changed documents.
+        """
+        changed: Set[ObjectId] = set()
+        for uri, text in texts.items():
+            doc = self.documents[uri]
+            self._document_diagnostics.pop(uri, None)
+            try:
+                doc.update_text(text)
+            except yaml.YAMLError as e:
+                mark = getattr(e, "problem_mark", None)
+                self._document_diagnostics[uri] = [
+                    Diagnostic(
+                        uri,
+                        None,
+                        ErrorDetails(
+                            type="yaml_error", loc=(), msg=str(e), input=text
+                        ),
+                        mark.line + 1 if mark is not None else None,
+                        mark.column + 1 if mark is not None else None,
+                    )
+                ]
+                continue
+            object_id = self._document_units.get(uri)
+            if object_id is not None:
+                changed.add(object_id)
+        return changed
+
+    @property
+    def diagnostics(self) -> list[Diagnostic]:
+        """All diagnostics of the workspace, in load order."""
+        output = [d for ds in self._document_diagnostics.values() for d in ds]
+        output.extend(d for ds in self._diagnostics.values() for d in ds)
+        return output
+
+    def _document_positions(
+        self, uri: str
+    ) -> Optional[Dict[NodePath, Position]]:
+        doc = self.documents.get(uri)
+        return doc.positions if doc is not None else None
+
+    def _diagnostic(
+        self, object_id: ObjectId, error: ErrorDetails
+    ) -> Diagnostic:
+        """Create the diagnostic of an object's error at its source.
+
+        Errors that cannot be traced to a document node are reported for
+        the document of the object, without a position.
+        """
+        position = self.source_map.resolve(object_id, error.get("loc", ()))
+        if position is None:
+            return Diagnostic(self._unit_uri(object_id), object_id, error)
+        return Diagnostic(
+            position.uri, object_id, error, position.line, position.column
+        )
+
+    def _collect_symbols(self, object_id: ObjectId) -> List[Symbol]:
+        """Collect the symbols of a unit, excluding those of sub-units."""
+        unit = self._units.get(object_id)
+        if unit is None or object_id not in self._inputs:
+            return []
+        return collect_symbols(
+            object_id, unit.model_type, self._inputs[object_id]
+        )
+
+    def _locate(self, symbol: Symbol) -> Optional[SourcePosition]:
+        return self.source_map.resolve(symbol.object_id, symbol.loc)
+
+    def symbol_at(self, uri: str, line: int, column: int) -> Optional[Symbol]:
+        """Return the symbol at a position of a document.
+
+        Args:
+            uri (str): The document's URI.
+
+            line (int): The one-based line.
+
+            column (int): The one-based column.
+
+        Returns:
+            Symbol | None: The defined or referred name, or None if there \
+            is none on the line.
+        """
+        object_id = self._document_units.get(uri)
+        if object_id is None:
+            return None
+        return self.symbols.symbol_at(object_id, uri, line, column)
+
+    def _object_id(self, path: Path) -> ObjectId:
+        if self.workspace_root is None:
+            return path.as_posix()
+        try:
+            return path.relative_to(self.workspace_root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _ancestors(self, object_id: ObjectId) -> List[ObjectId]:
+        """Return the units containing a unit, the closest one first."""
+        ancestors = []
+        parent = self._units[object_id].parent
+        while parent is not None:
+            ancestors.append(parent)
+            parent = self._units[parent].parent
+        return ancestors
+
+    def _revalidate(self, changed: Set[ObjectId]) -> Set[ObjectId]:
+        """Validate changed units again, reusing all unaffected ones.
+
+        Every changed unit is validated again on its own and its new model
+        takes the place of the old one within the model of its parent.
+        Only the ``after`` validators of the parent and its ancestors run
+        again, and only the link rules of the models of other units that
+        were linked to a replaced object (e.g. the connections of a
+        replaced port). A unit is validated again as a whole when this is
+        not enough: its child changed between valid and invalid, one of
+        its fields holds a replaced object, or a check fails. Failed units
+        referring to a name a re-validated unit defines are validated
+        again as well, as they may have failed for the lack of it.
+
+        Args:
+            changed (Set[ObjectId]): The units whose documents changed.
+
+        Returns:
+            Set[ObjectId]: The ids of the re-validated or re-linked units.
+        """
+        affected: Set[ObjectId] = set()
+        # units whose checks run again, as a model of theirs was replaced
+        recheck: Set[ObjectId] = set()
+        pending = set(changed)
+        with self.registries.activate():
+            while pending:
+                while pending:
+                    pending = self._revalidate_units(
+                        pending, affected, recheck
+                    )
+                pending = self._recheck_units(recheck)
+        self._set_root_model(
+            self.objects.get(self._object_id(self.workspace_root))
+        )
+        return affected
+
+    def _revalidate_units(
+        self,
+        units: Set[ObjectId],
+        affected: Set[ObjectId],
+        recheck: Set[ObjectId],
+    ) -> Set[ObjectId]:
+        """Validate units again and put their models in place.
+
+        Args:
+            units (Set[ObjectId]): The units to validate again.
+
+            affected (Set[ObjectId]): Collects the re-validated and \
+            re-linked units.
+
+            recheck (Set[ObjectId]): Collects the units whose checks have \
+            to run again.
+
+        Returns:
+            Set[ObjectId]: The units that have to be validated again as a \
+            whole next.
+        """
+        # a removed file or folder is dropped by validating its parent
+        stack = list(units)
+        while stack:
+            unit = self._units[stack.pop()]
+            if not unit.path.exists() and unit.parent not in (None, *units):
+                units.add(unit.parent)
+                stack.append(unit.parent)
+        retired = self._retire_units(units)
+        tops = [
+            object_id
+            for object_id in self._units
+            if object_id in units
+            and not units.intersection(self._ancestors(object_id))
+            and self._units[object_id].path.exists()
+        ]
+        old = {object_id: self.objects.get(object_id) for object_id in tops}
+        self._rebuild = units
+        try:
+            for object_id in tops:
+                unit = self._units[object_id]
+                self._unit_stack = [] if unit.parent is None else [unit.parent]
+                self.__load_from_path(unit.path, unit.model_type)
+        finally:
+            self._rebuild = None
+            self._unit_stack = []
+        affected.update(units)
+        recheck.difference_update(units)
+        revalidate: Set[ObjectId] = set()
+        for object_id in tops:
+            parent = self._units[object_id].parent
+            if parent is None:
+                continue
+            if self._replace_model(
+                parent, old[object_id], self.objects.get(object_id)
+            ):
+                recheck.update(self._ancestors(object_id))
+            else:
+                revalidate.add(parent)
+        revalidate.update(
+            self._relink_dependents(retired, units, affected, recheck)
+        )
+        revalidate.update(self._failed_referrers(units, affected))
+        return revalidate
+
+    def _retire_units(self, units: Set[ObjectId]) -> List[BaseModel]:
+        """Disconnect and unregister the models of units to validate again.
+
+        Args:
+            units (Set[ObjectId]): The units.
+
+        Returns:
+            List[BaseModel]: The retired models.
+        """
+        # the most recently loaded ones first
+        order = [oid for oid in self._diagnostics if oid in units]
+        order.extend(oid for oid in units if oid not in self._diagnostics)
+        had_failures = False
+        retired: List[BaseModel] = []
+        for object_id in reversed(order):
+            had_failures |= self.objects.get(object_id) is None
+            owned = self._owned.pop(object_id, [])
+            for model in reversed(owned):
+                disconnect = getattr(model, "disconnect", None)
+                if callable(disconnect):
+                    disconnect()
+                self._owners.pop(id(model), None)
+            retired.extend(owned)
+        unregister_models(retired)
+        if had_failures:
+            # failed validations may have registered parts of a tree
+            retain_models(self._owned_models())
+        return retired
+
+    def _replace_model(
+        self,
+        object_id: ObjectId,
+        old: Optional[BaseModel],
+        new: Optional[BaseModel],
+    ) -> bool:
+        """Put the new model of a sub-unit in place of its old one.
+
+        Args:
+            object_id (ObjectId): The unit containing the sub-unit.
+
+            old (BaseModel | None): The old model of the sub-unit.
+
+            new (BaseModel | None): Its new model.
+
+        Returns:
+            bool: ``False`` if the unit has to be validated again instead, \
+            e.g. because one of the models is invalid.
+        """
+        if old is None or new is None or self.objects.get(object_id) is None:
+            return False
+        return any(
+            _replace_value(model.__dict__, old, new)
+            for model in self._owned.get(object_id, ())
+        )
+
+    def _relink_dependents(
+        self,
+        retired: List[BaseModel],
+        units: Set[ObjectId],
+        affected: Set[ObjectId],
+        recheck: Set[ObjectId],
+    ) -> Set[ObjectId]:
+        """Link the models of other units to the re-validated objects.
+
+        The link rules of a model run again if its private attributes
+        hold a retired object. Units holding a retired object in a field
+        have to be validated again, as well as units whose link rules fail.
+
+        Args:
+            retired (List[BaseModel]): The models replaced by validating \
+            ``units`` again.
+
+            units (Set[ObjectId]): The re-validated units.
+
+            affected (Set[ObjectId]): Collects the re-linked units.
+
+            recheck (Set[ObjectId]): Collects the units whose checks have \
+            to run again.
+
+        Returns:
+            Set[ObjectId]: The units that have to be validated again.
+        """
+        retired_ids = {id(model) for model in retired}
+        dependents = {
+            dependent
+            for object_id in units
+            for dependent in self.reverse_deps.get(object_id, ())
+            if dependent not in units
+        }
+        load_order = {oid: index for index, oid in enumerate(self._units)}
+        revalidate: Set[ObjectId] = set()
+        for object_id in sorted(dependents, key=load_order.__getitem__):
+            tasks = []
+            for model in self._owned.get(object_id, ()):
+                fields = [
+                    getattr(model, name, None)
+                    for name in type(model).model_fields
+                ]
+                if any(
+                    id(ref) in retired_ids for ref in _iter_references(fields)
+                ):
+                    revalidate.add(object_id)
+                    break
+                private = (model.__pydantic_private__ or {}).values()
+                if any(
+                    id(ref) in retired_ids
+                    for ref in _iter_references(list(private))
+                ):
+                    tasks.extend(
+                        (rule, model) for rule in get_link_rules(type(model))
+                    )
+            if object_id in revalidate or not tasks:
+                continue
+            for _, model in tasks:
+                disconnect = getattr(model, "disconnect", None)
+                if callable(disconnect):
+                    disconnect()
+            with self._timed("link", object_id=object_id):
+                failures = run_link_rules(tasks)
+            if failures:
+                revalidate.add(object_id)
+                continue
+            self._set_dependencies(object_id, self._owned[object_id])
+            affected.add(object_id)
+            recheck.update(self._ancestors(object_id))
+        return revalidate
+
+    def _failed_referrers(
+        self, units: Set[ObjectId], affected: Set[ObjectId]
+    ) -> Set[ObjectId]:
+        """Return the failed units referring to names the units define.
+
+        A unit failing on a name that does not exist holds no link to the
+        unit defining it later, so its dependency is found by the name.
+
+        Args:
+            units (Set[ObjectId]): The re-validated units.
+
+            affected (Set[ObjectId]): The units re-validated already, \
+            which are not validated again.
+
+        Returns:
+            Set[ObjectId]: The units that have to be validated again.
+        """
+        names = {
+            symbol.key
+            for object_id in units
+            for symbol in self.symbols.symbols(object_id)
+            if symbol.definition
+        }
+        return {
+            reference.object_id
+            for kind, name in names
+            for reference in self.symbols.references(kind, name)
+            if reference.object_id not in affected
+            and self.objects.get(reference.object_id) is None
+        }
+
+    def _recheck_units(self, units: Set[ObjectId]) -> Set[ObjectId]:
+        """Run the ``after`` validators of units whose sub-units changed.
+
+        The units are checked from the innermost to the outermost one, e.g.
+        an ECU links its new controller before the system checks its
+        addresses. Link rules are left out; they run for the models linked
+        to replaced objects only.
+
+        Args:
+            units (Set[ObjectId]): The units. Emptied.
+
+        Returns:
+            Set[ObjectId]: The units whose checks failed. They have to be \
+            validated again, to report the errors.
+        """
+        failed: Set[ObjectId] = set()
+        for object_id in sorted(
+            units, key=lambda oid: len(self._ancestors(oid)), reverse=True
+        ):
+            model = self.objects.get(object_id)
+            if model is None:
+                failed.add(object_id)
+                continue
+            phase = "validate"
+            if isinstance(model, FLYNCModel):
+                model.invalidate_indexes()
+                phase = "cross-validate"
+            decorators = type(model).__pydantic_decorators__
+            validators = [
+                decorator.func
+                for decorator in decorators.model_validators.values()
+                if decorator.info.mode == "after"
+                and not hasattr(decorator.func, "link_rule")
+            ]
+            with self._timed(
+                phase,
+                object_id=object_id,
+                type=type(model).__name__,
+            ):
+                try:
+                    for validator in validators:
+                        validator(model)
+                except (ValueError, AssertionError):
+                    failed.add(object_id)
+        units.clear()
+        return failed
+
+    def _owned_models(self) -> Iterator[BaseModel]:
+        """Yield the models of all units."""
+        for owned in self._owned.values():
+            yield from owned
+
+    def _collect_owned(self, model: Any) -> List[BaseModel]:
+        """Collect the models of a unit, stopping at those of sub-units."""
+        owned: List[BaseModel] = []
+        seen: Set[int] = set()
+        stack = [model]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, BaseModel):
+                if id(value) in seen or id(value) in self._owners:
+                    continue
+                seen.add(id(value))
+                owned.append(value)
+                stack.extend(
+                    getattr(value, name, None)
+                    for name in type(value).model_fields
+                )
+            elif isinstance(value, (list, tuple)):
+                stack.extend(value)
+            elif isinstance(value, dict):
+                stack.extend(value.values())
+        return owned
+
+    def _set_dependencies(self, object_id: ObjectId, owned: List[BaseModel]):
+        """Record the units referenced by the models of a unit.
+
+        Follows both fields and private attributes, which hold the links
+        set up by validators (e.g. connected components).
+
+        Args:
+            object_id (ObjectId): The unit.
+
+            owned (List[BaseModel]): The models validated by the unit.
+
         Returns: None
         """
-        doc = self.documents[uri]
-        doc.update_text(text)
+        dependencies: Set[ObjectId] = set()
+        for model in owned:
+            values = [
+                getattr(model, name, None) for name in type(model).model_fields
+            ]
+            values.extend((model.__pydantic_private__ or {}).values())
+            for ref in _iter_references(values):
+                owner = self._owners.get(id(ref))
+                if owner is not None and owner != object_id:
+                    dependencies.add(owner)
+        for old in self.dependencies.get(object_id, set()) - dependencies:
+            self.reverse_deps.get(old, set()).discard(object_id)
+        for new in dependencies:
+            self.reverse_deps.setdefault(new, set()).add(object_id)
+        self.dependencies[object_id] = dependencies
+
+    def _begin_unit(
+        self, object_id: ObjectId, path: Path, model_type: type
+    ) -> bool:
+        """Start loading a unit.
+
+        Args:
+            object_id (ObjectId): The unit.
+
+            path (Path): The file or folder it is loaded from.
+
+            model_type (type): The type it is validated as.
+
+        Returns:
+            bool: ``False`` if the unit is reused from a previous load.
+        """
+        parent = self._unit_stack[-1] if self._unit_stack else None
+        if parent is not None:
+            siblings = self._units[parent].children
+            if object_id not in siblings:
+                siblings.append(object_id)
+        if (
+            self._rebuild is not None
+            and object_id not in self._rebuild
+            and object_id in self.objects
+        ):
+            return False
+        self._units[object_id] = _LoadUnit(path, model_type, parent)
+        self.sources[object_id] = []
+        self.source_map.clear(object_id)
+        self._unit_stack.append(object_id)
+        return True
+
+    def _end_unit(
+        self,
+        object_id: ObjectId,
+        model: Optional[FLYNCBaseModel],
+        errors: list[ErrorDetails],
+    ):
+        """Record the outcome of a unit's validation.
+
+        Args:
+            object_id (ObjectId): The unit.
+
+            model (FLYNCBaseModel | None): The validated model.
+
+            errors (list[ErrorDetails]): The reported errors.
+
+        Returns: None
+        """
+        self.objects[object_id] = model
+        self.symbols.invalidate(object_id)
+        self._diagnostics[object_id] = [
+            self._diagnostic(object_id, error) for error in errors
+        ]
+        owned = self._collect_owned(model) if model is not None else []
+        self._owned[object_id] = owned
+        for owned_model in owned:
+            self._owners[id(owned_model)] = object_id
+        self._set_dependencies(object_id, owned)
+
+    def _unit_uri(self, object_id: ObjectId) -> str:
+        """Return the URI diagnostics of a unit are reported for."""
+        unit = self._units[object_id]
+        sources = self.sources[object_id]
+        if unit.path.is_file() or not sources:
+            return unit.path.absolute().as_uri()
+        return sources[0]
+
+    def _run_link_phase(self, module_load_info: dict):
+        """Run the deferred link rules of all validated objects.
+
+        Rules queued for objects that did not make it into a unit (e.g.
+        a failed validation) are dropped. A failing rule invalidates the
+        unit owning its object, as if it had run during the validation of
+        the unit: the error is reported at the position of the object, and
+        the units containing the unit are validated again without it. The
+        dependencies of the other units are updated with the links the
+        rules set up.
+
+        Args:
+            module_load_info (dict): The input of the root, whose \
+            sub-units are replaced by their re-validated models.
+
+        Returns: None
+        """
+        tasks = [
+            (rule, instance)
+            for rule, instance in self._link_queue.drain()
+            if id(instance) in self._owners
+        ]
+        with self._timed("link"):
+            failures = run_link_rules(tasks, self._link_executor)
+        errors: Dict[ObjectId, List[ErrorDetails]] = {}
+        for failure in failures:
+            object_id = self._owners[id(failure.instance)]
+            unit_errors = errors.setdefault(object_id, [])
+            if unit_errors and unit_errors[0]["type"] == "fatal":
+                continue
+            if failure.fatal:
+                # ends the validation of the unit, its other errors are lost
+                errors[object_id] = [failure.error_details()]
+                continue
+            loc = self._input_loc(object_id, failure.instance)
+            unit_errors.append(failure.error_details(loc))
+        for object_id in {self._owners[id(i)] for _, i in tasks} - set(errors):
+            self._set_dependencies(object_id, self._owned[object_id])
+        if errors:
+            self._invalidate_units(errors, module_load_info)
+
+    def _input_loc(self, object_id: ObjectId, model: BaseModel) -> NodePath:
+        """Return the path of a model within the input of its unit."""
+        stack: List[Tuple[NodePath, Any]] = [((), self.objects[object_id])]
+        while stack:
+            loc, value = stack.pop()
+            if value is model:
+                return loc
+            if isinstance(value, RootModel):
+                stack.append((loc, value.root))
+            elif isinstance(value, BaseModel):
+                if self._owners.get(id(value), object_id) != object_id:
+                    continue
+                stack.extend(
+                    (loc + (field.alias or name,), getattr(value, name, None))
+                    for name, field in type(value).model_fields.items()
+                )
+            elif isinstance(value, (list, tuple)):
+                stack.extend(
+                    (loc + (i,), item) for i, item in enumerate(value)
+                )
+            elif isinstance(value, dict):
+                stack.extend((loc + (k,), item) for k, item in value.items())
+        return ()
+
+    def _invalidate_units(
+        self,
+        errors: Dict[ObjectId, List[ErrorDetails]],
+        module_load_info: dict,
+    ):
+        """Fail units whose deferred link rules failed.
+
+        Called while the root is validated. The units between a failed
+        unit and the root are validated again, and take the place of their
+        old models in the input of the root.
+
+        Args:
+            errors (Dict[ObjectId, List[ErrorDetails]]): The errors of the \
+            failed link rules, by unit.
+
+            module_load_info (dict): The input of the root.
+
+        Returns: None
+        """
+        root_id = self._unit_stack[-1]
+        parents = {
+            parent
+            for object_id in errors
+            for parent in self._ancestors(object_id)
+            if parent != root_id
+        }
+        tops = [
+            object_id
+            for object_id in self._units
+            if self._units[object_id].parent == root_id
+            and (object_id in errors or object_id in parents)
+        ]
+        old = {object_id: self.objects[object_id] for object_id in tops}
+        self._retire_units(set(errors) | parents)
+        for object_id, unit_errors in errors.items():
+            self.objects[object_id] = None
+            self.symbols.invalidate(object_id)
+            self._set_dependencies(object_id, [])
+            self._diagnostics[object_id].extend(
+                self._diagnostic(object_id, error) for error in unit_errors
+            )
+        queue, self._link_queue = self._link_queue, None
+        self._rebuild = parents
+        try:
+            for object_id in tops:
+                if object_id in parents:
+                    unit = self._units[object_id]
+                    self.__load_from_path(unit.path, unit.model_type)
+        finally:
+            self._rebuild = None
+            self._link_queue = queue
+        for object_id in tops:
+            _replace_value(
+                module_load_info, old[object_id], self.objects[object_id]
+            )
+
+    def _record_file_origin(self, prefix: NodePath, path: Path):
+        """Record that a part of the current unit's input is a file."""
+        if path.is_file():
+            self.source_map.record(self._unit_stack[-1], prefix, path.as_uri())
+
+    def _set_root_model(self, model: Optional[FLYNCBaseModel]):
+        """Publish the root model and the errors of the last (re-)load."""
+        self.flync_model = model if isinstance(model, FLYNCModel) else None
+        self.load_errors = [
+            d.error for ds in self._diagnostics.values() for d in ds
+        ]
 
     def __handle_generic_types_list(
         self,
-        base_type_args: tuple,
+        type_plan: TypePlan,
         external: External,
         external_path: str,
         field_name: str,
@@ -150,16 +1302,14 @@ class FLYNCWorkspace:
         path: Path,
     ) -> bool:
         list_item_value = []
-        list_element_type = base_type_args[0]
+        element_plan = type_plan.members[0]
         if external.output_structure == OutputStrategy.FOLDER:
             item_dir = path / external_path
-            base_type = get_origin(list_element_type)
-            base_type_args = get_args(list_element_type)
-            for sub_item_path in item_dir.iterdir():
+            for sub_item_path in self._list_folder(item_dir):
                 item_info: dict = {}
-                if base_type is Union:
+                if element_plan.origin is Union:
                     self.__handle_generic_types_union(
-                        base_type_args,
+                        element_plan,
                         external,
                         sub_item_path.name,
                         field_name,
@@ -169,8 +1319,13 @@ class FLYNCWorkspace:
                     list_item_value.append(item_info[field_name])
                 else:
                     list_item_value.append(
-                        self.__load_from_path(sub_item_path, list_element_type)
+                        self.__load_from_path(
+                            sub_item_path, element_plan.annotation
+                        )
                     )
+                self._record_file_origin(
+                    (field_name, len(list_item_value) - 1), sub_item_path
+                )
             module_load_info[field_name] = list_item_value
             return True
 
@@ -178,7 +1333,7 @@ class FLYNCWorkspace:
 
     def __handle_generic_types_dict(
         self,
-        base_type_args: tuple,
+        type_plan: TypePlan,
         external,
         external_path: str,
         field_name: str,
@@ -186,12 +1341,15 @@ class FLYNCWorkspace:
         path: Path,
     ) -> bool:
         dict_item_value = {}
-        dict_element_type = base_type_args[1]
+        element_type = type_plan.members[0].annotation
         if external.output_structure == OutputStrategy.FOLDER:
             item_dir = path / external_path
-            for sub_item_path in item_dir.iterdir():
+            for sub_item_path in self._list_folder(item_dir):
                 dict_item_value[sub_item_path.name] = self.__load_from_path(
-                    sub_item_path, dict_element_type
+                    sub_item_path, element_type
+                )
+                self._record_file_origin(
+                    (field_name, sub_item_path.name), sub_item_path
                 )
             module_load_info[field_name] = dict_item_value
             return True
@@ -199,49 +1357,46 @@ class FLYNCWorkspace:
 
     def __handle_generic_types_union(
         self,
-        base_type_args: tuple,
+        type_plan: TypePlan,
         external,
         external_path: str,
         field_name: str,
         module_load_info: dict,
         path: Path,
     ) -> bool:
-        success_union = False
-        for possible_type in base_type_args:
-            try:
-                if possible_type is None:
-                    # optional external field, don't do anything
-                    continue
-                possible_base_type = get_origin(possible_type)
-                if issubclass(
-                    possible_base_type or possible_type, FLYNCBaseModel
-                ):
-                    module_load_info[field_name] = self.__load_from_path(
-                        path / external_path, possible_type
-                    )
-                else:
-                    self.__handle_generic_types(
-                        possible_type,
-                        possible_base_type,
-                        get_args(possible_type),
-                        external,
-                        path,
-                        external_path,
-                        module_load_info,
-                        field_name,
-                    )
-                success_union = True
-                break
-            # What exception are you trying to catch?
-            except:  # noqa: E722, B001
-                pass
-        return success_union
+        # decide the member up front, so the sub-tree is loaded only once
+        target = path / external_path
+        data = None
+        entries = None
+        if target.is_file():
+            data = self._load_document(target).data or {}
+        elif target.is_dir():
+            entries = [p.name for p in self._list_folder(target)]
+        member = select_union_member(
+            type_plan, self.configuration.flync_file_extension, data, entries
+        )
+        if member is None:
+            # optional external field that is not stored, don't do anything
+            return True
+        if member.is_model:
+            module_load_info[field_name] = self.__load_from_path(
+                target, member.annotation
+            )
+            self._record_file_origin((field_name,), target)
+        else:
+            self.__handle_generic_types(
+                member,
+                external,
+                path,
+                external_path,
+                module_load_info,
+                field_name,
+            )
+        return True
 
     def __handle_generic_types(
         self,
-        attribute_type: type,
-        base_type: type | None,
-        base_type_args: tuple,
+        type_plan: TypePlan,
         external: External,
         path: Path,
         external_path: str,
@@ -251,9 +1406,9 @@ class FLYNCWorkspace:
 
         done = False
 
-        if base_type is list:
+        if type_plan.origin is list:
             if self.__handle_generic_types_list(
-                base_type_args,
+                type_plan,
                 external,
                 external_path,
                 field_name,
@@ -262,9 +1417,9 @@ class FLYNCWorkspace:
             ):
                 done = True
 
-        elif not done and base_type is dict:
+        elif not done and type_plan.origin is dict:
             if self.__handle_generic_types_dict(
-                base_type_args,
+                type_plan,
                 external,
                 external_path,
                 field_name,
@@ -275,9 +1430,9 @@ class FLYNCWorkspace:
 
         elif (
             not done
-            and base_type is Union
+            and type_plan.origin is Union
             and self.__handle_generic_types_union(
-                base_type_args,
+                type_plan,
                 external,
                 external_path,
                 field_name,
@@ -287,22 +1442,21 @@ class FLYNCWorkspace:
         ):
             done = True
 
-        if not done and attribute_type is type(None):
+        if not done and type_plan.is_none:
             # optional type
             done = True
 
         if done:
             return
 
-        if not issubclass(
-            get_origin(attribute_type) or attribute_type, FLYNCBaseModel
-        ):
+        if not type_plan.is_model:
             raise ValueError(
                 "externally annotated field {} cannot be loaded", field_name
             )
         module_load_info[field_name] = self.__load_from_path(
-            path / external_path, attribute_type
+            path / external_path, type_plan.annotation
         )
+        self._record_file_origin((field_name,), path / external_path)
 
     def __load_from_path(
         self,
@@ -314,70 +1468,108 @@ class FLYNCWorkspace:
             current_type = FLYNCModel
         if isinstance(path, str):
             path = Path(path)
+        object_id = self._object_id(path)
+        if not self._begin_unit(object_id, path, current_type):
+            # unchanged since the last load
+            return self.objects[object_id]
+        try:
+            model, errors = self.__validate_unit(path, current_type)
+        finally:
+            self._unit_stack.pop()
+        self._end_unit(object_id, model, errors)
+        return model
+
+    def __validate_unit(
+        self, path: Path, current_type: type[FLYNCBaseModel]
+    ) -> Tuple[Optional[FLYNCBaseModel], list[ErrorDetails]]:
         module_load_info: dict = {}
+        # kept for the symbols, whether or not the input is valid
+        self._inputs[self._unit_stack[-1]] = module_load_info
+        cache_text: Optional[str] = None
+        if (
+            self.cache is not None
+            and self.cache.is_cacheable(current_type)
+            and path.is_file()
+        ):
+            cache_text = self._load_document(path).text
+            cached = self.cache.load_model(current_type, cache_text)
+            if cached is not None:
+                # cacheable types are read from their document only
+                self.__append_to_info_dict(path, module_load_info)
+                return cached, []
         # start by loading each field
-        for field_name, field_info in current_type.model_fields.items():
-            external: External | None = get_metadata(
-                field_info.metadata, External
-            )
+        plan = get_load_plan(
+            current_type, self.configuration.flync_file_extension
+        )
+        for field_plan in plan.fields:
+            external = field_plan.external
             if external is not None:
                 # field will need to be added to to a new separate document
-                attribute_type = field_info.annotation
-                if attribute_type is None:
-                    raise ValueError(
-                        "Attribute {} has an invalid type.", field_name
-                    )
-                base_type: type | None = get_origin(attribute_type)
-                base_type_args = get_args(attribute_type)
-                external_path = (
-                    external.path
-                    if (
-                        (external.naming_strategy == NamingStrategy.FIXED_PATH)
-                        and (external.path is not None)
-                    )
-                    else field_name
-                )
-                if OutputStrategy.SINGLE_FILE in external.output_structure:
-                    external_path += self.configuration.flync_file_extension
+                if field_plan.single_file:
                     self.__append_to_info_dict(
-                        path / external_path,
+                        path / field_plan.external_path,
                         module_load_info,
                         external.output_structure,
-                        field_name,
+                        field_plan.name,
                         external.root,
                     )
                     continue
                 self.__handle_generic_types(
-                    attribute_type,
-                    base_type,
-                    base_type_args,
+                    field_plan.type_plan,
                     external,
                     path,
-                    external_path,
+                    field_plan.external_path,
                     module_load_info,
-                    field_name,
+                    field_plan.name,
                 )
-            implied: Implied | None = get_metadata(
-                field_info.metadata, Implied
-            )
-            if implied is not None:
-                if implied.strategy == ImpliedStrategy.FOLDER_NAME:
-                    module_load_info[field_name] = path.name
-                continue
+            if field_plan.folder_name:
+                module_load_info[field_plan.name] = path.name
 
         # then group all the fields into the same object and return it
         self.__append_to_info_dict(path, module_load_info)
 
         # collected_errors can be reused/reraised further
-        try:
-            model, errors = validate_with_policy(
-                current_type, module_load_info
+        # the root validators check the system as a whole
+        phase = "cross-validate" if current_type is FLYNCModel else "validate"
+        queue = self._link_queue
+        if current_type is FLYNCModel and queue is not None:
+            # the system is checked once all objects are linked
+            self._run_link_phase(module_load_info)
+            queue = None
+        queued = len(queue) if queue is not None else 0
+        model, errors = self.__validate_input(
+            current_type, module_load_info, phase, queue
+        )
+        if model is None and queue is not None and len(queue) > queued:
+            # the rules deferred for the failed objects would have failed
+            # along with them: validate again, with the rules, to report
+            # the same errors as without deferring them
+            retain_models(self._owned_models(), self._strays)
+            model, errors = self.__validate_input(
+                current_type, module_load_info, phase, None
             )
-            self.load_errors.extend(errors)
-            return model
+        if model is None and queue is not None:
+            self._strays = stray_entries(self._owned_models())
+        if cache_text is not None and model is not None and not errors:
+            self.cache.store_model(current_type, cache_text, model)
+        return model, errors
+
+    def __validate_input(
+        self,
+        current_type: type[FLYNCBaseModel],
+        module_load_info: dict,
+        phase: str,
+        queue: Optional[LinkQueue],
+    ) -> Tuple[Optional[FLYNCBaseModel], list[ErrorDetails]]:
+        try:
+            with self._timed(
+                phase,
+                object_id=self._unit_stack[-1],
+                type=current_type.__name__,
+            ), defer_link_rules(queue):
+                return validate_with_policy(current_type, module_load_info)
         except ValidationError as e:
-            self.load_errors.extend(e.errors())
-            return None
+            return None, e.errors()
 
     def __append_to_info_dict(
         self,
@@ -388,17 +1580,23 @@ class FLYNCWorkspace:
         fixed_name: Optional[str] = None,
     ):
         if path.is_file():
-            with open(path, "r", encoding="utf-8") as direct_data:
-                content = yaml.safe_load(direct_data)
-                self._open_document(path, direct_data.read())
-                if output_strategy:
-                    if OutputStrategy.OMMIT_ROOT in output_strategy:
-                        modle_load_info[field_name] = content
-                        return
-                    elif OutputStrategy.FIXED_ROOT in output_strategy:
-                        modle_load_info[field_name] = content[fixed_name]
-                        return
-                modle_load_info.update(content)
+            doc = self._load_document(path)
+            content = doc.data
+            object_id = self._unit_stack[-1]
+            if output_strategy:
+                if OutputStrategy.OMMIT_ROOT in output_strategy:
+                    modle_load_info[field_name] = content
+                    self.source_map.record(object_id, (field_name,), doc.uri)
+                    return
+                elif OutputStrategy.FIXED_ROOT in output_strategy:
+                    modle_load_info[field_name] = content[fixed_name]
+                    self.source_map.record(
+                        object_id, (field_name,), doc.uri, (fixed_name,)
+                    )
+                    return
+            modle_load_info.update(content)
+            for key in content:
+                self.source_map.record(object_id, (key,), doc.uri, (key,))
 
     def generate_configs(self, uri: Path | str | None = None):
         """Save the workspace to the given path.
@@ -0,0 +1,321 @@
+"""
+Precompiled load plans for FLYNC models.
+
+The annotations that tell the workspace loader where the fields of a model
+are stored are static per model class. They are resolved once into a
+:class:`LoadPlan`, which the loader then executes for every file or folder
+of that class.
+"""
+
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from types import UnionType
+from typing import (
+    Annotated,
+    Any,
+    Collection,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import Discriminator
+from pydantic.fields import FieldInfo
+
+from flync.core.annotations import (
+    External,
+    Implied,
+    ImpliedStrategy,
+    NamingStrategy,
+    OutputStrategy,
+)
+from flync.core.base_models.base_model import FLYNCBaseModel
+from flync.sdk.utils.field_utils import get_metadata
+
+
+@dataclass(frozen=True)
+class TypePlan:
+    """The resolved form of an externally stored type.
+
+    Attributes:
+        annotation (Any): The type itself.
+
+        origin (Any): The generic origin of the type (e.g. ``list`` or \
+        ``Union``), or None.
+
+        args (tuple): The generic arguments of the type.
+
+        is_model (bool): Whether the type is a FLYNC model.
+
+        members (Tuple[TypePlan, ...]): The plans of the union members, or \
+        the plan of the list or dict element.
+
+        discriminator (str | None): The field that tells the members of a \
+        union apart, if the union declares one.
+    """
+
+    annotation: Any
+    origin: Any
+    args: tuple
+    is_model: bool
+    members: Tuple["TypePlan", ...] = ()
+    discriminator: Optional[str] = None
+
+    @property
+    def is_none(self) -> bool:
+        """Whether the type is ``NoneType``."""
+        return self.annotation is type(None)
+
+
+@dataclass(frozen=True)
+class FieldPlan:
+    """How to load a single field of a model.
+
+    Attributes:
+        name (str): The field name.
+
+        type_plan (TypePlan): The resolved field type.
+
+        external (External | None): The External annotation of the field.
+
+        external_path (str): The file or folder name the field is stored \
+        in, including the file extension for single files.
+
+        implied (Implied | None): The Implied annotation of the field.
+    """
+
+    name: str
+    type_plan: TypePlan
+    external: Optional[External] = None
+    external_path: str = ""
+    implied: Optional[Implied] = None
+
+    @property
+    def single_file(self) -> bool:
+        """Whether the field is stored in a single file."""
+        return (
+            self.external is not None
+            and OutputStrategy.SINGLE_FILE in self.external.output_structure
+        )
+
+    @property
+    def folder_name(self) -> bool:
+        """Whether the field is implied from the folder name."""
+        return (
+            self.implied is not None
+            and self.implied.strategy == ImpliedStrategy.FOLDER_NAME
+        )
+
+
+@dataclass(frozen=True)
+class LoadPlan:
+    """The fields of a model that the loader has to fill.
+
+    Fields that are neither External nor Implied are read from the
+    model's own document and are not part of the plan.
+
+    Attributes:
+        model_type (type[FLYNCBaseModel]): The planned model class.
+
+        fields (Tuple[FieldPlan, ...]): The External and Implied fields, in \
+        declaration order.
+    """
+
+    model_type: type[FLYNCBaseModel]
+    fields: Tuple[FieldPlan, ...]
+
+
+def _is_model(tp: Any) -> bool:
+    return isinstance(tp, type) and issubclass(tp, FLYNCBaseModel)
+
+
+def _get_discriminator(metadata: Collection[Any]) -> Optional[str]:
+    for m in metadata:
+        if isinstance(m, FieldInfo):
+            m = m.discriminator
+        if isinstance(m, Discriminator):
+            m = m.discriminator
+        if isinstance(m, str):
+            return m
+    return None
+
+
+def _literal_values(annotation: Any) -> tuple:
+    if get_origin(annotation) is Literal:
+        return get_args(annotation)
+    return ()
+
+
+@lru_cache(maxsize=None)
+def get_type_plan(annotation: Any) -> TypePlan:
+    """Resolve an externally stored type.
+
+    Args:
+        annotation (Any): The type.
+
+    Returns:
+        TypePlan: The resolved type, cached per type.
+    """
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is UnionType:
+        # ``A | B`` is planned like ``Union[A, B]``
+        origin = Union
+    if origin is Annotated:
+        return replace(
+            get_type_plan(args[0]),
+            discriminator=_get_discriminator(args[1:]),
+        )
+    members: Tuple[TypePlan, ...] = ()
+    if origin is Union:
+        members = tuple(get_type_plan(arg) for arg in args)
+    elif origin is list and args:
+        members = (get_type_plan(args[0]),)
+    elif origin is dict and len(args) == 2:
+        members = (get_type_plan(args[1]),)
+    return TypePlan(
+        annotation=annotation,
+        origin=origin,
+        args=args,
+        is_model=_is_model(origin or annotation),
+        members=members,
+    )
+
+
+def get_field_type_plan(field_info: FieldInfo) -> TypePlan:
+    """Resolve the type of a model field, with the field's discriminator.
+
+    Args:
+        field_info (FieldInfo): The field.
+
+    Returns:
+        TypePlan: The resolved type.
+    """
+    type_plan = get_type_plan(field_info.annotation)
+    discriminator = _get_discriminator([field_info])
+    if discriminator is not None:
+        type_plan = replace(type_plan, discriminator=discriminator)
+    return type_plan
+
+
+@lru_cache(maxsize=None)
+def get_load_plan(
+    model_type: type[FLYNCBaseModel], flync_file_extension: str
+) -> LoadPlan:
+    """Compile the load plan of a model class.
+
+    Args:
+        model_type (type[FLYNCBaseModel]): The model class.
+
+        flync_file_extension (str): The extension of FLYNC documents.
+
+    Returns:
+        LoadPlan: The plan, cached per class and extension.
+    """
+    fields = []
+    for field_name, field_info in model_type.model_fields.items():
+        external: External | None = get_metadata(field_info.metadata, External)
+        implied: Implied | None = get_metadata(field_info.metadata, Implied)
+        if external is None and implied is None:
+            continue
+        external_path = ""
+        if external is not None:
+            if field_info.annotation is None:
+                raise ValueError(
+                    "Attribute {} has an invalid type.", field_name
+                )
+            external_path = (
+                external.path
+                if (
+                    (external.naming_strategy == NamingStrategy.FIXED_PATH)
+                    and (external.path is not None)
+                )
+                else field_name
+            )
+            if OutputStrategy.SINGLE_FILE in external.output_structure:
+                external_path += flync_file_extension
+        fields.append(
+            FieldPlan(
+                name=field_name,
+                type_plan=get_field_type_plan(field_info),
+                external=external,
+                external_path=external_path,
+                implied=implied,
+            )
+        )
+    return LoadPlan(model_type=model_type, fields=tuple(fields))
+
+
+def select_union_member(
+    type_plan: TypePlan,
+    flync_file_extension: str,
+    data: Any = None,
+    entries: Optional[Collection[str]] = None,
+) -> Optional[TypePlan]:
+    """Decide which member of an externally stored union to load.
+
+    A single candidate is taken as is. Otherwise the candidate is picked
+    by the union's discriminator, and then by how well the candidates fit
+    the root keys of the document or the entries of the folder.
+
+    Args:
+        type_plan (TypePlan): The union.
+
+        flync_file_extension (str): The extension of FLYNC documents.
+
+        data (Any, optional): The parsed document the union is loaded \
+        from, if it is a file.
+
+        entries (Collection[str], optional): The names of the files and \
+        folders in the folder the union is loaded from, if it is a folder.
+
+    Returns:
+        TypePlan | None: The member to load, or None if the union is \
+        optional and nothing is stored.
+    """
+    candidates = [m for m in type_plan.members if not m.is_none]
+    optional = len(candidates) < len(type_plan.members)
+    if data is None and entries is None:
+        # nothing stored
+        return None if optional or not candidates else candidates[0]
+    if len(candidates) <= 1:
+        return candidates[0] if candidates else None
+    if type_plan.discriminator is not None and isinstance(data, dict):
+        value = data.get(type_plan.discriminator)
+        for candidate in candidates:
+            if not candidate.is_model:
+                continue
+            field_info = candidate.annotation.model_fields.get(
+                type_plan.discriminator
+            )
+            if field_info is not None and value in _literal_values(
+                field_info.annotation
+            ):
+                return candidate
+    keys: set[str] = set()
+    if isinstance(data, dict):
+        keys = set(data)
+    elif entries is not None:
+        keys = {e.removesuffix(flync_file_extension) for e in entries}
+
+    def fit(candidate: TypePlan) -> int:
+        if not candidate.is_model:
+            return 0
+        model_type = candidate.origin or candidate.annotation
+        if entries is not None:
+            plan = get_load_plan(model_type, flync_file_extension)
+            names = {
+                f.external_path.removesuffix(flync_file_extension)
+                for f in plan.fields
+            }
+        else:
+            names = {
+                f.alias or name for name, f in model_type.model_fields.items()
+            }
+        return len(keys & names)
+
+    # max keeps the first of equally fitting candidates
+    return max(candidates, key=fit)
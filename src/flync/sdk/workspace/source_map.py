@@ -0,0 +1,159 @@
+"""
+Source map of a workspace: where the validated data came from.
+
+While loading, the workspace records for every validated object which
+document each of its top-level keys was read from. Together with the
+position index of the documents (see :func:`index_positions`), the ``loc``
+of a validation error is resolved to the file, line and column it refers
+to.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ruamel.yaml.comments import CommentedMap, CommentedSeq
+
+# path of a node within a document or of a value within a model's input,
+# e.g. ("ecus", 0, "name")
+NodePath = Tuple[Any, ...]
+# zero-based (line, column) of a node
+Position = Tuple[int, int]
+
+
+def index_positions(root: Any) -> Dict[NodePath, Position]:
+    """Index the position of every mapping key and sequence item.
+
+    Args:
+        root (Any): A round-trip abstract syntax tree (``ruamel.yaml``).
+
+    Returns:
+        Dict[NodePath, Position]: The zero-based line and column of each \
+        node, by its path from the root. Only plain tuples are kept, so \
+        the tree can be released.
+    """
+    positions: Dict[NodePath, Position] = {}
+    if not isinstance(root, (CommentedMap, CommentedSeq)):
+        return positions
+    positions[()] = (root.lc.line, root.lc.col)
+    stack: list = [((), root)]
+    while stack:
+        path, node = stack.pop()
+        if isinstance(node, CommentedMap):
+            items = node.items()
+        elif isinstance(node, CommentedSeq):
+            items = enumerate(node)
+        else:
+            continue
+        lines = node.lc.data
+        for key, value in items:
+            child = path + (key,)
+            position = lines.get(key)
+            if position is not None:
+                positions[child] = (position[0], position[1])
+            stack.append((child, value))
+    return positions
+
+
+@dataclass(frozen=True)
+class SourcePosition:
+    """A position in a workspace document.
+
+    Attributes:
+        uri (str): The URI of the document.
+
+        line (int): The one-based line.
+
+        column (int): The one-based column.
+    """
+
+    uri: str
+    line: int
+    column: int
+
+
+class SourceMap:
+    """Origins of the validated data of every workspace object.
+
+    The document positions are not stored here but taken from a lookup
+    (e.g. :attr:`~flync.sdk.workspace.document.Document.positions`), which
+    is only called when an error is resolved.
+    """
+
+    def __init__(
+        self, positions: Callable[[str], Optional[Dict[NodePath, Position]]]
+    ):
+        """Initialize an empty source map.
+
+        Args:
+            positions (Callable): Returns the position index of a document \
+            by its URI, or None if the document is unknown.
+        """
+        self._positions = positions
+        # by object: the (uri, document path) a prefix of the input came from
+        self._origins: Dict[str, Dict[NodePath, Tuple[str, NodePath]]] = {}
+
+    def clear(self, object_id: str):
+        """Forget the origins of an object, e.g. before re-validating it."""
+        self._origins.pop(object_id, None)
+
+    def record(
+        self,
+        object_id: str,
+        prefix: NodePath,
+        uri: str,
+        document_path: NodePath = (),
+    ):
+        """Record where a part of an object's input was read from.
+
+        Args:
+            object_id (str): The object.
+
+            prefix (NodePath): The path of the part within the input, \
+            e.g. ``("ecus",)``, or ``()`` for the whole input.
+
+            uri (str): The document it was read from.
+
+            document_path (NodePath): The path of the part within the \
+            document.
+        """
+        self._origins.setdefault(object_id, {})[prefix] = (
+            uri,
+            document_path,
+        )
+
+    def resolve(
+        self, object_id: str, loc: NodePath
+    ) -> Optional[SourcePosition]:
+        """Resolve the ``loc`` of an object's validation error.
+
+        Elements of the ``loc`` that do not name a node of the document,
+        e.g. the member tag of a union, are skipped. If a node is missing
+        (e.g. a required key), the position of its parent is returned.
+
+        Args:
+            object_id (str): The validated object.
+
+            loc (NodePath): The ``loc`` of the error.
+
+        Returns:
+            SourcePosition | None: The position, or None if the input at \
+            ``loc`` was not read from a document.
+        """
+        origins = self._origins.get(object_id)
+        if not origins:
+            return None
+        for size in range(len(loc), -1, -1):
+            origin = origins.get(tuple(loc[:size]))
+            if origin is not None:
+                break
+        else:
+            return None
+        uri, path = origin
+        positions = self._positions(uri)
+        if positions is None or path not in positions:
+            return None
+        for part in loc[size:]:
+            if path + (part,) in positions:
+                path = path + (part,)
+        line, column = positions[path]
+        return SourcePosition(uri, line + 1, column + 1)
@@ -0,0 +1,418 @@
+"""
+Symbol table of a workspace: the names models define and refer to.
+
+Fields annotated with :class:`~flync.core.annotations.Definition` name a
+model (e.g. an ECU port), fields annotated with
+:class:`~flync.core.annotations.Reference` refer to such names (e.g. the
+ports of a connection). The :class:`SymbolTable` indexes both for every
+object of a workspace, so that names can be completed by prefix and
+definitions and references can be looked up without walking the models.
+The names are read from the input of an object, as its type describes
+it, so an object failing validation still defines and refers to its
+names. Objects are indexed again only when they are validated again.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import BaseModel, RootModel
+
+from flync.core.annotations import Definition, Reference
+from flync.sdk.utils.field_utils import get_metadata
+
+from .load_plan import (
+    TypePlan,
+    get_field_type_plan,
+    get_type_plan,
+    select_union_member,
+)
+from .source_map import NodePath, SourcePosition
+
+# the kind and name a symbol is indexed by, e.g. ("ecu_port", "p1")
+SymbolKey = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class Symbol:
+    """A name defined or referred to by a workspace object.
+
+    Attributes:
+        kind (str): The kind of the name, e.g. ``"switch_port"``.
+
+        name (str): The name.
+
+        object_id (str): The object whose input holds the name.
+
+        loc (NodePath): The path of the name within the object's input, \
+        as used by the ``loc`` of a validation error.
+
+        definition (bool): Whether the name is defined here, rather than \
+        referred to.
+    """
+
+    kind: str
+    name: str
+    object_id: str
+    loc: NodePath
+    definition: bool
+
+    @property
+    def key(self) -> SymbolKey:
+        """The kind and name the symbol is indexed by."""
+        return (self.kind, self.name)
+
+
+class PrefixTrie:
+    """Names stored by their characters, to look them up by prefix.
+
+    A name can be stored several times, e.g. for several kinds; it is
+    kept until it has been removed as often as it has been inserted.
+    """
+
+    def __init__(self):
+        """Initialize an empty trie."""
+        self._root: dict = {}
+        # marks the end of a name, mapped to the count per kind
+        self._end = object()
+
+    def insert(self, name: str, kind: str):
+        """Store a name of a kind."""
+        node = self._root
+        for char in name:
+            node = node.setdefault(char, {})
+        counts = node.setdefault(self._end, {})
+        counts[kind] = counts.get(kind, 0) + 1
+
+    def remove(self, name: str, kind: str):
+        """Remove a name of a kind stored before, pruning empty nodes."""
+        path = [self._root]
+        for char in name:
+            node = path[-1].get(char)
+            if node is None:
+                return
+            path.append(node)
+        counts = path[-1].get(self._end)
+        if not counts or kind not in counts:
+            return
+        counts[kind] -= 1
+        if counts[kind]:
+            return
+        del counts[kind]
+        if not counts:
+            del path[-1][self._end]
+        for index in range(len(name), 0, -1):
+            if path[index]:
+                break
+            del path[index - 1][name[index - 1]]
+
+    def complete(
+        self,
+        prefix: str,
+        kind: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[SymbolKey]:
+        """Return the stored names starting with a prefix.
+
+        Args:
+            prefix (str): The prefix.
+
+            kind (str, optional): Only return names of this kind.
+
+            limit (int, optional): Return at most this many names.
+
+        Returns:
+            List[SymbolKey]: The kinds and names, sorted by name.
+        """
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        found: List[SymbolKey] = []
+        stack: List[Tuple[str, dict]] = [(prefix, node)]
+        while stack and (limit is None or len(found) < limit):
+            name, node = stack.pop()
+            for kind_of_name in sorted(node.get(self._end, ())):
+                if kind is None or kind == kind_of_name:
+                    found.append((kind_of_name, name))
+            # reversed, so the smallest character is visited first
+            stack.extend(
+                (name + char, node[char])
+                for char in sorted(
+                    (c for c in node if c is not self._end), reverse=True
+                )
+            )
+        return found[:limit]
+
+
+@lru_cache(maxsize=None)
+def _symbol_fields(
+    model_type: type[BaseModel],
+) -> Tuple[Tuple[str, Optional[Definition | Reference], TypePlan], ...]:
+    """Return the input key, symbol annotation and type of every field."""
+    fields = []
+    for name, field_info in model_type.model_fields.items():
+        symbol = get_metadata(field_info.metadata, Definition)
+        if symbol is None:
+            symbol = get_metadata(field_info.metadata, Reference)
+        fields.append(
+            (field_info.alias or name, symbol, get_field_type_plan(field_info))
+        )
+    return tuple(fields)
+
+
+def collect_symbols(
+    object_id: str, model_type: type[BaseModel], data: Any
+) -> List[Symbol]:
+    """Collect the symbols of an object from its input.
+
+    The input does not have to be valid: it is walked along the fields of
+    the object's type, and parts not matching their field are skipped.
+    Models within the input are the sub-objects of the object, which are
+    indexed on their own, and are skipped as well.
+
+    Args:
+        object_id (str): The object.
+
+        model_type (type[BaseModel]): The type it is validated as.
+
+        data (Any): Its input, e.g. the parsed document.
+
+    Returns:
+        List[Symbol]: The defined and referred names.
+    """
+    symbols: List[Symbol] = []
+    stack: List[Tuple[NodePath, TypePlan, Any]] = [
+        ((), get_type_plan(model_type), data)
+    ]
+    while stack:
+        loc, plan, value = stack.pop()
+        if plan.origin is Union:
+            member = select_union_member(plan, "", value)
+            if member is not None:
+                stack.append((loc, member, value))
+            continue
+        if plan.origin is list and plan.members and isinstance(value, list):
+            stack.extend(
+                (loc + (index,), plan.members[0], item)
+                for index, item in reversed(list(enumerate(value)))
+            )
+            continue
+        if plan.origin is dict and plan.members and isinstance(value, dict):
+            stack.extend(
+                (loc + (key,), plan.members[0], item)
+                for key, item in reversed(list(value.items()))
+            )
+            continue
+        model_type = plan.annotation
+        if not (
+            isinstance(model_type, type) and issubclass(model_type, BaseModel)
+        ):
+            continue
+        if issubclass(model_type, RootModel):
+            [(_, _, root_plan)] = _symbol_fields(model_type)
+            stack.append((loc, root_plan, value))
+            continue
+        if not isinstance(value, dict):
+            continue
+        children = []
+        for key, symbol, field_plan in _symbol_fields(model_type):
+            if key not in value:
+                continue
+            field_value = value[key]
+            if symbol is None:
+                children.append((loc + (key,), field_plan, field_value))
+                continue
+            definition = isinstance(symbol, Definition)
+            if isinstance(field_value, str):
+                symbols.append(
+                    Symbol(
+                        symbol.kind,
+                        field_value,
+                        object_id,
+                        loc + (key,),
+                        definition,
+                    )
+                )
+            elif isinstance(field_value, list):
+                symbols.extend(
+                    Symbol(
+                        symbol.kind,
+                        item,
+                        object_id,
+                        loc + (key, index),
+                        definition,
+                    )
+                    for index, item in enumerate(field_value)
+                    if isinstance(item, str)
+                )
+        stack.extend(reversed(children))
+    return symbols
+
+
+class SymbolTable:
+    """Index of the symbols of all objects of a workspace.
+
+    Objects are marked stale with :meth:`invalidate` when they are
+    validated again, and indexed again on the next query. The positions of
+    the symbols are resolved from the documents only when they are needed.
+    """
+
+    def __init__(
+        self,
+        collect: Callable[[str], Iterable[Symbol]],
+        locate: Callable[[Symbol], Optional[SourcePosition]],
+    ):
+        """Initialize an empty table.
+
+        Args:
+            collect (Callable[[str], Iterable[Symbol]]): Returns the \
+            symbols of an object, by its id.
+
+            locate (Callable[[Symbol], SourcePosition | None]): Returns \
+            the position of a symbol in its document.
+        """
+        self._collect = collect
+        self._locate = locate
+        self._stale: Dict[str, None] = {}
+        self._by_object: Dict[str, List[Symbol]] = {}
+        self._definitions: Dict[SymbolKey, List[Symbol]] = {}
+        # the references of a name, in insertion order
+        self._references: Dict[SymbolKey, Dict[Symbol, None]] = {}
+        self._names = PrefixTrie()
+        # positions of the symbols of an object, resolved on demand
+        self._positions: Dict[str, List[Tuple[SourcePosition, Symbol]]] = {}
+
+    def invalidate(self, object_id: str):
+        """Mark the symbols of an object as stale."""
+        self._stale[object_id] = None
+        self._positions.pop(object_id, None)
+
+    def symbols(self, object_id: str) -> List[Symbol]:
+        """Return the symbols of an object."""
+        self._refresh()
+        return list(self._by_object.get(object_id, ()))
+
+    def complete(
+        self,
+        prefix: str,
+        kind: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Symbol]:
+        """Return the definitions of the names starting with a prefix.
+
+        Args:
+            prefix (str): The prefix.
+
+            kind (str, optional): Only return names of this kind.
+
+            limit (int, optional): Return at most this many names.
+
+        Returns:
+            List[Symbol]: The first definition of each name, sorted by \
+            name.
+        """
+        self._refresh()
+        return [
+            self._definitions[key][0]
+            for key in self._names.complete(prefix, kind, limit)
+        ]
+
+    def definitions(self, kind: str, name: str) -> List[Symbol]:
+        """Return the definitions of a name."""
+        self._refresh()
+        return list(self._definitions.get((kind, name), ()))
+
+    def references(self, kind: str, name: str) -> List[Symbol]:
+        """Return the references to a name."""
+        self._refresh()
+        return list(self._references.get((kind, name), ()))
+
+    def locate(self, symbol: Symbol) -> Optional[SourcePosition]:
+        """Return the position of a symbol, or None if it is unknown."""
+        return self._locate(symbol)
+
+    def symbol_at(
+        self, object_id: str, uri: str, line: int, column: int
+    ) -> Optional[Symbol]:
+        """Return the symbol of an object at a position of a document.
+
+        On a line with several symbols (e.g. a flow sequence of names),
+        the last one starting at or before the column is returned.
+
+        Args:
+            object_id (str): The object read from the document.
+
+            uri (str): The document.
+
+            line (int): The one-based line.
+
+            column (int): The one-based column.
+
+        Returns:
+            Symbol | None: The symbol, or None if there is none on the line.
+        """
+        self._refresh()
+        positions = self._positions.get(object_id)
+        if positions is None:
+            positions = []
+            for symbol in self._by_object.get(object_id, ()):
+                position = self._locate(symbol)
+                if position is not None:
+                    positions.append((position, symbol))
+            self._positions[object_id] = positions
+        on_line = sorted(
+            (position.column, symbol)
+            for position, symbol in positions
+            if position.uri == uri and position.line == line
+        )
+        if not on_line:
+            return None
+        found = on_line[0][1]
+        for start, symbol in on_line:
+            if start <= column:
+                found = symbol
+        return found
+
+    def _refresh(self):
+        """Index the stale objects again."""
+        while self._stale:
+            object_id = next(iter(self._stale))
+            del self._stale[object_id]
+            for symbol in self._by_object.pop(object_id, ()):
+                self._remove(symbol)
+            symbols = list(self._collect(object_id))
+            if symbols:
+                self._by_object[object_id] = symbols
+            for symbol in symbols:
+                self._add(symbol)
+
+    def _add(self, symbol: Symbol):
+        if symbol.definition:
+            self._definitions.setdefault(symbol.key, []).append(symbol)
+            self._names.insert(symbol.name, symbol.kind)
+        else:
+            self._references.setdefault(symbol.key, {})[symbol] = None
+
+    def _remove(self, symbol: Symbol):
+        if symbol.definition:
+            definitions = self._definitions[symbol.key]
+            definitions.remove(symbol)
+            if not definitions:
+                del self._definitions[symbol.key]
+            self._names.remove(symbol.name, symbol.kind)
+        else:
+            references = self._references[symbol.key]
+            references.pop(symbol, None)
+            if not references:
+                del self._references[symbol.key]
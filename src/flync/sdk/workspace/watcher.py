@@ -0,0 +1,267 @@
+"""
+File watcher of a workspace.
+
+The watcher polls the modification time and size of the FLYNC documents
+below the workspace root. A burst of changes, e.g. a save of several files
+or a checkout, is applied once the files have been quiet for a while:
+the changed documents are read again and only the objects affected by
+them are validated again (see
+:meth:`~flync.sdk.workspace.flync_workspace.FLYNCWorkspace.apply_file_changes`).
+Subscribers are then notified with a :class:`WorkspaceChange`.
+
+Polling needs no platform specific notification API and no additional
+dependency; its cost is one ``stat`` per document and interval.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .diagnostic import Diagnostic
+
+if TYPE_CHECKING:
+    from .flync_workspace import FLYNCWorkspace
+
+# seconds between two polls of the workspace files
+DEFAULT_INTERVAL = 0.5
+# seconds without changes before a burst of changes is applied
+DEFAULT_QUIET = 0.2
+
+# modification time (ns) and size of a file
+FileStamp = Tuple[int, int]
+
+logger = logging.getLogger(__name__)
+
+
+def snapshot(root: Path, extension: str) -> Dict[Path, FileStamp]:
+    """Take the stamps of all FLYNC documents below a folder.
+
+    Args:
+        root (Path): The folder.
+
+        extension (str): The extension of the documents, e.g. \
+        ``.flync.yaml``.
+
+    Returns:
+        Dict[Path, FileStamp]: The modification time and size of every \
+        document. Files removed while scanning are left out.
+    """
+    stamps: Dict[Path, FileStamp] = {}
+    for path in root.rglob(f"*{extension}"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        stamps[path] = (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+
+@dataclass(frozen=True)
+class WorkspaceChange:
+    """A burst of file changes applied to a workspace.
+
+    Attributes:
+        created (Tuple[Path, ...]): The files added.
+
+        modified (Tuple[Path, ...]): The files whose content changed.
+
+        deleted (Tuple[Path, ...]): The files removed.
+
+        revalidated (FrozenSet[str]): The ids of the objects validated \
+        again (or dropped) because of the changes.
+
+        diagnostics (List[Diagnostic]): All diagnostics of the workspace \
+        after the changes.
+    """
+
+    created: Tuple[Path, ...]
+    modified: Tuple[Path, ...]
+    deleted: Tuple[Path, ...]
+    revalidated: FrozenSet[str] = frozenset()
+    diagnostics: List[Diagnostic] = field(default_factory=list)
+
+
+class WorkspaceWatcher:
+    """Applies changes of the workspace files to a loaded workspace.
+
+    Use :meth:`poll` to check for changes from an own loop, or
+    :meth:`start` to poll on a background thread. While the watcher runs,
+    the workspace is changed by that thread: read it from a subscriber,
+    or stop the watcher first.
+
+    Changes are pushed to the callbacks added with :meth:`subscribe`, and
+    can be awaited with ``async for change in watcher``.
+
+    Attributes:
+        workspace (FLYNCWorkspace): The watched workspace.
+
+        interval (float): Seconds between two polls.
+
+        quiet (float): Seconds without changes before they are applied.
+    """
+
+    def __init__(
+        self,
+        workspace: "FLYNCWorkspace",
+        interval: float = DEFAULT_INTERVAL,
+        quiet: float = DEFAULT_QUIET,
+    ):
+        """Initialize the watcher with the current state of the files.
+
+        Args:
+            workspace (FLYNCWorkspace): A loaded workspace.
+
+            interval (float): Seconds between two polls.
+
+            quiet (float): Seconds without changes before they are \
+            applied.
+        """
+        self.workspace = workspace
+        self.interval = interval
+        self.quiet = quiet
+        self._subscribers: List[Callable[[WorkspaceChange], None]] = []
+        self._applied = self._snapshot()
+        # the last seen state of the files and since when it is unchanged
+        self._observed = self._applied
+        self._observed_at = time.monotonic()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _snapshot(self) -> Dict[Path, FileStamp]:
+        return snapshot(
+            self.workspace.workspace_root,
+            self.workspace.configuration.flync_file_extension,
+        )
+
+    def subscribe(
+        self, callback: Callable[[WorkspaceChange], None]
+    ) -> Callable[[], None]:
+        """Call a function with every applied change.
+
+        Args:
+            callback (Callable[[WorkspaceChange], None]): The function, \
+            called on the thread applying the change.
+
+        Returns:
+            Callable[[], None]: Removes the subscription.
+        """
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback)
+
+    def poll(self) -> Optional[WorkspaceChange]:
+        """Apply the changes of the files if they have been quiet.
+
+        Returns:
+            WorkspaceChange | None: The applied change, or None if nothing \
+            changed or the files are still changing.
+        """
+        current = self._snapshot()
+        now = time.monotonic()
+        if current != self._observed:
+            self._observed, self._observed_at = current, now
+            if self.quiet > 0:
+                return None
+        if current == self._applied or now - self._observed_at < self.quiet:
+            return None
+        previous = self._applied
+        change = WorkspaceChange(
+            created=tuple(sorted(current.keys() - previous.keys())),
+            modified=tuple(
+                sorted(
+                    path
+                    for path, stamp in current.items()
+                    if path in previous and previous[path] != stamp
+                )
+            ),
+            deleted=tuple(sorted(previous.keys() - current.keys())),
+        )
+        revalidated = self.workspace.apply_file_changes(
+            change.created, change.modified, change.deleted
+        )
+        # only now, so that changes failing to apply are applied again
+        self._applied = current
+        change = WorkspaceChange(
+            change.created,
+            change.modified,
+            change.deleted,
+            frozenset(revalidated),
+            self.workspace.diagnostics,
+        )
+        for callback in list(self._subscribers):
+            try:
+                callback(change)
+            except Exception:
+                logger.exception("Workspace change subscriber failed")
+        return change
+
+    # region background polling
+    def start(self) -> "WorkspaceWatcher":
+        """Poll the files on a background thread until :meth:`stop`."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="flync-workspace-watcher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop polling and wait for a change being applied."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("Applying workspace changes failed")
+
+    def __enter__(self) -> "WorkspaceWatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # endregion
+
+    def __aiter__(self) -> AsyncIterator[WorkspaceChange]:
+        """Yield the applied changes, polling on a background thread.
+
+        The changes are collected from this call on, and the polling stops
+        when the iterator is closed.
+        """
+        loop = asyncio.get_running_loop()
+        changes: asyncio.Queue = asyncio.Queue()
+        unsubscribe = self.subscribe(
+            lambda change: loop.call_soon_threadsafe(
+                changes.put_nowait, change
+            )
+        )
+        self.start()
+        return self._iterate(changes, unsubscribe)
+
+    async def _iterate(
+        self, changes: asyncio.Queue, unsubscribe: Callable[[], None]
+    ) -> AsyncIterator[WorkspaceChange]:
+        try:
+            while True:
+                yield await changes.get()
+        finally:
+            unsubscribe()
+            self.stop()
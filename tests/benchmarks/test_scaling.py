@@ -0,0 +1,118 @@
+"""
+Scaling benchmarks of loading and validating generated workspaces.
+
+Run with ``pytest tests/benchmarks --run-benchmarks -s``. The sizes can be
+changed with ``FLYNC_BENCHMARK_SIZES`` (e.g. ``10,100,1000``). The
+benchmarks fail when a cost grows clearly faster than the number of ECUs.
+"""
+
+import gc
+import math
+import os
+import time
+import tracemalloc
+
+import pytest
+
+from flync.sdk.helpers.generate_workspace import (
+    WorkspaceSize,
+    generate_workspace,
+)
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+
+pytestmark = pytest.mark.benchmark
+
+SIZES = [
+    int(n)
+    for n in os.environ.get("FLYNC_BENCHMARK_SIZES", "10,100,1000").split(",")
+]
+# growth exponent allowed over the sizes; linear is 1, anything close to
+# 2 is quadratic
+MAX_EXPONENT = 1.3
+# phases faster than this at the largest size are too noisy to judge
+MIN_PHASE_SECONDS = 0.05
+# loaded first, to build the schemas and load plans, then measured and
+# subtracted from every size as the fixed cost of a load
+BASELINE_ECUS = 2
+# worker threads of the load the phases are taken from; a parallel load
+# with deferred links reports every phase
+JOBS = 4
+
+
+def _load(path, **kwargs) -> FLYNCWorkspace:
+    workspace = FLYNCWorkspace("benchmark", path)
+    workspace.load(**kwargs)
+    assert workspace.flync_model is not None, workspace.load_errors[:5]
+    return workspace
+
+
+def _measure(path) -> dict:
+    gc.collect()
+    start = time.perf_counter()
+    workspace = _load(path)
+    total = time.perf_counter() - start
+    del workspace
+    gc.collect()
+    tracemalloc.start()
+    try:
+        _load(path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    result = {"total": total, "memory": peak}
+    result.update(_load(path, jobs=JOBS, defer_links=True).timings)
+    return result
+
+
+@pytest.fixture(scope="module")
+def measurements(tmp_path_factory):
+    results = {}
+    for ecus in [BASELINE_ECUS, *SIZES]:
+        path = generate_workspace(
+            tmp_path_factory.mktemp(f"ecus{ecus}"), WorkspaceSize(ecus=ecus)
+        )
+        if ecus == BASELINE_ECUS:
+            _load(path)
+        results[ecus] = _measure(path)
+    print()
+    for ecus, result in results.items():
+        phases = ", ".join(
+            f"{k}={v:.3f}s" for k, v in result.items() if k != "memory"
+        )
+        print(f"{ecus:>6} ECUs: {result['memory'] / 2**20:.1f} MiB, {phases}")
+    return results
+
+
+def _exponent(measurements, key):
+    """Fit the growth exponent of a cost over all sizes.
+
+    The cost of the baseline workspace is subtracted first, so that the
+    fixed cost of a load does not hide the growth at the small sizes.
+    """
+    baseline = measurements[BASELINE_ECUS].get(key, 0.0)
+    points = [
+        (math.log(ecus), math.log(measurements[ecus][key] - baseline))
+        for ecus in SIZES
+        if measurements[ecus].get(key, 0.0) > baseline
+    ]
+    if len(points) < 2:
+        pytest.skip(f"{key} does not grow measurably")
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / sum(
+        (x - mean_x) ** 2 for x, _ in points
+    )
+
+
+@pytest.mark.parametrize("key", ["total", "memory"])
+def test_load_scales_linearly(measurements, key):
+    assert _exponent(measurements, key) < MAX_EXPONENT
+
+
+@pytest.mark.parametrize(
+    "phase", ["discover", "parse", "validate", "link", "cross-validate"]
+)
+def test_phases_scale_linearly(measurements, phase):
+    if measurements[max(SIZES)].get(phase, 0.0) < MIN_PHASE_SECONDS:
+        pytest.skip(f"{phase} is too fast to measure")
+    assert _exponent(measurements, phase) < MAX_EXPONENT
@@ -28,3 +28,21 @@ def reset_all_registries(base_cls: BaseRegistry):
 def reset_global_registery():
     for cls in CENTRAL_REGISTRIES:
         reset_all_registries(cls)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="run the scaling benchmarks",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="needs --run-benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,110 @@
+import ast
+import importlib
+import importlib.util
+import inspect
+import json
+import subprocess
+import sys
+
+import pytest
+
+LAZY_PACKAGES = [
+    "flync",
+    "flync.model",
+    "flync.model.flync_4_ecu",
+    "flync.model.flync_4_general_configuration",
+    "flync.model.flync_4_metadata",
+    "flync.model.flync_4_security",
+    "flync.model.flync_4_someip",
+    "flync.model.flync_4_topology",
+    "flync.model.flync_4_tsn",
+]
+
+# seconds a cold import may take in a fresh interpreter; generous, as it
+# guards against importing all models again rather than measuring speed
+IMPORT_BUDGET = 1.0
+
+
+def _cold_import(statement):
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(json.dumps({'seconds': time.perf_counter() - start, "
+        "'modules': sorted(sys.modules)}))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+@pytest.mark.parametrize("package", LAZY_PACKAGES)
+def test_lazy_package_exports_all_names(package):
+    module = importlib.import_module(package)
+
+    assert set(module.__all__) <= set(dir(module))
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        module.missing
+
+
+def _type_checking_imports(package, source):
+    imports = {}
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.If) and ast.unparse(node.test) == (
+            "TYPE_CHECKING"
+        ):
+            for statement in node.body:
+                module = "." * statement.level + (statement.module or "")
+                for alias in statement.names:
+                    if statement.module is None:
+                        imported = module + alias.name
+                    else:
+                        imported = module
+                    imports[alias.name] = importlib.util.resolve_name(
+                        imported, package
+                    )
+    return imports
+
+
+@pytest.mark.parametrize("package", LAZY_PACKAGES)
+def test_lazy_exports_match_the_type_checking_imports(package):
+    module = importlib.import_module(package)
+
+    assert {
+        name: importlib.util.resolve_name(path, package)
+        for name, path in module._LAZY.items()
+    } == _type_checking_imports(package, inspect.getsource(module))
+
+
+@pytest.mark.parametrize("statement", ["import flync", "import flync.sdk.cli"])
+def test_import_does_not_load_models(statement):
+    result = _cold_import(statement)
+
+    assert not [m for m in result["modules"] if m.startswith("flync.model.")]
+    assert "pydantic" not in result["modules"]
+    assert result["seconds"] < IMPORT_BUDGET
+
+
+def test_submodule_import_loads_only_its_dependencies():
+    result = _cold_import("from flync.model.flync_4_tsn import Stream")
+
+    assert "flync.model.flync_4_tsn.qos" in result["modules"]
+    assert "flync.model.flync_4_tsn.timesync" not in result["modules"]
+    assert "flync.model.flync_4_someip" not in result["modules"]
+
+
+def test_model_schemas_are_built_on_first_use():
+    result = _cold_import(
+        "from flync.model import FLYNCModel\n"
+        "assert not FLYNCModel.__pydantic_complete__\n"
+        "FLYNCModel.model_fields\n"
+        "assert not FLYNCModel.__pydantic_complete__"
+    )
+
+    assert "flync.model.flync_model" in result["modules"]
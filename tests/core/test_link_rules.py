@@ -0,0 +1,68 @@
+import pytest
+from pydantic import BaseModel
+
+from flync.core.utils.exceptions import err_major
+from flync.core.utils.link_rules import (
+    LinkQueue,
+    LinkRule,
+    defer_link_rules,
+    link_rule,
+    run_link_rules,
+    schedule_link_rules,
+)
+
+
+def _rule(name, reads=(), writes=()):
+    return LinkRule(name, lambda m: m, frozenset(reads), frozenset(writes))
+
+
+class LinkedModel(BaseModel):
+    name: str
+
+    @link_rule(reads=("names",))
+    def check_name(self):
+        if self.name == "bad":
+            raise err_major("The name {name} is not allowed", name=self.name)
+        return self
+
+
+def test_writers_are_scheduled_before_readers():
+    reader = _rule("reader", reads=("links",))
+    writer = _rule("writer", writes=("links",))
+    other = _rule("other", reads=("addresses",), writes=("sockets",))
+
+    assert schedule_link_rules([reader, other, writer]) == [
+        [other, writer],
+        [reader],
+    ]
+
+
+def test_cyclic_rules_are_rejected():
+    first = _rule("first", reads=("y",), writes=("x",))
+    second = _rule("second", writes=("x", "z"))
+    third = _rule("third", reads=("z",), writes=("y",))
+
+    assert schedule_link_rules([first, second]) == [[first], [second]]
+    with pytest.raises(ValueError, match="depend on each other"):
+        schedule_link_rules([first, second, third])
+
+
+def test_deferred_rules_run_once_per_model():
+    queue = LinkQueue()
+    with defer_link_rules(queue):
+        bad = LinkedModel(name="bad")
+        LinkedModel.model_validate(bad)
+        LinkedModel(name="good")
+    assert len(queue) == 2
+
+    (failure,) = run_link_rules(queue.drain())
+    assert failure.instance is bad
+    assert failure.error_details()["loc"] == ()
+    assert failure.error_details(("items", 1))["loc"] == ("items", 1)
+    assert failure.error_details()["msg"] == "The name bad is not allowed"
+    assert not len(queue)
+
+
+def test_rules_run_inline_by_default():
+    with pytest.raises(ValueError, match="The name bad is not allowed"):
+        LinkedModel(name="bad")
@@ -0,0 +1,57 @@
+import pytest
+from pydantic import field_validator, model_validator
+
+from flync.core.base_models import FLYNCBaseModel
+from flync.core.utils.profiling import (
+    ValidationProfiler,
+    get_active_profiler,
+)
+
+
+class ProfiledModel(FLYNCBaseModel):
+    value: int
+
+    @field_validator("value")
+    @classmethod
+    def check_value(cls, value):
+        return value
+
+    @model_validator(mode="after")
+    def check_model(self):
+        return self
+
+
+def test_profiler_counts_validator_calls():
+    with ValidationProfiler() as profiler:
+        assert get_active_profiler() is profiler
+        for value in range(3):
+            ProfiledModel(value=value)
+        profiler.add_phase("parse", 1.0, 1.5, uri="file:///a.yaml")
+
+    assert get_active_profiler() is None
+    assert profiler.validators["ProfiledModel.check_value"].calls == 3
+    assert profiler.validators["ProfiledModel.check_model"].calls == 3
+    assert profiler.phases["parse"].total == 0.5
+    assert {name for name, _, _ in profiler.report()} == {
+        "ProfiledModel.check_value",
+        "ProfiledModel.check_model",
+    }
+    phase = next(
+        e
+        for e in profiler.to_chrome_trace()["traceEvents"]
+        if e["cat"] == "phase"
+    )
+    assert phase["dur"] == 0.5e6
+    assert phase["args"] == {"uri": "file:///a.yaml"}
+
+
+def test_profiler_records_nothing_when_inactive():
+    profiler = ValidationProfiler(trace=False)
+    ProfiledModel(value=1)
+    with profiler:
+        with pytest.raises(RuntimeError):
+            ValidationProfiler().__enter__()
+        ProfiledModel(value=1)
+
+    assert profiler.validators["ProfiledModel.check_value"].calls == 1
+    assert profiler.events == []
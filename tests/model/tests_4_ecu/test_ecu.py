@@ -3,20 +3,21 @@ from flync.model.flync_4_someip import (
     SOMEIPServiceInterface,
 )
 from pathlib import Path
+from flync.core.base_models import UniqueName
+from flync.core.base_models.registry_context import RegistryContext
 from flync.model.flync_4_ecu import (
     BASET1,
+    ControllerInterface,
     ECU,
     ECUPort,
     MII,
+    SwitchPort,
     VLANEntry,
 )
 
 
-def test_ecu_parsing_from_dicts(
-    metadata_entry, embedded_metadata_entry, ecu_port: ECUPort, MII_entry
-):
-    SOMEIPServiceInterface(meta=metadata_entry, name="s", id=1)
-    kwargs = dict(
+def _ecu_kwargs(metadata_entry, embedded_metadata_entry):
+    return dict(
         name="test",
         topology={
             "connections": [
@@ -58,6 +59,13 @@ def test_ecu_parsing_from_dicts(
         ],
         ecu_metadata=metadata_entry,
     )
+
+
+def test_ecu_parsing_from_dicts(
+    metadata_entry, embedded_metadata_entry, ecu_port: ECUPort, MII_entry
+):
+    SOMEIPServiceInterface(meta=metadata_entry, name="s", id=1)
+    kwargs = _ecu_kwargs(metadata_entry, embedded_metadata_entry)
     # print(ecu_port_example)
     # assert isinstance(ecu_port_example,ECUPort)
     print("JOb", kwargs)
@@ -82,6 +90,22 @@ def test_ecu_parsing_from_dicts(
     #     )
 
 
+def test_ecu_keeps_names_in_the_registry_context(
+    metadata_entry, embedded_metadata_entry
+):
+    context = RegistryContext()
+    with context.activate():
+        ECU.model_validate(
+            _ecu_kwargs(metadata_entry, embedded_metadata_entry)
+        )
+        assert "SwitchPort.b" in SwitchPort.NAMES
+        assert SwitchPort.NAMES is UniqueName.NAMES
+        assert ControllerInterface.NAMES is UniqueName.NAMES
+        SwitchPort.reset()
+        assert "SwitchPort.b" not in UniqueName.NAMES
+    assert "SwitchPort.b" not in UniqueName.NAMES
+
+
 # def test_ecu_loding_without_general():
 #     file_path = Path("examples/flync_basic_example")
 #     with pytest.raises(ValueError):
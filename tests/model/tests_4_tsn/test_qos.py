@@ -354,6 +354,62 @@ def test_negative_traffic_class_containing_ipv_should_be_defined_on_atleast_one_
         )
 
 
+def test_negative_all_missing_ipvs_reported_in_one_error(
+    embedded_metadata_entry, vlan_entry, MII_entry
+):
+    cbs_shaper_example = {
+        "type": "cbs",
+        "idleslope": 100000,
+    }
+    stream_example = {
+        "name": "Stream1",
+        "ipv": 1,
+    }
+    port_a = SwitchPort(
+        name="Ingress_port_A",
+        silicon_port_no=1,
+        default_vlan_id=35,
+        mii_config=MII_entry,
+        traffic_classes=[
+            {
+                "name": "Low_Priority_Traffic",
+                "priority": 1,
+                "internal_priority_values": [0, 1],
+                "selection_mechanisms": cbs_shaper_example,
+            }
+        ],
+    )
+    port_b = SwitchPort(
+        name="Ingress_port_B",
+        silicon_port_no=2,
+        default_vlan_id=35,
+        mii_config=MII_entry,
+        traffic_classes=[
+            {
+                "name": "High_Priority_Traffic",
+                "priority": 2,
+                "internal_priority_values": [2],
+                "selection_mechanisms": cbs_shaper_example,
+            }
+        ],
+        ingress_streams=[stream_example],
+    )
+    with pytest.raises(ValidationError) as e:
+        Switch.model_validate(
+            {
+                "meta": embedded_metadata_entry,
+                "name": "switch1",
+                "ports": [port_a, port_b],
+                "vlans": [vlan_entry],
+            }
+        )
+    assert len(e.value.errors()) == 1
+    message = e.value.errors()[0]["msg"]
+    assert "internal priority values 0, 2." in message
+    assert "Low_Priority_Traffic" in message
+    assert "High_Priority_Traffic" in message
+
+
 def test_negative_ats_instance_for_traffic_class(vlan_entry, MII_entry):
     ats_shaper_example = {"type": "ats"}
     traffic_class_example = {
@@ -0,0 +1,92 @@
+import shutil
+
+from rich.console import Console
+
+from flync.sdk.helpers.batch_validation import (
+    WorkspaceReport,
+    render_reports,
+    validate_workspaces,
+)
+from flync.sdk.workspace.diagnostic import Diagnostic
+
+
+def test_batch_validation_reports_each_workspace(
+    get_flync_example_path, tmp_path
+):
+    broken = tmp_path / "broken"
+    shutil.copytree(get_flync_example_path, broken)
+    (broken / "system_metadata.flync.yaml").unlink()
+
+    reports = validate_workspaces(
+        [get_flync_example_path, broken, get_flync_example_path], jobs=3
+    )
+
+    assert [r.name for r in reports] == [
+        "flync_example",
+        "broken",
+        "flync_example",
+    ]
+    assert [r.ok for r in reports] == [True, False, True]
+    assert any(e["loc"][0] == "metadata" for e in reports[1].errors)
+
+    console = Console(record=True, width=200)
+    render_reports(reports, console)
+    output = console.export_text()
+    assert "broken" in output
+    assert "invalid" in output
+
+
+def test_reports_show_the_source_of_every_diagnostic(tmp_path):
+    uri = (tmp_path / "ecu.flync.yaml").as_uri()
+    error = {"type": "missing", "loc": ("name",), "msg": "Field required"}
+    yaml_error = {"type": "yaml_error", "loc": (), "msg": "bad YAML"}
+    # document level diagnostics have no counterpart in the errors
+    report = WorkspaceReport(
+        name="broken",
+        path=tmp_path,
+        errors=[error],
+        diagnostics=[
+            Diagnostic(uri, None, yaml_error, 7, 1),
+            Diagnostic(uri, "ecu", error, 3, 5),
+        ],
+    )
+
+    console = Console(record=True, width=200)
+    render_reports([report], console)
+    output = console.export_text()
+    assert "ecu.flync.yaml:7:1" in output
+    assert "ecu.flync.yaml:3:5" in output
+    assert "bad YAML" in output
+
+
+def test_threaded_validation_matches_sequential(
+    get_flync_example_path, tmp_path
+):
+    paths = []
+    for index, (name, old, new) in enumerate(
+        [
+            ("z1_controller1.flync.yaml", "10.0.10.1\n", "10.0.10.1999\n"),
+            ("hpc_switch1.flync.yaml", "- name: hpc_s1_p0\n", "- name: 7\n"),
+            ("zonal_platform1/ports.flync.yaml", "z1_p1", "z1_p9"),
+            ("system_topology.flync.yaml", "hpc1_p1", "hpc1_p9"),
+        ]
+    ):
+        path = tmp_path / f"broken_{index}"
+        shutil.copytree(get_flync_example_path, path)
+        document = next(path.rglob(name))
+        document.write_text(document.read_text().replace(old, new))
+        paths.append(path)
+    paths *= 3
+
+    def findings(reports):
+        return [
+            [
+                (d.uri, d.line, d.column, d.error["msg"])
+                for d in report.diagnostics
+            ]
+            for report in reports
+        ]
+
+    sequential = findings(validate_workspaces(paths))
+    assert all(sequential)
+    assert findings(validate_workspaces(paths, jobs=8)) == sequential
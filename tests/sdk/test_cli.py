@@ -0,0 +1,65 @@
+import json
+import shutil
+
+from typer.testing import CliRunner
+
+from flync.sdk.cli import app
+
+runner = CliRunner()
+
+
+def test_validate_valid_workspace_as_json(get_flync_example_path):
+    result = runner.invoke(
+        app, ["validate", get_flync_example_path, "--format", "json"]
+    )
+
+    assert result.exit_code == 0, result.output
+    output = json.loads(result.stdout)
+    assert output["valid"]
+    assert output["diagnostics"] == []
+    assert output["timings"]["validate"] > 0
+
+
+def test_validate_reports_errors_as_jsonl_and_sarif(
+    get_flync_example_path, tmp_path, monkeypatch
+):
+    shutil.copytree(get_flync_example_path, tmp_path / "broken")
+    (tmp_path / "broken" / "system_metadata.flync.yaml").unlink()
+    monkeypatch.chdir(tmp_path)
+
+    jsonl = runner.invoke(
+        app, ["validate", "broken", "--format", "jsonl", "--jobs", "2"]
+    )
+    sarif = runner.invoke(app, ["validate", "broken", "--format", "sarif"])
+
+    assert jsonl.exit_code == 1
+    diagnostics = [json.loads(line) for line in jsonl.stdout.splitlines()]
+    assert any(d["loc"][0] == "metadata" for d in diagnostics)
+    assert sarif.exit_code == 1
+    results = json.loads(sarif.stdout)["runs"][0]["results"]
+    assert len(results) == len(diagnostics)
+
+
+def test_validate_profile_and_cache(get_flync_example_path, tmp_path):
+    args = ["validate", get_flync_example_path, "--profile"]
+    args += ["--cache-dir", str(tmp_path)]
+
+    result = runner.invoke(app, args)
+
+    assert result.exit_code == 0, result.output
+    assert "cross-validate" in result.output
+    assert any(tmp_path.iterdir())
+
+
+def test_validate_writes_chrome_trace(get_flync_example_path, tmp_path):
+    trace_file = tmp_path / "trace.json"
+    args = ["validate", get_flync_example_path, "--trace", str(trace_file)]
+
+    result = runner.invoke(app, args)
+
+    assert result.exit_code == 0, result.output
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    names = {(e["cat"], e["name"]) for e in events}
+    assert ("phase", "cross-validate") in names
+    assert ("validator", "ECU.post_validation") in names
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
@@ -0,0 +1,309 @@
+import shutil
+from ipaddress import ip_address
+
+import pytest
+from pydantic import ValidationError
+from pydantic_core import PydanticCustomError
+
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+
+
+@pytest.fixture
+def flync_model(get_flync_example_path):
+    return FLYNCWorkspace.load_workspace(
+        "flync_workspace", get_flync_example_path
+    ).flync_model
+
+
+def test_lookups_match_linear_scans(flync_model):
+    for ecu in flync_model.ecus:
+        assert flync_model.get_ecu_by_name(ecu.name) is ecu
+        assert flync_model.get_interfaces_for_ecu(ecu.name) == [
+            iface.name
+            for controller in ecu.controllers
+            for iface in controller.interfaces
+        ]
+        for controller in ecu.controllers:
+            assert flync_model.get_controller_by_name(controller.name) is (
+                controller
+            )
+            for iface in controller.interfaces:
+                assert flync_model.get_interface_by_name(iface.name) is iface
+        for switch in ecu.switches:
+            assert flync_model.get_switch_by_name(switch.name) is switch
+            for port in switch.ports:
+                assert flync_model.get_switch_port_by_name(port.name) is port
+        for port in ecu.ports:
+            assert flync_model.get_ecu_port_by_name(port.name) is port
+    assert flync_model.get_ecu_by_name("unknown") is None
+    assert flync_model.get_interfaces_for_ecu("unknown") == []
+    assert len(flync_model.get_all_interfaces_names()) == len(
+        flync_model.get_all_interfaces()
+    )
+
+
+def test_indexes_are_invalidated_explicitly(flync_model):
+    ecu = flync_model.ecus[0]
+    assert flync_model.get_ecu_by_name(ecu.name) is ecu
+
+    flync_model.ecus = flync_model.ecus[1:]
+    assert flync_model.get_ecu_by_name(ecu.name) is ecu
+    flync_model.invalidate_indexes()
+    assert flync_model.get_ecu_by_name(ecu.name) is None
+
+    flync_model.ecus.append(ecu)
+    flync_model.invalidate_indexes()
+    assert flync_model.get_ecu_by_name(ecu.name) is ecu
+
+
+def test_ecu_ports_by_name_is_a_copy(flync_model):
+    ports = flync_model.get_all_ecu_ports_by_name()
+    assert ports == {p.name: p for p in flync_model.get_all_ecu_ports()}
+
+    ports.clear()
+    assert flync_model.get_all_ecu_ports_by_name()
+
+
+def test_address_queries(flync_model):
+    owner = flync_model.get_address_owner("10.0.10.1")
+    assert owner.interface.name == "z1_c1_iface1"
+    assert owner.virtual_interface.vlanid == 10
+    assert flync_model.get_address_owner("10.255.0.1") is None
+
+    all_ips = [ip for ecu in flync_model.ecus for ip in ecu.get_all_ips()]
+    assert len(flync_model.get_address_index()) == len(all_ips)
+    overlapping = flync_model.get_overlapping_subnets("10.0.0.0/16")
+    assert {o.address for o in overlapping} == {
+        ip for ip in all_ips if ip.version == 4 and ip.packed[:2] == b"\n\0"
+    }
+    assert {
+        o.address for o in flync_model.get_overlapping_subnets("10.0.10.0/28")
+    } == {ip for ip in all_ips if str(ip).startswith("10.0.10.")}
+    assert flync_model.get_address_index().subnet_conflicts() == []
+
+
+def _edit_controller(example_path, tmp_path, *replacements):
+    workspace = tmp_path / "workspace"
+    shutil.copytree(example_path, workspace)
+    controller = (
+        workspace
+        / "ecus"
+        / "zonal_platform1"
+        / "controllers"
+        / "z1_controller1.flync.yaml"
+    )
+    text = controller.read_text()
+    for original, replacement in replacements:
+        assert original in text
+        text = text.replace(original, replacement)
+    controller.write_text(text)
+    return workspace
+
+
+def test_duplicate_addresses_are_rejected(get_flync_example_path, tmp_path):
+    workspace = _edit_controller(
+        get_flync_example_path,
+        tmp_path,
+        ("address: 10.0.50.1", "address: 10.0.50.5"),
+    )
+    with pytest.raises(
+        ValidationError,
+        match="The IP 10.0.50.5 is repeated in ECU high_processing_core",
+    ):
+        FLYNCWorkspace.load_workspace("workspace", workspace)
+
+
+def test_overlapping_subnets_are_reported_not_rejected(
+    get_flync_example_path, tmp_path
+):
+    netmask = "            ipv4netmask: 255.255.255.0\n"
+    vlan10 = "          - address: 10.0.10.1\n" + netmask
+    vlan50 = "          - address: 10.0.50.1\n" + netmask
+    link_local = "          - address: fe80::{}\n            ipv6prefix: 64\n"
+    workspace = _edit_controller(
+        get_flync_example_path,
+        tmp_path,
+        (vlan10, vlan10 + link_local.format(1)),
+        (
+            vlan50,
+            vlan50.replace("255.255.255.0", "255.255.0.0")
+            + link_local.format(2),
+        ),
+    )
+    flync_model = FLYNCWorkspace.load_workspace(
+        "workspace", workspace
+    ).flync_model
+
+    conflicts = flync_model.get_subnet_conflicts()
+    assert ("10.0.0.0/16", 50, "10.0.10.0/24", 10) in {
+        (str(a.network), a.vlanid, str(b.network), b.vlanid)
+        for a, b in conflicts
+    }
+    # the same link-local subnet on every VLAN is no conflict
+    assert all(
+        a.network.version == b.network.version == 4 for a, b in conflicts
+    )
+
+
+def test_multicast_path_components(flync_model):
+    (path,) = flync_model.topology.multicast_paths.paths
+    assert [c.name for c in path.get_components()] == [
+        "eth_ecu_p1",
+        "hpc1_p3",
+        "hpc_s1_p3",
+    ]
+    assert [p.name for p in path.get_ecu_ports()] == ["eth_ecu_p1", "hpc1_p3"]
+    assert [p.name for p in path.get_switch_ports()] == ["hpc_s1_p3"]
+    assert path.get_controller_interfaces() == []
+
+
+def test_network_graph(flync_model):
+    graph = flync_model.get_network_graph()
+    assert graph is flync_model.get_network_graph()
+    components = [
+        *flync_model.get_all_ecu_ports(),
+        *flync_model.get_all_interfaces(),
+        *(p for e in flync_model.ecus for p in e.get_all_switch_ports()),
+    ]
+    assert len(graph) == len(components)
+    for component in components:
+        node = graph.node_id(component)
+        assert graph.components[node] is component
+        assert graph.kind(node) == component.type
+
+    src = graph.node_id(flync_model.get_interface_by_name("eth_ecu_c1_iface1"))
+    dst = graph.node_id(flync_model.get_interface_by_name("hpc_c1_iface1"))
+    path = graph.shortest_path(src, dst)
+    assert [graph.components[n].name for n in path] == [
+        "eth_ecu_c1_iface1",
+        "eth_ecu_p1",
+        "hpc1_p3",
+        "hpc_s1_p3",
+        "hpc_s1_p1",
+        "hpc_c1_iface1",
+    ]
+    assert graph.is_reachable(src, dst)
+    assert graph.connected_components() == [list(range(len(graph)))]
+
+    external = ["ecu_port_to_ecu_port"]
+    assert not graph.is_reachable(src, dst, edge_kinds=external)
+    assert graph.shortest_path(src, dst, edge_kinds=external) is None
+    assert graph.reachable(src, edge_kinds=external) == {src}
+    ecu_port = graph.node_id(flync_model.get_ecu_port_by_name("eth_ecu_p1"))
+    assert set(graph.neighbours(ecu_port, edge_kinds=external)) == {
+        graph.node_id(flync_model.get_ecu_port_by_name("hpc1_p3"))
+    }
+
+
+def test_network_graph_links_inside_components(flync_model):
+    graph = flync_model.get_network_graph()
+    switch = max(
+        (s for e in flync_model.ecus for s in e.switches),
+        key=lambda s: len(s.ports),
+    )
+    ports = [graph.node_id(p) for p in switch.ports]
+    assert len(ports) > 2
+    # the ports of a switch are linked without storing an edge per pair
+    for port in ports:
+        others = set(graph.neighbours(port, edge_kinds=["switch"]))
+        assert others == set(ports) - {port}
+    assert graph.reachable(ports[0], edge_kinds=["switch"]) == set(ports)
+    assert graph.shortest_path(ports[0], ports[-1], ["switch"]) == [
+        ports[0],
+        ports[-1],
+    ]
+    connections = len(flync_model.topology.system_topology.connections) + sum(
+        len(e.topology.connections) for e in flync_model.ecus
+    )
+    assert len(graph.targets) <= 2 * connections
+    assert len(graph.members) <= len(graph)
+
+
+def test_component_owners(flync_model):
+    for ecu in flync_model.ecus:
+        assert all(port.ecu is ecu for port in ecu.ports)
+        for controller in ecu.controllers:
+            assert controller.ecu is ecu
+            for iface in controller.interfaces:
+                assert iface.get_controller() is controller
+                assert iface.get_other_interfaces() is controller.interfaces
+        for switch in ecu.switches:
+            assert switch.ecu is ecu
+            assert all(port.get_switch() is switch for port in switch.ports)
+
+
+def test_component_owners_are_unique(flync_model):
+    controllers = flync_model.get_all_controllers()
+    iface = controllers[0].interfaces[0]
+    controllers[1].interfaces.append(iface)
+    with pytest.raises(PydanticCustomError, match="is part of both"):
+        flync_model.validate_component_owners()
+    controllers[1].interfaces.pop()
+
+    iface._controller = None
+    with pytest.raises(PydanticCustomError, match="is not linked"):
+        flync_model.validate_component_owners()
+
+
+def test_multicast_forwarding_table(get_flync_example_path, tmp_path):
+    workspace = tmp_path / "workspace"
+    shutil.copytree(get_flync_example_path, workspace)
+    switch_file = (
+        workspace
+        / "ecus"
+        / "high_processing_core"
+        / "switches"
+        / "hpc_switch1.flync.yaml"
+    )
+    vlan40 = "    - hpc_s1_p3\n    - hpc_s1_p4\n"
+    text = switch_file.read_text()
+    assert vlan40 in text
+    switch_file.write_text(
+        text.replace(
+            vlan40,
+            vlan40 + "  multicast:\n"
+            "    - address: 239.0.0.1\n"
+            "      ports: [hpc_s1_p3, hpc_s1_p4]\n",
+        )
+    )
+    loaded_ws = FLYNCWorkspace.load_workspace("workspace", workspace)
+    flync_model = loaded_ws.flync_model
+
+    address = ip_address("239.0.0.1")
+    switch = flync_model.get_switch_by_name("hpc_switch1")
+    assert switch.multicast_table == {
+        (40, address): frozenset({"hpc_s1_p3", "hpc_s1_p4"})
+    }
+    assert switch.multicast_table is switch.multicast_table
+    port = flync_model.get_switch_port_by_name("hpc_s1_p3")
+    assert port.get_multicast_connected_ports(address, 40) == [
+        "hpc_s1_p3",
+        "hpc_s1_p4",
+    ]
+    assert port.get_multicast_connected_ports(address) == [
+        "hpc_s1_p3",
+        "hpc_s1_p4",
+    ]
+    assert port.get_multicast_connected_ports(address, 10) == []
+    assert (
+        flync_model.get_switch_port_by_name(
+            "hpc_s1_p0"
+        ).get_multicast_connected_ports(address)
+        == []
+    )
+
+    (path,) = flync_model.topology.multicast_paths.paths
+    assert "hpc_s1_p4" in [c.name for c in path.get_switch_ports()]
+
+    # the multicast traffic only follows the groups of the VLAN of a path
+    assert path.vlan == 40
+    other_vlan = path.model_copy(update={"vlan": 10})
+    with loaded_ws.registries.activate():
+        adjacent = {
+            c.name for c in path.get_adjacent_components(port, address)
+        }
+        assert "hpc_s1_p4" in adjacent
+        adjacent = {
+            c.name for c in other_vlan.get_adjacent_components(port, address)
+        }
+        assert "hpc_s1_p4" not in adjacent
@@ -0,0 +1,483 @@
+import pickle
+import shutil
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from ipaddress import ip_address
+from typing import Annotated, Literal, Optional, Union
+
+import pytest
+from pydantic import Field, ValidationError
+
+from flync.core.base_models import FLYNCBaseModel, UniqueName
+from flync.core.utils.exceptions_handling import validate_with_policy
+from flync.model.flync_4_ecu import (
+    ECU,
+    Controller,
+    ControllerInterface,
+    Switch,
+    SwitchPort,
+)
+from flync.model.flync_4_general_configuration import FLYNCGeneralConfig
+from flync.model.flync_4_someip import (
+    SOMEIPConfig,
+    SOMEIPEvent,
+    SOMEIPServiceInterface,
+)
+from flync.sdk.workspace import flync_workspace
+from flync.sdk.workspace.cache import CACHEABLE_TYPES, WorkspaceCache
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+from flync.sdk.workspace.load_plan import (
+    get_load_plan,
+    get_type_plan,
+    select_union_member,
+)
+
+
+def _load(path, **kwargs) -> FLYNCWorkspace:
+    return FLYNCWorkspace.load_workspace("flync_workspace", path, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"jobs": 4}, {"executor": ThreadPoolExecutor(max_workers=2)}],
+    ids=["jobs", "executor"],
+)
+def test_parallel_load_matches_sequential(get_flync_example_path, kwargs):
+    sequential = _load(get_flync_example_path)
+    parallel = _load(get_flync_example_path, **kwargs)
+
+    assert parallel.flync_model.model_dump(warnings=False) == (
+        sequential.flync_model.model_dump(warnings=False)
+    )
+    assert parallel.load_errors == sequential.load_errors
+    assert parallel.documents.keys() == sequential.documents.keys()
+
+
+class _SlowFuture(Future):
+    def result(self, timeout=None):
+        time.sleep(0.05)
+        return super().result(timeout)
+
+
+class _SlowExecutor(Executor):
+    """Parses right away, but takes a while to hand the results over."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = _SlowFuture()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{}, {"executor": _SlowExecutor()}], ids=["sequential", "pool"]
+)
+def test_load_times_discovery_and_parsing(get_flync_example_path, kwargs):
+    loaded_ws = FLYNCWorkspace("flync_workspace", get_flync_example_path)
+    loaded_ws.load(**kwargs)
+
+    assert loaded_ws.timings["discover"] > 0
+    # waiting for the results of the pool is not parsing
+    assert 0 < loaded_ws.timings["parse"] < 0.05 * len(loaded_ws.documents)
+
+
+def test_documents_keep_text_and_build_ast_lazily(get_flync_example_path):
+    loaded_ws = _load(get_flync_example_path)
+    doc = next(
+        d
+        for uri, d in loaded_ws.documents.items()
+        if uri.endswith("system_topology.flync.yaml")
+    )
+
+    assert doc.text
+    assert doc.data["connections"][0]["id"] == "conn1"
+    assert doc._ast is None
+    assert doc.ast["connections"][0].lc.line == 1
+
+
+def _registry_snapshot(loaded_ws):
+    with loaded_ws.registries.activate():
+        return (
+            set(UniqueName.NAMES),
+            [c.name for c in Controller.INSTANCES],
+            [s.name for s in Switch.INSTANCES],
+            list(ControllerInterface.INSTANCES),
+            list(SwitchPort.INSTANCES),
+            list(SOMEIPServiceInterface.INSTANCES),
+            list(SOMEIPEvent.INSTANCES_BY_NAME),
+            sorted(map(str, Controller.ADDRESSES)),
+        )
+
+
+def test_warm_cache_restores_subtrees_without_validation(
+    get_flync_example_path, tmp_path, monkeypatch
+):
+    cold = _load(get_flync_example_path, cache_dir=tmp_path)
+    cold_registries = _registry_snapshot(cold)
+
+    validated_types = []
+
+    def validate_spy(model, data):
+        validated_types.append(model)
+        return validate_with_policy(model, data)
+
+    monkeypatch.setattr(flync_workspace, "validate_with_policy", validate_spy)
+    warm = _load(get_flync_example_path, cache_dir=tmp_path)
+
+    assert warm.flync_model.model_dump(warnings=False) == (
+        cold.flync_model.model_dump(warnings=False)
+    )
+    assert warm.load_errors == cold.load_errors
+    assert _registry_snapshot(warm) == cold_registries
+    assert validated_types
+    assert not set(validated_types) & set(CACHEABLE_TYPES)
+    assert warm.flync_model.topology.system_topology.connections
+
+
+def test_cache_revalidates_changed_documents(get_flync_example_path, tmp_path):
+    workspace = tmp_path / "workspace"
+    shutil.copytree(get_flync_example_path, workspace)
+    _load(workspace, cache_dir=tmp_path / "cache")
+
+    controller_file = next(workspace.rglob("z1_controller1.flync.yaml"))
+    controller_file.write_text(
+        controller_file.read_text().replace("10.0.10.1", "10.0.10.11")
+    )
+    loaded_ws = _load(workspace, cache_dir=tmp_path / "cache")
+
+    all_ips = {
+        str(ip)
+        for ecu in loaded_ws.flync_model.ecus
+        for ip in ecu.get_all_ips()
+    }
+    assert "10.0.10.11" in all_ips
+    assert "10.0.10.1" not in all_ips
+
+
+def test_cache_ignores_entries_of_another_secret(
+    get_flync_example_path, tmp_path, monkeypatch
+):
+    cache_dir = tmp_path / "cache"
+    cold = FLYNCWorkspace("cold", get_flync_example_path)
+    cold.cache = WorkspaceCache(cache_dir, secret=b"writer")
+    cold.load()
+    assert list(cache_dir.rglob("*.json"))
+    assert list(cache_dir.rglob("*.pickle"))
+
+    validated_types = []
+
+    def validate_spy(model, data):
+        validated_types.append(model)
+        return validate_with_policy(model, data)
+
+    monkeypatch.setattr(flync_workspace, "validate_with_policy", validate_spy)
+    warm = FLYNCWorkspace("warm", get_flync_example_path)
+    warm.cache = WorkspaceCache(cache_dir, secret=b"reader")
+    warm.load()
+
+    # parsed documents are plain data and reused, models are validated
+    assert set(validated_types) >= set(CACHEABLE_TYPES)
+    assert warm.load_errors == cold.load_errors
+
+
+def _document_uri(loaded_ws, file_name):
+    return next(u for u in loaded_ws.documents if u.endswith(file_name))
+
+
+def test_update_revalidates_only_dependent_objects(get_flync_example_path):
+    loaded_ws = _load(get_flync_example_path)
+    untouched = dict(loaded_ws.objects)
+    uri = _document_uri(loaded_ws, "z1_controller1.flync.yaml")
+    controller_id = loaded_ws._document_units[uri]
+
+    assert "ecus/zonal_platform1" in loaded_ws.reverse_deps[controller_id]
+
+    text = loaded_ws.documents[uri].text.replace("10.0.10.1", "10.0.10.11")
+    affected = loaded_ws._update_document_text(uri, text)
+
+    # the ECU links its new controller, the system and topology are kept
+    assert affected == {"ecus/zonal_platform1", controller_id}
+    for object_id, model in loaded_ws.objects.items():
+        if object_id not in affected:
+            assert model is untouched[object_id]
+    ecu = loaded_ws.objects["ecus/zonal_platform1"]
+    assert loaded_ws.objects[controller_id] in ecu.controllers
+    assert loaded_ws.objects[controller_id].ecu is ecu
+    all_ips = {
+        str(ip)
+        for ecu in loaded_ws.flync_model.ecus
+        for ip in ecu.get_all_ips()
+    }
+    assert "10.0.10.11" in all_ips
+    assert "10.0.10.1" not in all_ips
+    assert not loaded_ws.load_errors
+
+
+def test_update_checks_the_system_again(get_flync_example_path):
+    loaded_ws = _load(get_flync_example_path)
+    uri = _document_uri(loaded_ws, "z1_controller1.flync.yaml")
+    text = loaded_ws.documents[uri].text
+
+    # an address of another ECU is only caught by the system checks
+    loaded_ws._update_document_text(
+        uri, text.replace("10.0.10.1\n", "10.0.40.6\n", 1)
+    )
+    assert loaded_ws.flync_model is None
+    assert any("10.0.40.6" in e["msg"] for e in loaded_ws.load_errors)
+
+    loaded_ws._update_document_text(uri, text)
+    assert not loaded_ws.load_errors
+    assert loaded_ws.flync_model.get_address_owner("10.0.10.1").ecu.name == (
+        "zonal_platform1"
+    )
+
+
+def test_update_revalidates_units_failing_on_a_restored_name(
+    get_flync_example_path,
+):
+    loaded_ws = _load(get_flync_example_path)
+    uri = (
+        loaded_ws.workspace_root / "ecus/zonal_platform1/ports.flync.yaml"
+    ).as_uri()
+    text = loaded_ws.documents[uri].text
+
+    loaded_ws._update_document_text(uri, text.replace("z1_p1", "z1_p9"))
+    assert loaded_ws.objects["topology"] is None
+    assert any("z1_p1" in e["msg"] for e in loaded_ws.load_errors)
+
+    # the topology holds no link to the port it failed to find
+    revalidated = loaded_ws._update_document_text(uri, text)
+    assert "topology" in revalidated
+    assert not loaded_ws.diagnostics
+    assert loaded_ws.flync_model is not None
+
+
+def test_update_reports_and_clears_diagnostics(get_flync_example_path):
+    loaded_ws = _load(get_flync_example_path)
+    reference = loaded_ws.flync_model.model_dump(warnings=False)
+    uri = _document_uri(loaded_ws, "z1_controller1.flync.yaml")
+    text = loaded_ws.documents[uri].text
+
+    loaded_ws._update_document_text(uri, text.replace("name:", "nme:", 1))
+    assert loaded_ws.flync_model is None
+    assert any(d.uri == uri for d in loaded_ws.diagnostics)
+
+    assert loaded_ws._update_document_text(uri, "name: [") == set()
+    assert loaded_ws.diagnostics[0].error["type"] == "yaml_error"
+
+    loaded_ws._update_document_text(uri, text)
+    assert not loaded_ws.diagnostics
+    assert loaded_ws.flync_model.model_dump(warnings=False) == reference
+
+
+def test_load_plan_is_compiled_once_per_class():
+    plan = get_load_plan(ECU, ".flync.yaml")
+
+    assert get_load_plan(ECU, ".flync.yaml") is plan
+    fields = {f.name: f for f in plan.fields}
+    assert fields["ports"].single_file
+    assert fields["ports"].external_path == "ports.flync.yaml"
+    assert fields["name"].folder_name
+    controllers = fields["controllers"].type_plan
+    assert controllers.origin is list
+    assert controllers.members[0].annotation is Controller
+    assert pickle.loads(pickle.dumps(plan)) == plan
+
+
+def test_optional_subtrees_are_not_guessed(
+    get_flync_example_path, tmp_path, monkeypatch
+):
+    workspace = tmp_path / "workspace"
+    shutil.copytree(get_flync_example_path, workspace)
+    shutil.rmtree(workspace / "general")
+    for sockets in workspace.glob("ecus/*/sockets"):
+        shutil.rmtree(sockets)
+
+    validated_types = []
+
+    def validate_spy(model, data):
+        validated_types.append(model)
+        return validate_with_policy(model, data)
+
+    monkeypatch.setattr(flync_workspace, "validate_with_policy", validate_spy)
+    loaded_ws = _load(workspace)
+
+    assert loaded_ws.flync_model.general is None
+    assert not loaded_ws.load_errors
+    assert FLYNCGeneralConfig not in validated_types
+    assert SOMEIPConfig not in validated_types
+    assert len(validated_types) == len(loaded_ws.objects)
+
+
+class _TCPProfile(FLYNCBaseModel):
+    kind: Literal["tcp"]
+    port: int
+
+
+class _UDPProfile(FLYNCBaseModel):
+    kind: Literal["udp"]
+    port: int
+    multicast: bool = False
+
+
+def test_union_member_is_selected_up_front():
+    union = get_type_plan(
+        Annotated[Union[_TCPProfile, _UDPProfile], Field(discriminator="kind")]
+    )
+    optional = get_type_plan(Optional[_UDPProfile])
+
+    assert select_union_member(union, ".yaml", {"kind": "udp"}).annotation is (
+        _UDPProfile
+    )
+    assert select_union_member(union, ".yaml", {"multicast": True}) is (
+        union.members[1]
+    )
+    assert select_union_member(optional, ".yaml") is None
+    assert select_union_member(optional, ".yaml", {}).annotation is (
+        _UDPProfile
+    )
+
+
+def test_sockets_resolve_addresses_through_the_index(
+    get_flync_example_path,
+):
+    loaded_ws = _load(get_flync_example_path)
+    hpc = loaded_ws.flync_model.get_ecu_by_name("high_processing_core")
+    (container,) = hpc.sockets
+
+    with loaded_ws.registries.activate():
+        owner = Controller.ADDRESSES[ip_address("10.0.10.5")]
+    assert owner.ecu is hpc
+    assert owner.virtual_interface.name == container.vlan_name
+    assert [s.name for s in owner.entry.sockets] == [
+        s.name for s in container.sockets
+    ]
+
+
+def test_sockets_must_use_addresses_of_their_ecu(
+    get_flync_example_path, tmp_path
+):
+    workspace = tmp_path / "workspace"
+    shutil.copytree(get_flync_example_path, workspace)
+    shutil.copytree(
+        workspace / "ecus" / "high_processing_core" / "sockets",
+        workspace / "ecus" / "zonal_platform1" / "sockets",
+    )
+
+    with pytest.raises(ValidationError, match="does not exist in ecu"):
+        _load(workspace)
+
+
+@pytest.mark.parametrize("jobs", [None, 4], ids=["sequential", "jobs"])
+def test_deferred_links_match_inline_validation(get_flync_example_path, jobs):
+    inline = _load(get_flync_example_path)
+    deferred = _load(get_flync_example_path, jobs=jobs, defer_links=True)
+
+    assert deferred.flync_model.model_dump(warnings=False) == (
+        inline.flync_model.model_dump(warnings=False)
+    )
+    assert deferred.load_errors == inline.load_errors
+    assert "link" in deferred.timings
+    with deferred.registries.activate():
+        port = deferred.flync_model.get_ecu_port_by_name("hpc1_p3")
+        assert [c.name for c in port.connected_components] == [
+            "hpc_s1_p3",
+            "eth_ecu_p1",
+        ]
+
+
+def _findings(loaded_ws):
+    return [
+        (d.uri, d.object_id, d.error["loc"], d.message, d.line)
+        for d in loaded_ws.diagnostics
+    ]
+
+
+@pytest.mark.parametrize(
+    "document, old, new",
+    [
+        (
+            "topology/system_topology.flync.yaml",
+            "ecu2_port: eth_ecu_p1",
+            "ecu2_port: missing_p1",
+        ),
+        (
+            "ecus/high_processing_core/sockets/socket_someip.flync.yaml",
+            "vlan_name: hpc_c1_i1_viface1",
+            "vlan_name: hpc_c1_i1_viface2",
+        ),
+    ],
+    ids=["topology", "socket"],
+)
+def test_deferred_link_failures_invalidate_like_inline(
+    get_flync_example_path, tmp_path, document, old, new
+):
+    workspace = tmp_path / "workspace"
+    shutil.copytree(get_flync_example_path, workspace)
+    path = workspace / document
+    path.write_text(path.read_text().replace(old, new))
+    inline = FLYNCWorkspace("flync_workspace", workspace)
+    inline.load()
+    deferred = FLYNCWorkspace("flync_workspace", workspace)
+    deferred.load(defer_links=True)
+
+    assert inline.flync_model is None
+    assert deferred.flync_model is None
+    assert _findings(deferred) == _findings(inline)
+    assert _findings(deferred)[0][0] == path.absolute().as_uri()
+    assert {oid for oid, m in deferred.objects.items() if m is None} == {
+        oid for oid, m in inline.objects.items() if m is None
+    }
+
+
+def test_workspaces_keep_separate_registries(get_flync_example_path):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        loaded = list(
+            executor.map(_load, [get_flync_example_path] * 2, timeout=600)
+        )
+
+    for loaded_ws in loaded:
+        assert not loaded_ws.load_errors
+        with loaded_ws.registries.activate():
+            assert Controller.INSTANCES
+            assert all(
+                any(c is controller for c in Controller.INSTANCES)
+                for ecu in loaded_ws.flync_model.ecus
+                for controller in ecu.controllers
+            )
+    assert not UniqueName.NAMES
+    assert not Controller.INSTANCES
+
+
+def test_diagnostics_point_to_the_source(get_flync_example_path, tmp_path):
+    workspace = tmp_path / "workspace"
+    shutil.copytree(get_flync_example_path, workspace)
+    controller_file = next(workspace.rglob("z1_controller1.flync.yaml"))
+    lines = controller_file.read_text().splitlines(keepends=True)
+    line = next(i for i, text in enumerate(lines) if "10.0.10.1\n" in text)
+    lines[line] = lines[line].replace("10.0.10.1", "10.0.10.999")
+    controller_file.write_text("".join(lines))
+    loaded_ws = FLYNCWorkspace("flync_workspace", workspace)
+    loaded_ws.load()
+
+    diagnostic = next(
+        d for d in loaded_ws.diagnostics if d.error["loc"][-1] == "address"
+    )
+    assert diagnostic.uri == controller_file.as_uri()
+    assert (diagnostic.line, diagnostic.column) == (
+        line + 1,
+        lines[line].index("address") + 1,
+    )
+    assert diagnostic.source.endswith(
+        f"z1_controller1.flync.yaml:{line + 1}:13"
+    )
+    # the controller is rejected by the ECU loading it from its own file
+    parent = next(
+        d
+        for d in loaded_ws.diagnostics
+        if d.error["loc"] == ("controllers", 0)
+    )
+    assert (parent.uri, parent.line, parent.column) == (
+        controller_file.as_uri(),
+        1,
+        1,
+    )
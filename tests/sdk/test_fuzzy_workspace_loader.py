@@ -10,6 +10,8 @@ from typing import Any
 import pytest
 import yaml
 
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+
 ITERATIONS = 10
 current_dir = Path(__file__).resolve().parent
 
@@ -172,3 +174,17 @@ def test_fuzzed_yaml(seed, pytestconfig, get_flync_example_path):
 
     # Assertions depend on your expectations
     assert rc in (0, 1)  # e.g. must not crash
+
+    # deferring the link rules reports the same errors
+    inline = FLYNCWorkspace("inline", str(fuzzed))
+    inline.load()
+    deferred = FLYNCWorkspace("deferred", str(fuzzed))
+    deferred.load(jobs=4, defer_links=True)
+    assert __findings(deferred) == __findings(inline)
+
+
+def __findings(workspace: FLYNCWorkspace) -> list:
+    return [
+        (d.uri, d.object_id, d.error["loc"], d.message, d.line)
+        for d in workspace.diagnostics
+    ]
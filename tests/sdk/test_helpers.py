@@ -1,5 +1,9 @@
 from pathlib import Path
 
+from flync.sdk.helpers.generate_workspace import (
+    WorkspaceSize,
+    generate_workspace,
+)
 from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
 
 current_dir = Path(__file__).resolve().parent
@@ -31,3 +35,22 @@ def model_has_socket(loaded_ws: FLYNCWorkspace):
                     for address in vlan.addresses:
                         if address.sockets:
                             return True
+
+
+def test_generated_workspace_is_valid(tmp_path):
+    size = WorkspaceSize(ecus=7, switches_per_ecu=2, fanout=2)
+    path = generate_workspace(tmp_path / "generated", size)
+
+    loaded_ws = FLYNCWorkspace.load_workspace("generated", path)
+
+    model = loaded_ws.flync_model
+    assert not loaded_ws.load_errors
+    assert len(model.ecus) == 7
+    assert len(model.topology.system_topology.connections) == 6
+    assert all(len(ecu.switches) == 2 for ecu in model.ecus)
+    assert len(model.topology.multicast_paths.paths) == size.multicast_paths
+    assert model_has_socket(loaded_ws)
+    with loaded_ws.registries.activate():
+        graph = model.get_network_graph()
+        # the second switch of every ECU only reaches its own controllers
+        assert len(graph.connected_components()) == 1 + 7
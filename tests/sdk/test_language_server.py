@@ -0,0 +1,345 @@
+import os
+import queue
+import shutil
+import threading
+import time
+
+import pytest
+
+from flync.sdk.lsp.jsonrpc import MessageWriter, read_message
+from flync.sdk.lsp.server import FLYNCLanguageServer, apply_change
+
+
+class Client:
+    """Talks to a language server running on a thread through pipes."""
+
+    def __init__(self, server_factory):
+        client_read, server_write = os.pipe()
+        server_read, client_write = os.pipe()
+        self._writer = MessageWriter(os.fdopen(client_write, "wb"))
+        self._reader = os.fdopen(client_read, "rb")
+        self.server = server_factory(
+            os.fdopen(server_read, "rb"), os.fdopen(server_write, "wb")
+        )
+        self.messages: queue.Queue = queue.Queue()
+        self.exit_code = None
+        self._next_id = 0
+        self._serving = threading.Thread(target=self._serve, daemon=True)
+        self._serving.start()
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _serve(self):
+        self.exit_code = self.server.serve()
+
+    def exit(self):
+        self.notify("exit", None)
+        self._serving.join(timeout=60)
+        return self.exit_code
+
+    def _read(self):
+        while (message := read_message(self._reader)) is not None:
+            self.messages.put(message)
+
+    def wait_for_load(self, timeout=60):
+        """Wait until the workspace is loaded and the edits validated."""
+        deadline = time.monotonic() + timeout
+        while not self.server._loaded:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert self.server.wait_until_idle(timeout)
+
+    def send(self, data):
+        """Write raw bytes, e.g. a malformed message."""
+        self._writer._stream.write(data)
+        self._writer._stream.flush()
+
+    def notify(self, method, params):
+        self._writer.notify(method, params)
+
+    def request(self, method, params):
+        self._next_id += 1
+        self._writer.write(
+            {
+                "jsonrpc": "2.0",
+                "id": self._next_id,
+                "method": method,
+                "params": params,
+            }
+        )
+        return self.receive(lambda m: m.get("id") == self._next_id)
+
+    def receive(self, predicate, timeout=60):
+        while True:
+            message = self.messages.get(timeout=timeout)
+            if predicate(message):
+                return message
+
+    def diagnostics(self, uri):
+        return self.receive(
+            lambda m: m.get("method") == "textDocument/publishDiagnostics"
+            and m["params"]["uri"] == uri
+        )["params"]["diagnostics"]
+
+
+@pytest.fixture
+def workspace(get_flync_example_path, tmp_path):
+    path = tmp_path / "workspace"
+    shutil.copytree(get_flync_example_path, path)
+    return path
+
+
+def test_apply_incremental_changes():
+    text = "name: a\nports: [p1]\n"
+
+    text = apply_change(
+        text,
+        {
+            "range": {
+                "start": {"line": 1, "character": 8},
+                "end": {"line": 1, "character": 10},
+            },
+            "text": "p2, p3",
+        },
+    )
+    assert text == "name: a\nports: [p2, p3]\n"
+    # positions are counted in UTF-16 code units
+    text = apply_change(
+        "a: 😀x\n",
+        {
+            "range": {
+                "start": {"line": 0, "character": 5},
+                "end": {"line": 0, "character": 6},
+            },
+            "text": "y",
+        },
+    )
+    assert text == "a: 😀y\n"
+    assert apply_change(text, {"text": "b: 1\n"}) == "b: 1\n"
+
+
+def test_language_server_publishes_debounced_diagnostics(workspace):
+    client = Client(
+        lambda reader, writer: FLYNCLanguageServer(
+            reader, writer, debounce=0.2
+        )
+    )
+    controller = next(workspace.rglob("z1_controller1.flync.yaml"))
+    uri = controller.as_uri()
+    text = controller.read_text()
+    line = text.splitlines().index("          - address: 10.0.10.1")
+
+    response = client.request("initialize", {"rootUri": workspace.as_uri()})
+    assert response["result"]["capabilities"]["textDocumentSync"]["change"]
+    client.notify("initialized", {})
+    client.notify(
+        "textDocument/didOpen",
+        {
+            "textDocument": {
+                "uri": uri,
+                "languageId": "yaml",
+                "version": 1,
+                "text": text,
+            }
+        },
+    )
+    assert client.server.wait_until_idle(60)
+    objects = dict(client.server.workspace.objects)
+
+    # a burst of keystrokes, validated once the client is quiet
+    for version in (2, 3, 4):
+        column = len("          - address: 10.0.10.1") + version - 2
+        client.notify(
+            "textDocument/didChange",
+            {
+                "textDocument": {"uri": uri, "version": version},
+                "contentChanges": [
+                    {
+                        "range": {
+                            "start": {"line": line, "character": column},
+                            "end": {"line": line, "character": column},
+                        },
+                        "text": "9",
+                    }
+                ],
+            },
+        )
+    diagnostics = client.diagnostics(uri)
+    assert client.server.workspace.documents[uri].text.count("10.0.10.1999")
+    assert {d["range"]["start"]["line"] for d in diagnostics} >= {line}
+    assert all(d["source"] == "flync" for d in diagnostics)
+    # only the edited sub-tree and its dependents were validated again
+    untouched = [
+        object_id
+        for object_id, model in client.server.workspace.objects.items()
+        if model is objects.get(object_id)
+    ]
+    assert untouched
+
+    client.notify(
+        "textDocument/didChange",
+        {
+            "textDocument": {"uri": uri, "version": 5},
+            "contentChanges": [{"text": text}],
+        },
+    )
+    assert client.diagnostics(uri) == []
+    assert client.request("shutdown", None)["result"] is None
+    assert client.exit() == 0
+
+
+def test_unknown_requests_are_rejected(workspace):
+    client = Client(FLYNCLanguageServer)
+
+    response = client.request("textDocument/hover", {})
+    assert response["error"]["code"] == -32601
+    assert client.exit() == 1
+
+
+def test_malformed_messages_are_answered_with_parse_errors(workspace):
+    client = Client(FLYNCLanguageServer)
+
+    client.send(b"Content-Length: 9\r\n\r\n{invalid}")
+    response = client.receive(lambda m: "error" in m)
+    assert response["id"] is None
+    assert response["error"]["code"] == -32700
+    client.send(b"Content-Type: application/json\r\n\r\n")
+    response = client.receive(lambda m: "error" in m)
+    assert response["error"]["code"] == -32700
+    # the server keeps serving
+    response = client.request("initialize", {"rootUri": workspace.as_uri()})
+    assert response["result"]["capabilities"]
+    assert client.request("shutdown", None)["result"] is None
+    assert client.exit() == 0
+
+
+def test_documents_created_after_the_load_are_validated(workspace):
+    client = Client(FLYNCLanguageServer)
+    controller = next(workspace.rglob("z1_controller1.flync.yaml"))
+    uri = controller.as_uri()
+    text = controller.read_text()
+    controller.unlink()
+
+    client.request("initialize", {"rootUri": workspace.as_uri()})
+    client.notify("initialized", {})
+    client.wait_for_load()
+    assert uri not in client.server.workspace.documents
+
+    controller.write_text(text)
+    broken = text.replace("10.0.10.1\n", "10.0.10.1999\n")
+    client.notify(
+        "textDocument/didOpen",
+        {
+            "textDocument": {
+                "uri": uri,
+                "languageId": "yaml",
+                "version": 1,
+                "text": broken,
+            }
+        },
+    )
+    assert client.diagnostics(uri)
+    assert client.server.workspace.documents[uri].text == broken
+
+    assert client.request("shutdown", None)["result"] is None
+    assert client.exit() == 0
+
+
+def test_completion_definition_and_references(workspace):
+    client = Client(FLYNCLanguageServer)
+    switch = next(workspace.rglob("hpc_switch1.flync.yaml"))
+    uri = switch.as_uri()
+    text = switch.read_text()
+    lines = text.splitlines()
+    definition = lines.index("- name: hpc_s1_p0")
+    reference = lines.index("    - hpc_s1_p0")
+
+    response = client.request("initialize", {"rootUri": workspace.as_uri()})
+    assert response["result"]["capabilities"]["definitionProvider"]
+    client.notify("initialized", {})
+    client.notify(
+        "textDocument/didOpen",
+        {
+            "textDocument": {
+                "uri": uri,
+                "languageId": "yaml",
+                "version": 1,
+                "text": text,
+            }
+        },
+    )
+    # queries are answered once the workspace is loaded
+    document = {"uri": uri}
+    at_reference = {"line": reference, "character": 8}
+
+    result = client.request(
+        "textDocument/definition",
+        {"textDocument": document, "position": at_reference},
+    )["result"]
+    assert [(r["uri"], r["range"]["start"]["line"]) for r in result] == [
+        (uri, definition)
+    ]
+    result = client.request(
+        "textDocument/references",
+        {
+            "textDocument": document,
+            "position": {"line": definition, "character": 10},
+            "context": {"includeDeclaration": True},
+        },
+    )["result"]
+    assert {r["range"]["start"]["line"] for r in result} >= {
+        definition,
+        reference,
+    }
+    # completes the names of the kind the field refers to
+    result = client.request(
+        "textDocument/completion",
+        {
+            "textDocument": document,
+            "position": {"line": reference, "character": len("    - hpc_s1")},
+        },
+    )["result"]
+    labels = [item["label"] for item in result]
+    assert "hpc_s1_p0" in labels
+    assert all(label.startswith("hpc_s1") for label in labels)
+    assert {item["detail"].split()[0] for item in result} == {"switch_port"}
+
+    assert client.request("shutdown", None)["result"] is None
+    assert client.exit() == 0
+
+
+def test_queries_do_not_wait_for_pending_edits(workspace):
+    client = Client(
+        lambda reader, writer: FLYNCLanguageServer(
+            reader, writer, debounce=600
+        )
+    )
+    switch = next(workspace.rglob("hpc_switch1.flync.yaml"))
+    uri = switch.as_uri()
+    text = switch.read_text()
+    lines = text.splitlines()
+    definition = lines.index("- name: hpc_s1_p0")
+    reference = lines.index("    - hpc_s1_p0")
+
+    client.request("initialize", {"rootUri": workspace.as_uri()})
+    client.notify("initialized", {})
+    client.wait_for_load()
+    client.notify(
+        "textDocument/didChange",
+        {
+            "textDocument": {"uri": uri, "version": 2},
+            "contentChanges": [{"text": text + "\n"}],
+        },
+    )
+    # answered from the last validated workspace, long before the debounce
+    result = client.request(
+        "textDocument/definition",
+        {
+            "textDocument": {"uri": uri},
+            "position": {"line": reference, "character": 8},
+        },
+    )["result"]
+    assert [r["range"]["start"]["line"] for r in result] == [definition]
+    assert client.server._pending
+
+    assert client.request("shutdown", None)["result"] is None
+    assert client.exit() == 0
@@ -0,0 +1,56 @@
+from ruamel.yaml import YAML
+
+from flync.sdk.workspace.document import Document
+from flync.sdk.workspace.source_map import (
+    SourceMap,
+    SourcePosition,
+    index_positions,
+)
+
+TEXT = """\
+name: ecu
+ports:
+  - name: p1
+    speed: 100
+  - name: p2
+"""
+
+
+def test_index_positions_of_keys_and_items():
+    positions = index_positions(YAML().load(TEXT))
+
+    assert positions[()] == (0, 0)
+    assert positions[("ports",)] == (1, 0)
+    assert positions[("ports", 1)] == (4, 4)
+    assert positions[("ports", 0, "speed")] == (3, 4)
+
+
+def test_resolve_skips_unknown_loc_elements():
+    doc = Document("file:///ecu.flync.yaml", TEXT)
+    doc.parse()
+    source_map = SourceMap(lambda uri: doc.positions)
+    source_map.record("ecu", ("ports",), doc.uri, ("ports",))
+    source_map.record("ecu", ("owner",), doc.uri)
+
+    # the union member tag is skipped, a missing key resolves to its parent
+    assert source_map.resolve(
+        "ecu", ("ports", 0, "SwitchPort", "speed")
+    ) == SourcePosition(doc.uri, 4, 5)
+    assert source_map.resolve("ecu", ("ports", 1, "speed")) == (
+        SourcePosition(doc.uri, 5, 5)
+    )
+    assert source_map.resolve("ecu", ("owner", "name")) == SourcePosition(
+        doc.uri, 1, 1
+    )
+    assert source_map.resolve("ecu", ("name",)) is None
+    assert source_map.resolve("other", ("ports",)) is None
+
+
+def test_positions_are_rebuilt_for_new_text():
+    doc = Document("file:///ecu.flync.yaml", TEXT)
+    doc.parse()
+    assert doc.positions[("ports",)] == (1, 0)
+
+    doc.update_text("\n" + TEXT)
+    assert doc.positions[("ports",)] == (2, 0)
+    assert Document("file:///broken.flync.yaml", "name: [").positions == {}
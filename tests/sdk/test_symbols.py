@@ -0,0 +1,109 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+from flync.sdk.workspace.symbols import PrefixTrie
+
+SWITCH = Path(
+    "ecus", "high_processing_core", "switches", "hpc_switch1.flync.yaml"
+)
+
+
+def test_prefix_trie_completes_in_order():
+    trie = PrefixTrie()
+    for name, kind in [
+        ("p10", "port"),
+        ("p1", "port"),
+        ("p1", "iface"),
+        ("p2", "port"),
+        ("q1", "port"),
+    ]:
+        trie.insert(name, kind)
+
+    assert trie.complete("p") == [
+        ("iface", "p1"),
+        ("port", "p1"),
+        ("port", "p10"),
+        ("port", "p2"),
+    ]
+    assert trie.complete("p", kind="iface") == [("iface", "p1")]
+    assert trie.complete("", limit=2) == [("iface", "p1"), ("port", "p1")]
+
+    trie.remove("p10", "port")
+    trie.remove("p1", "port")
+    assert trie.complete("p1") == [("iface", "p1")]
+    trie.remove("p1", "iface")
+    assert trie.complete("p1") == []
+    assert trie._root.keys() == {"p", "q"}
+
+
+@pytest.fixture
+def workspace(get_flync_example_path, tmp_path):
+    path = tmp_path / "workspace"
+    shutil.copytree(get_flync_example_path, path)
+    workspace = FLYNCWorkspace("symbols", path)
+    workspace.load()
+    return workspace
+
+
+def test_definitions_and_references(workspace):
+    symbols = workspace.symbols
+    uri = (workspace.workspace_root / SWITCH).as_uri()
+
+    [definition] = symbols.definitions("switch_port", "hpc_s1_p0")
+    assert definition.definition
+    assert symbols.locate(definition).uri == uri
+    assert symbols.locate(definition).line == 9
+    references = symbols.references("switch_port", "hpc_s1_p0")
+    assert {symbols.locate(r).line for r in references} >= {297, 304, 312}
+    assert all(not r.definition for r in references)
+    assert [s.name for s in symbols.complete("hpc_s1_p", limit=3)] == [
+        "hpc_s1_p0",
+        "hpc_s1_p1",
+        "hpc_s1_p2",
+    ]
+
+    # a reference is found by its position
+    symbol = workspace.symbol_at(uri, 297, 9)
+    assert symbol.kind == "switch_port"
+    assert symbol.name == "hpc_s1_p0"
+    assert not symbol.definition
+    assert workspace.symbol_at(uri, 1, 1) is None
+
+
+def test_edits_update_the_symbols_of_the_edited_object(workspace):
+    symbols = workspace.symbols
+    uri = (workspace.workspace_root / SWITCH).as_uri()
+    before = {oid: symbols.symbols(oid) for oid in workspace.objects}
+
+    text = workspace.documents[uri].text
+    revalidated = workspace.update_documents(
+        {uri: text.replace("- name: hpc_s1_p0\n", "- name: hpc_s1_p9\n")}
+    )
+    assert symbols.definitions("switch_port", "hpc_s1_p0") == []
+    assert symbols.complete("hpc_s1_p9")
+    # the symbols of the other objects are kept as they are
+    untouched = set(before) - revalidated
+    assert untouched
+    assert all(symbols.symbols(oid) == before[oid] for oid in untouched)
+
+
+def test_failing_objects_keep_their_symbols(workspace):
+    symbols = workspace.symbols
+    topology = workspace.workspace_root / "topology"
+    uri = (topology / "system_topology.flync.yaml").as_uri()
+    before = symbols.symbols("topology")
+    assert len(symbols.references("ecu_port", "hpc1_p3")) == 2
+
+    text = workspace.documents[uri].text
+    workspace.update_documents(
+        {uri: text.replace("ecu2_port: z1_p1\n", "ecu2_port: dangling\n")}
+    )
+    assert workspace.objects["topology"] is None
+    # the names are read from the document, not from the invalid model
+    after = symbols.symbols("topology")
+    assert len(after) == len(before)
+    assert symbols.references("ecu_port", "dangling")
+    assert len(symbols.references("ecu_port", "hpc1_p3")) == 2
@@ -0,0 +1,133 @@
+import asyncio
+import shutil
+import time
+
+import pytest
+
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+from flync.sdk.workspace.watcher import WorkspaceWatcher
+
+
+@pytest.fixture
+def workspace(get_flync_example_path, tmp_path):
+    path = tmp_path / "workspace"
+    shutil.copytree(get_flync_example_path, path)
+    workspace = FLYNCWorkspace("watched", path)
+    workspace.load()
+    return workspace
+
+
+def _controller(workspace):
+    return next(workspace.workspace_root.rglob("z1_controller1.flync.yaml"))
+
+
+def test_bursts_are_applied_once_quiet(workspace):
+    watcher = WorkspaceWatcher(workspace, quiet=0.2)
+    changes = []
+    watcher.subscribe(changes.append)
+    controller = _controller(workspace)
+    text = controller.read_text()
+    objects = dict(workspace.objects)
+
+    controller.write_text(text.replace("10.0.10.1\n", "10.0.10.1999\n"))
+    assert watcher.poll() is None
+    time.sleep(0.3)
+    change = watcher.poll()
+    assert changes == [change]
+    assert change.modified == (controller,)
+    assert not change.created and not change.deleted
+    assert any(d.uri == controller.as_uri() for d in change.diagnostics)
+    # only the objects affected by the file were validated again
+    assert any(workspace.objects[oid] is objects[oid] for oid in objects)
+    assert all(
+        workspace.objects[oid] is objects[oid]
+        for oid in set(objects) - change.revalidated
+    )
+    assert watcher.poll() is None
+
+    controller.write_text(text)
+    time.sleep(0.3)
+    assert watcher.poll() is None
+    time.sleep(0.3)
+    assert watcher.poll().diagnostics == []
+
+
+def test_created_and_deleted_files(workspace):
+    watcher = WorkspaceWatcher(workspace, quiet=0)
+    controller = _controller(workspace)
+    object_id = controller.relative_to(workspace.workspace_root).as_posix()
+    text = controller.read_text()
+    assert object_id in workspace.objects
+
+    controller.unlink()
+    change = watcher.poll()
+    assert change.deleted == (controller,)
+    assert object_id in change.revalidated
+    assert object_id not in workspace.objects
+    assert controller.as_uri() not in workspace.documents
+
+    controller.write_text(text)
+    change = watcher.poll()
+    assert change.created == (controller,)
+    assert workspace.objects[object_id] is not None
+    assert change.diagnostics == []
+    assert workspace.flync_model is not None
+
+
+def test_changes_failing_to_apply_are_applied_again(workspace, monkeypatch):
+    watcher = WorkspaceWatcher(workspace, quiet=0)
+    controller = _controller(workspace)
+    apply_file_changes = workspace.apply_file_changes
+
+    def fail(*args):
+        monkeypatch.setattr(
+            workspace, "apply_file_changes", apply_file_changes
+        )
+        raise OSError("busy")
+
+    monkeypatch.setattr(workspace, "apply_file_changes", fail)
+    controller.write_text(controller.read_text() + "\n")
+    with pytest.raises(OSError):
+        watcher.poll()
+    change = watcher.poll()
+    assert change.modified == (controller,)
+    assert watcher.poll() is None
+
+
+def test_watch_pushes_changes_to_async_iterators(workspace):
+    controller = _controller(workspace)
+
+    async def first_change():
+        watcher = workspace.watch(interval=0.05, quiet=0)
+        try:
+            controller.write_text(controller.read_text() + "\n")
+            async for change in watcher:
+                return change
+        finally:
+            watcher.stop()
+
+    change = asyncio.run(asyncio.wait_for(first_change(), 60))
+    assert change.modified == (controller,)
+    assert change.diagnostics == []
+
+
+def test_async_iterators_collect_changes_until_closed(workspace):
+    controller = _controller(workspace)
+    watcher = workspace.watch(interval=0.05, quiet=0)
+
+    async def first_change():
+        changes = aiter(watcher)
+        # applied before the first change is awaited
+        applied = watcher._applied
+        controller.write_text(controller.read_text() + "\n")
+        while watcher._applied is applied:
+            await asyncio.sleep(0.05)
+        try:
+            return await anext(changes)
+        finally:
+            await changes.aclose()
+
+    change = asyncio.run(asyncio.wait_for(first_change(), 60))
+    assert change.modified == (controller,)
+    # closing the iterator stopped the polling
+    assert watcher._thread is None